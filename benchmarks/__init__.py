@@ -0,0 +1,3 @@
+"""
+Scripturi de măsurare a performanței (rulare: python -m benchmarks.<script>)
+"""
@@ -0,0 +1,127 @@
+"""
+Memoria și timpul de construcție ale certificatelor: dataclass (vechi) vs.
+reprezentarea compactă (__slots__, coduri, date ordinale)
+
+Rulare: python -m benchmarks.bench_certificate [înregistrări]
+"""
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate import (Certificate, GRAD_CODES, GRADE_MILITARE, NIVEL_CODES,
+                                NIVELURI_CERTIFICATE)
+from models.columnar import ordinal_column, shared_int_list
+
+
+@dataclass
+class LegacyCertificate:
+    """Reprezentarea anterioară: dataclass cu __dict__, text și obiecte date"""
+    grad: str
+    nume: str
+    prenume: str
+    data_nasterii: date
+    serie_certificat: str
+    numar_certificat: str
+    nivel_certificat: str
+    data_eliberare: date
+    data_expirare: date
+    observatii: Optional[str] = ""
+    id: Optional[int] = None
+
+    def __post_init__(self):
+        """Validarea anterioară (căutare liniară în nomenclatoare)"""
+        if self.grad not in GRADE_MILITARE:
+            raise ValueError(f"Grad invalid: {self.grad}")
+        if self.nivel_certificat not in NIVELURI_CERTIFICATE:
+            raise ValueError(f"Nivel certificat invalid: {self.nivel_certificat}")
+        for value in (self.data_nasterii, self.data_eliberare, self.data_expirare):
+            if not isinstance(value, date):
+                raise ValueError("Data trebuie să fie de tip date")
+        if self.data_expirare <= self.data_eliberare:
+            raise ValueError("Data expirare trebuie să fie după data eliberare")
+
+
+def measure(build):
+    """
+    Construiește lista de obiecte și măsoară timpul și memoria reținută
+
+    Returns:
+        Tuple (secunde, MB reținuți de listă și de obiectele create)
+    """
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del objects
+    return elapsed, retained / (1024 * 1024)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    df = make_certificates_df(rows)
+
+    # Coloanele deja validate și tipizate, ca în parse_certificates
+    text = {column: df[column].astype(str) for column in
+            ('Grad', 'Nume', 'Prenume', 'Serie certificat', 'Număr certificat',
+             'Nivel certificat', 'Observații')}
+    dates = {column: pd.to_datetime(df[column], format='%d.%m.%Y') for column in
+             ('Data nașterii', 'Data eliberare', 'Data expirare')}
+
+    def text_columns():
+        return {column: values.tolist() for column, values in text.items()}
+
+    def legacy():
+        t = text_columns()
+        d = {column: values.dt.date.tolist() for column, values in dates.items()}
+        return [LegacyCertificate(*values) for values in zip(
+            t['Grad'], t['Nume'], t['Prenume'], d['Data nașterii'], t['Serie certificat'],
+            t['Număr certificat'], t['Nivel certificat'], d['Data eliberare'],
+            d['Data expirare'], t['Observații'])]
+
+    def slots_validated():
+        t = text_columns()
+        d = {column: values.dt.date.tolist() for column, values in dates.items()}
+        return [Certificate(*values) for values in zip(
+            t['Grad'], t['Nume'], t['Prenume'], d['Data nașterii'], t['Serie certificat'],
+            t['Număr certificat'], t['Nivel certificat'], d['Data eliberare'],
+            d['Data expirare'], t['Observații'])]
+
+    def slots_codes():
+        t = text_columns()
+        d = {column: shared_int_list(ordinal_column(values))
+             for column, values in dates.items()}
+        grade = text['Grad'].map(GRAD_CODES).tolist()
+        niveluri = text['Nivel certificat'].map(NIVEL_CODES).tolist()
+        return [Certificate.from_codes(*values) for values in zip(
+            grade, t['Nume'], t['Prenume'], d['Data nașterii'], t['Serie certificat'],
+            t['Număr certificat'], niveluri, d['Data eliberare'],
+            d['Data expirare'], t['Observații'])]
+
+    results = [
+        ("dataclass (vechi)", legacy),
+        ("slots, validat", slots_validated),
+        ("slots, from_codes", slots_codes),
+    ]
+
+    print(f"Înregistrări: {rows}")
+    for name, build in results:
+        elapsed, retained = measure(build)
+        print(f"{name:20s} {elapsed * 1000:8.1f} ms   {retained:7.1f} MB   "
+              f"{retained * 1024 * 1024 / rows:6.0f} B/înregistrare")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Sortarea numelor: locale.strxfrm la fiecare comparație (naiv) vs. cheile de
+colaționare românească precalculate (utils.collation)
+
+Rulare: python -m benchmarks.bench_collation [rânduri]
+"""
+import locale
+import sys
+import time
+from functools import cmp_to_key
+
+import numpy as np
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate_store import CertificateStore
+from utils.collation import collation_key
+
+
+ROMANIAN_LOCALES = ('ro_RO.UTF-8', 'ro_RO.utf8', 'Romanian_Romania.1250')
+
+# Nume în ordinea alfabetului românesc (Ă după A, Î după I, Ș după S, Ț după T)
+EXPECTED_ORDER = ['Anghel', 'Ănescu', 'Bogdan', 'Ionescu', 'Îndrieș', 'Jitaru',
+                  'Stoica', 'Șerban', 'Ştefan', 'Tudor', 'Țurcanu', 'Ursu']
+
+
+def set_collation_locale() -> str:
+    """Setează LC_COLLATE pe limba română, dacă este instalată"""
+    for name in ROMANIAN_LOCALES:
+        try:
+            return locale.setlocale(locale.LC_COLLATE, name)
+        except locale.Error:
+            pass
+    return locale.setlocale(locale.LC_COLLATE, '') + ' (fără limba română instalată)'
+
+
+def naive_compare(first: str, second: str) -> int:
+    """Comparație cu strxfrm calculat din nou la fiecare apel"""
+    first, second = locale.strxfrm(first), locale.strxfrm(second)
+    return (first > second) - (first < second)
+
+
+def timed(function):
+    """Rulează funcția și întoarce (rezultat, secunde)"""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def is_romanian(sort) -> bool:
+    """Verifică dacă o funcție de sortare ordonează corect EXPECTED_ORDER"""
+    return sort(list(reversed(EXPECTED_ORDER))) == EXPECTED_ORDER
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    collation_locale = set_collation_locale()
+    store, _ = CertificateStore.from_dataframe(make_certificates_df(rows))
+    names = store.columns['nume'].tolist()
+
+    naive_sort = lambda values: sorted(values, key=cmp_to_key(naive_compare))
+    _, naive_time = timed(lambda: naive_sort(names))
+    _, strxfrm_time = timed(lambda: sorted(names, key=locale.strxfrm))
+    _, codepoint_time = timed(lambda: sorted(names))
+    _, keys_time = timed(lambda: store.collation_keys('nume'))
+    _, ranks_time = timed(lambda: store.sort_keys('nume'))
+    _, sort_time = timed(lambda: np.argsort(store.sort_keys('nume'), kind='stable'))
+
+    print(f"Rânduri: {rows}, LC_COLLATE: {collation_locale}")
+    print(f"strxfrm la fiecare comparație:  {naive_time * 1000:8.1f} ms  "
+          f"ordine românească: {is_romanian(naive_sort)}")
+    print(f"strxfrm ca cheie (o dată/rând): {strxfrm_time * 1000:8.1f} ms  "
+          f"ordine românească: {is_romanian(lambda values: sorted(values, key=locale.strxfrm))}")
+    print(f"puncte de cod (sorted):         {codepoint_time * 1000:8.1f} ms  "
+          f"ordine românească: {is_romanian(sorted)}")
+    print(f"chei de colaționare:            {sort_time * 1000:8.1f} ms  "
+          f"ordine românească: {is_romanian(lambda values: sorted(values, key=collation_key))}")
+    print(f"  (precalculate o dată: chei {keys_time * 1000:.1f} ms, ranguri {ranks_time * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    main()
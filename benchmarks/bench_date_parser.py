@@ -0,0 +1,84 @@
+"""
+Costul parsării datelor: strptime (vechi) vs. parserul memorat (utils.date_parser)
+
+Rulare: python -m benchmarks.bench_date_parser [rânduri]
+"""
+import sys
+import time
+from datetime import date, datetime
+
+import pandas as pd
+
+from benchmarks.synthetic import make_certificates_df
+from models.columnar import parse_date_column
+from utils.date_parser import _parse_text, cache_info, parse_date
+
+
+DATE_COLUMNS = ('Data nașterii', 'Data eliberare', 'Data expirare')
+
+
+def legacy_parse_date(date_value):
+    """Parsarea anterioară din Certificate.from_dict (strptime, două formate)"""
+    if date_value is None or (isinstance(date_value, float) and pd.isna(date_value)):
+        raise ValueError("Data lipsă sau invalidă")
+    if isinstance(date_value, date):
+        return date_value
+    if isinstance(date_value, str):
+        date_value = date_value.strip()
+        try:
+            return datetime.strptime(date_value, '%d.%m.%Y').date()
+        except ValueError:
+            pass
+        try:
+            return datetime.strptime(date_value, '%Y-%m-%d').date()
+        except ValueError:
+            pass
+    raise ValueError(f"Format dată invalid: {date_value}")
+
+
+def legacy_parse_date_column(values: pd.Series) -> pd.Series:
+    """Parsarea anterioară pe coloane (pd.to_datetime cu ambele formate)"""
+    dotted = pd.to_datetime(values, format='%d.%m.%Y', errors='coerce')
+    iso = pd.to_datetime(values, format='%Y-%m-%d', errors='coerce')
+    return dotted.fillna(iso)
+
+
+def per_row_ns(parse, values: list) -> float:
+    """Returnează costul mediu (ns) al parsării unei valori"""
+    start = time.perf_counter()
+    for value in values:
+        parse(value)
+    return (time.perf_counter() - start) / len(values) * 1e9
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    df = make_certificates_df(rows)
+    values = [value for column in DATE_COLUMNS for value in df[column].tolist()]
+    distinct = len(set(values))
+
+    legacy = per_row_ns(legacy_parse_date, values)
+    _parse_text.cache_clear()
+    cold = per_row_ns(parse_date, values)
+    warm = per_row_ns(parse_date, values)
+    info = cache_info()
+
+    start = time.perf_counter()
+    for column in DATE_COLUMNS:
+        legacy_parse_date_column(df[column])
+    legacy_columns = time.perf_counter() - start
+    start = time.perf_counter()
+    for column in DATE_COLUMNS:
+        parse_date_column(df[column])
+    new_columns = time.perf_counter() - start
+
+    print(f"Valori: {len(values)} ({distinct} distincte), memorie parser {info.currsize}/{info.maxsize}")
+    print(f"strptime (vechi):       {legacy:8.0f} ns/valoare")
+    print(f"parser, prima trecere:  {cold:8.0f} ns/valoare")
+    print(f"parser, memorat:        {warm:8.0f} ns/valoare")
+    print(f"Coloane: pd.to_datetime {legacy_columns * 1000:7.1f} ms, "
+          f"parse_date_column {new_columns * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Debitul exportului Excel: ExcelWriter (mod normal) vs. export în flux
+
+Rulare: python -m benchmarks.bench_export [rânduri]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import make_certificates_df
+from models.exporter import StreamingExcelExporter, benchmark_export
+
+
+def legacy_export(df: pd.DataFrame, file_path: Path):
+    """Exportul anterior: registru în memorie + lățimi calculate celulă cu celulă"""
+    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Certificate')
+        worksheet = writer.sheets['Certificate']
+        for idx, col in enumerate(df.columns):
+            max_length = max(df[col].astype(str).apply(len).max(), len(col))
+            worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+
+
+def peak_memory_mb(fn) -> float:
+    """Returnează vârful de memorie alocată (MB) în timpul apelului"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    df = make_certificates_df(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / 'legacy.xlsx'
+        streaming_path = Path(tmp) / 'streaming.xlsx'
+
+        start = time.perf_counter()
+        legacy_export(df, legacy_path)
+        legacy_rate = rows / (time.perf_counter() - start)
+        streaming_rate = benchmark_export(df, streaming_path, repeat=1)
+
+        legacy_peak = peak_memory_mb(lambda: legacy_export(df, legacy_path))
+        streaming_peak = peak_memory_mb(lambda: StreamingExcelExporter(df).write(streaming_path))
+
+    print(f"Rânduri: {rows}")
+    print(f"ExcelWriter:     {legacy_rate:10.0f} rânduri/s, vârf memorie {legacy_peak:7.1f} MB")
+    print(f"Export în flux:  {streaming_rate:10.0f} rânduri/s, vârf memorie {streaming_peak:7.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
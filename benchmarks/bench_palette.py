@@ -0,0 +1,110 @@
+"""
+Alocările la desenarea tabelelor: pensule/fonturi create pe celulă (vechi) vs.
+paleta comună și prototipurile de celule (views.palette)
+
+Rulare: python -m benchmarks.bench_palette [rânduri]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor
+from PyQt6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate import COLUMN_NAMES, STATUS_COLORS
+from models.certificate_store import CertificateStore
+from views.alert_dialog import STATUS_LABELS
+from views.palette import EXPIRY_CELL_COLORS, shared_palette
+from views.table_model import CertificateTableModel
+
+
+ALERT_COLUMNS = 9
+
+
+def measure(run):
+    """
+    Rulează funcția o dată pentru timp și o dată sub tracemalloc
+
+    Returns:
+        Tuple (secunde, blocuri Python reținute de rezultat, KB alocați la vârf)
+    """
+    start = time.perf_counter()
+    kept = run()
+    elapsed = time.perf_counter() - start
+    del kept
+    tracemalloc.start()
+    try:
+        kept = run()
+        _, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    del kept
+    return elapsed, blocks, peak / 1024
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841 (necesară widgeturilor)
+    store, _ = CertificateStore.from_dataframe(make_certificates_df(rows))
+    status = store.expiry().status.tolist()
+    expiry_column = COLUMN_NAMES.index('Data expirare')
+
+    model = CertificateTableModel()
+    model.set_store(store)
+    indexes = [[model.index(row, column) for column in range(len(COLUMN_NAMES))]
+               for row in range(rows)]
+
+    # Trecere de desenare: fundalul fiecărei celule, reținut ca de delegat
+    def legacy_background():
+        return [QBrush(QColor(*EXPIRY_CELL_COLORS[status[row]]))
+                if column == expiry_column else QBrush(QColor(255, 255, 255))
+                for row in range(rows) for column in range(len(COLUMN_NAMES))]
+
+    def palette_background():
+        background = Qt.ItemDataRole.BackgroundRole
+        return [model.data(index, background) for row in indexes for index in row]
+
+    # Populare tabel de alertă: un QColor și un QFont îngroșat pe rând (vechi)
+    def legacy_alert():
+        table = QTableWidget(0, ALERT_COLUMNS)
+        for row in range(rows):
+            table.insertRow(row)
+            bg_color = QColor(STATUS_COLORS[status[row] % 3])
+            for col in range(ALERT_COLUMNS):
+                item = QTableWidgetItem(str(col))
+                item.setBackground(bg_color)
+                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                if col == 0:
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                table.setItem(row, col, item)
+        return table
+
+    def palette_alert():
+        palette = shared_palette()
+        table = QTableWidget(rows, ALERT_COLUMNS)
+        for row in range(rows):
+            for col in range(ALERT_COLUMNS):
+                table.setItem(row, col, palette.status_item(status[row] % 3, str(col),
+                                                            bold=col == 0))
+        return table
+
+    print(f"Rânduri: {rows} ({len(STATUS_LABELS)} statusuri în alertă)")
+    print(f"{'':32}{'timp':>10}{'blocuri reținute':>18}{'vârf':>12}")
+    for name, run in (("fundal pe celulă (vechi)", legacy_background),
+                      ("fundal din paletă", palette_background),
+                      ("tabel alertă (vechi)", legacy_alert),
+                      ("tabel alertă cu prototipuri", palette_alert)):
+        elapsed, blocks, peak = measure(run)
+        print(f"{name:32}{elapsed * 1000:8.1f} ms{blocks:18}{peak:9.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
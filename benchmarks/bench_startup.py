@@ -0,0 +1,92 @@
+"""
+Timpul până la prima afișare: încărcare sincronă înainte de fereastră (vechi)
+vs. fereastră afișată imediat și date încărcate pe bucăți în fundal
+
+Rulare: python -m benchmarks.bench_startup [rânduri]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QEventLoop
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.synthetic import make_certificates_df
+from models.data_manager import DataManager
+from models.exporter import StreamingExcelExporter
+from views.main_window import MainWindow
+
+
+def wait_for(condition, timeout_s: float = 120):
+    """Rulează bucla de evenimente până când condiția este îndeplinită"""
+    deadline = time.perf_counter() + timeout_s
+    while not condition() and time.perf_counter() < deadline:
+        QApplication.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+
+
+def synchronous(file_path: Path) -> dict:
+    """Pornirea anterioară: registrul citit complet, apoi fereastra"""
+    started = time.perf_counter()
+    data_manager = DataManager(str(file_path), journal_mode=True)
+    window = MainWindow(data_manager, started=started)
+    window.show()
+    wait_for(lambda: 'first_paint' in window.load_timings)
+    timings = {'first_paint': window.load_timings['first_paint'],
+               'first_rows': window.load_timings['first_paint'],
+               'total': window.load_timings['first_paint']}
+    window.shutdown()
+    return timings
+
+
+def asynchronous(file_path: Path) -> dict:
+    """Pornirea nouă: fereastra afișată imediat, datele citite pe bucăți"""
+    started = time.perf_counter()
+    data_manager = DataManager(str(file_path), journal_mode=True, load=False)
+    window = MainWindow(data_manager, started=started)
+    window.show()
+    wait_for(lambda: 'total' in window.load_timings)
+    timings = dict(window.load_timings)
+    window.shutdown()
+    return timings
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841 (necesară widgeturilor)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Configurația ferestrei este scrisă în directorul temporar
+        os.environ['HOME'] = tmp
+        source = Path(tmp) / "registru.xlsx"
+        StreamingExcelExporter(make_certificates_df(rows)).write(source)
+
+        def fresh_copy(name: str) -> Path:
+            """Copie a registrului, fără cache-ul parsat"""
+            target = Path(tmp) / name / source.name
+            target.parent.mkdir()
+            target.write_bytes(source.read_bytes())
+            return target
+
+        results = [
+            ("sincron (vechi)", synchronous(fresh_copy('sincron'))),
+            ("fundal, fără cache", asynchronous(fresh_copy('fundal'))),
+        ]
+        # A doua pornire citește cache-ul parsat, reconstruit în fundal la prima
+        cached = fresh_copy('cache')
+        asynchronous(cached)
+        time.sleep(2)
+        results.append(("fundal, cu cache", asynchronous(cached)))
+
+    print(f"Rânduri: {rows} (ms de la pornire)")
+    print(f"{'':22}{'prima afișare':>15}{'primele rânduri':>17}{'complet':>10}")
+    for name, timings in results:
+        print(f"{name:22}{timings['first_paint']:15.0f}{timings['first_rows']:17.0f}"
+              f"{timings['total']:10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Generator de date sintetice pentru măsurători
+"""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+
+from models.certificate import GRADE_MILITARE, NIVELURI_CERTIFICATE
+from models.storage import DATA_COLUMNS
+
+
+NUME = ['Popescu', 'Ionescu', 'Popa', 'Dumitru', 'Stoica', 'Stan', 'Gheorghe',
+        'Rusu', 'Munteanu', 'Matei', 'Constantin', 'Șerban', 'Țurcanu', 'Ștefănescu']
+PRENUME = ['Andrei', 'Ion', 'Maria', 'Elena', 'Mihai', 'Ana', 'Alexandru',
+           'Ioana', 'Cristian', 'Gabriela', 'Ștefan', 'Răzvan', 'Bogdan', 'Irina']
+
+
+def make_certificates_df(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generează un tabel de certificate în formatul registrului Excel
+
+    Args:
+        rows: Numărul de rânduri
+        seed: Sămânța generatorului aleator (rezultate reproductibile)
+
+    Returns:
+        DataFrame cu coloanele de date (fără Nr.), datele ca text DD.MM.YYYY
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    records = []
+    for idx in range(rows):
+        eliberare = today - timedelta(days=rng.randint(0, 5 * 365))
+        expirare = eliberare + timedelta(days=rng.randint(30, 5 * 365))
+        nasterii = date(rng.randint(1960, 2003), rng.randint(1, 12), rng.randint(1, 28))
+        records.append([
+            rng.choice(GRADE_MILITARE),
+            rng.choice(NUME),
+            rng.choice(PRENUME),
+            nasterii.strftime('%d.%m.%Y'),
+            f"{rng.choice('ABCDEFGH')}{rng.choice('ABCDEFGH')}",
+            str(100000 + idx),
+            rng.choice(NIVELURI_CERTIFICATE),
+            eliberare.strftime('%d.%m.%Y'),
+            expirare.strftime('%d.%m.%Y'),
+            rng.choice(['', '', '', 'Reînnoire în curs', 'Transferat']),
+        ])
+    return pd.DataFrame(records, columns=DATA_COLUMNS)
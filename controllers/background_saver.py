@@ -0,0 +1,112 @@
+"""
+Salvare write-behind a datelor pe un fir de execuție separat
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class BackgroundSaver(QThread):
+    """
+    Fir de execuție care scrie instantaneele datelor în fundal
+
+    Salvările cerute în succesiune rapidă sunt comasate: se scrie doar cel mai
+    recent instantaneu, după ce nu mai apar cereri noi timp de COALESCE_DELAY_MS.
+    """
+
+    # Semnale (emise din firul de salvare, livrate în firul GUI)
+    save_started = pyqtSignal(int)     # numărul de cereri comasate
+    save_finished = pyqtSignal(int)    # numărul de cereri comasate
+    save_failed = pyqtSignal(str)      # mesajul de eroare
+
+    # Fereastra de comasare a cererilor de salvare
+    COALESCE_DELAY_MS = 500
+
+    def __init__(self, parent=None):
+        """
+        Inițializează firul de salvare
+
+        Args:
+            parent: Obiect părinte Qt
+        """
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._pending: Optional[Callable[[], None]] = None
+        self._pending_count = 0
+        self._last_request = 0.0
+        self._busy = False
+        self._flush_requested = False
+        self._stopping = False
+
+    def schedule(self, write_fn: Callable[[], None]):
+        """
+        Programează o salvare; înlocuiește salvarea pendinte nescrisă încă
+
+        Args:
+            write_fn: Funcția care scrie instantaneul pe disc
+        """
+        with self._cond:
+            self._pending = write_fn
+            self._pending_count += 1
+            self._last_request = time.monotonic()
+            self._cond.notify_all()
+
+    def flush(self):
+        """Scrie imediat salvarea pendinte și așteaptă finalizarea ei"""
+        if not self.isRunning():
+            # Firul nu rulează (încă sau deloc) - scrie sincron
+            with self._cond:
+                write_fn, self._pending = self._pending, None
+                self._pending_count = 0
+            if write_fn is not None:
+                write_fn()
+            return
+
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending is not None or self._busy:
+                self._cond.wait()
+            self._flush_requested = False
+
+    def stop(self):
+        """Scrie salvările pendinte și oprește firul de execuție"""
+        self.flush()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self.wait()
+
+    def run(self):
+        """Bucla firului de salvare"""
+        delay = self.COALESCE_DELAY_MS / 1000
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+
+                # Așteaptă liniștea: cererile noi amână scrierea
+                while not self._flush_requested and not self._stopping:
+                    remaining = self._last_request + delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                write_fn, self._pending = self._pending, None
+                count, self._pending_count = self._pending_count, 0
+                self._busy = True
+
+            self.save_started.emit(count)
+            try:
+                write_fn()
+                self.save_finished.emit(count)
+            except Exception as e:
+                self.save_failed.emit(str(e))
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -0,0 +1,72 @@
+"""
+Încărcarea datelor pe un fir de execuție separat, pe bucăți
+"""
+import threading
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from models.data_manager import DataManager
+from models.storage import concat_chunks
+
+
+class DataLoader(QThread):
+    """
+    Fir de execuție care citește și convertește sursa de date pe bucăți
+
+    Fiecare bucată convertită (coloane tipizate și erori) este trimisă
+    firului GUI imediat, astfel încât tabelul se populează pe măsură ce
+    fișierul este citit. La final este trimis tabelul complet, de preluat cu
+    DataManager.finish_load. Încărcarea poate fi anulată între două bucăți.
+    După ultima bucată trimisă este emis un singur semnal final:
+    load_finished, load_cancelled sau load_failed.
+    """
+
+    # Semnale (emise din firul de încărcare, livrate în firul GUI)
+    chunk_loaded = pyqtSignal(object, object)   # coloanele tipizate, erorile bucății
+    load_finished = pyqtSignal(object)          # tabelul complet (None = sursă nouă)
+    load_failed = pyqtSignal(str)               # mesajul de eroare
+    load_cancelled = pyqtSignal()
+
+    def __init__(self, data_manager: DataManager,
+                 chunk_size: int = DataManager.LOAD_CHUNK_SIZE, parent=None):
+        """
+        Inițializează firul de încărcare
+
+        Args:
+            data_manager: Managerul de date, creat cu load=False
+            chunk_size: Numărul maxim de rânduri pe bucată
+            parent: Obiect părinte Qt
+        """
+        super().__init__(parent)
+        self._data_manager = data_manager
+        self._chunk_size = chunk_size
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Oprește încărcarea după bucata curentă"""
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """Verifică dacă încărcarea a fost anulată"""
+        return self._cancelled.is_set()
+
+    def run(self):
+        """Citește bucățile și le trimite firului GUI"""
+        chunks = []
+        reader = self._data_manager.iter_load_chunks(self._chunk_size)
+        try:
+            for chunk, columns, errors in reader:
+                # Anularea este verificată doar între bucăți
+                if self._cancelled.is_set():
+                    self.load_cancelled.emit()
+                    return
+                chunks.append(chunk)
+                self.chunk_loaded.emit(columns, errors)
+            # Toate bucățile au fost citite: o anulare cerută după ultima nu mai
+            # are efect, tabelul are deja toate rândurile
+            self.load_finished.emit(concat_chunks(chunks) if chunks else None)
+        except Exception as e:
+            self.load_failed.emit(str(e))
+        finally:
+            # Închide registrul deschis în flux, dacă încărcarea a fost întreruptă
+            reader.close()
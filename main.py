@@ -4,6 +4,7 @@ Manager Certificate Securitate
 Aplicație pentru gestionarea certificatelor de securitate militare
 """
 import sys
+import time
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
 from PyQt6.QtCore import Qt
@@ -14,6 +15,10 @@ from views.alert_dialog import AlertDialog
 from utils.config_manager import ConfigManager
 
 
+# Filtru pentru dialogurile de selectare a fișierului de date
+DATA_FILE_FILTER = "Excel Files (*.xlsx);;SQLite Database (*.db *.sqlite)"
+
+
 def get_app_directory() -> Path:
     """
     Returnează directorul unde rulează aplicația (executabil sau script)
@@ -45,7 +50,7 @@ def select_data_file(parent=None) -> str:
     
     msg = QMessageBox(parent)
     msg.setWindowTitle("Selectare Fișier Date")
-    msg.setText("Selectați fișierul Excel pentru stocarea datelor.")
+    msg.setText("Selectați fișierul Excel sau baza de date SQLite pentru stocarea datelor.")
     msg.setInformativeText("Puteți selecta un fișier existent sau crea unul nou.")
     msg.setIcon(QMessageBox.Icon.Information)
     
@@ -65,7 +70,7 @@ def select_data_file(parent=None) -> str:
             parent,
             "Creați fișierul de date",
             str(default_file),
-            "Excel Files (*.xlsx)"
+            DATA_FILE_FILTER
         )
         return file_path
     else:
@@ -74,13 +79,16 @@ def select_data_file(parent=None) -> str:
             parent,
             "Selectați fișierul de date",
             str(app_dir),
-            "Excel Files (*.xlsx)"
+            DATA_FILE_FILTER
         )
         return file_path
 
 
 def main():
     """Funcția principală a aplicației"""
+    # Momentul pornirii (pentru timpul până la prima afișare)
+    started = time.perf_counter()
+    
     # Creează aplicația Qt
     app = QApplication(sys.argv)
     app.setApplicationName("Manager Certificate Securitate")
@@ -160,8 +168,9 @@ def main():
     
     while attempt < max_attempts and data_manager is None:
         try:
-            # Inițializează managerul de date
-            data_manager = DataManager(data_file_path)
+            # Inițializează managerul de date; datele sunt citite de fereastra
+            # principală pe un fir de fundal, după afișarea ei
+            data_manager = DataManager(data_file_path, journal_mode=True, load=False)
             break  # Succes, ieșim din buclă
             
         except Exception as e:
@@ -209,7 +218,7 @@ def main():
     
     try:
         # Creează și afișează fereastra principală
-        window = MainWindow(data_manager)
+        window = MainWindow(data_manager, config_manager, started)
         
         # Setează icon aplicație
         import os
@@ -234,12 +243,16 @@ def main():
         
         window.show()
         
-        # Verifică și afișează alerte pentru certificate care expiră
-        try:
-            certificates = data_manager.get_all_certificates()
-            AlertDialog.check_and_show_alerts(certificates, window)
-        except Exception as e:
-            print(f"Eroare la verificarea alertelor: {e}")
+        # Verifică și afișează alerte pentru certificate care expiră, după încărcare
+        def show_alerts():
+            window.loading_finished.disconnect(show_alerts)
+            try:
+                # Stocarea este deja construită pentru tabel; alertele o reutilizează
+                AlertDialog.check_store_and_show_alerts(data_manager.get_store(), window)
+            except Exception as e:
+                print(f"Eroare la verificarea alertelor: {e}")
+        
+        window.loading_finished.connect(show_alerts)
         
         # Salvează geometria la închidere
         def save_geometry():
@@ -253,6 +266,9 @@ def main():
         
         app.aboutToQuit.connect(save_geometry)
         
+        # Scrie toate modificările pendinte în registru la închidere
+        app.aboutToQuit.connect(window.shutdown)
+        
         # Rulează aplicația
         sys.exit(app.exec())
         
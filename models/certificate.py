@@ -1,7 +1,6 @@
 """
 Model de date pentru certificatele de securitate
 """
-from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
@@ -59,92 +58,227 @@ GRADE_MILITARE = [
 NIVELURI_CERTIFICATE = ["SSv", "S", "SS", "SSID"]
 
 
-@dataclass
-class Certificate:
-    """Clasa pentru reprezentarea unui certificat de securitate"""
-    grad: str
-    nume: str
-    prenume: str
-    data_nasterii: date
-    serie_certificat: str
-    numar_certificat: str
-    nivel_certificat: str
-    data_eliberare: date
-    data_expirare: date
-    observatii: Optional[str] = ""
-    
-    def __post_init__(self):
-        """Validare date după inițializare"""
-        if self.grad not in GRADE_MILITARE:
-            raise ValueError(f"Grad invalid: {self.grad}")
-        
-        if self.nivel_certificat not in NIVELURI_CERTIFICATE:
-            raise ValueError(f"Nivel certificat invalid: {self.nivel_certificat}")
+# Codurile numerice ale nomenclatoarelor (valoare -> poziție în listă)
+GRAD_CODES = {grad: code for code, grad in enumerate(GRADE_MILITARE)}
+NIVEL_CODES = {nivel: code for code, nivel in enumerate(NIVELURI_CERTIFICATE)}
+
+# Statusurile de expirare, în ordinea priorității
+STATUS_EXPIRAT, STATUS_URGENT, STATUS_ATENTIE, STATUS_VALID = range(4)
+# Limitele superioare (în zile rămase) pentru URGENT (1 lună) și ATENȚIE (3 luni)
+ZILE_URGENT = 30
+ZILE_ATENTIE = 90
+# Culoarea fiecărui status (indexată după STATUS_*)
+STATUS_COLORS = ("#8B0000", "#FFB6C1", "#FFFF99", "#FFFFFF")
+
+
+def expiry_status(zile: int) -> int:
+    """
+    Returnează statusul de expirare (STATUS_*) pentru zilele rămase
+    
+    Args:
+        zile: Zilele rămase până la expirare (negativ pentru expirate)
         
-        if not isinstance(self.data_nasterii, date):
-            raise ValueError("Data nașterii trebuie să fie de tip date")
+    Returns:
+        Unul dintre STATUS_EXPIRAT, STATUS_URGENT, STATUS_ATENTIE, STATUS_VALID
+    """
+    if zile < 0:
+        return STATUS_EXPIRAT
+    elif zile <= ZILE_URGENT:
+        return STATUS_URGENT
+    elif zile <= ZILE_ATENTIE:
+        return STATUS_ATENTIE
+    return STATUS_VALID
+
+
+def _format_ordinal(ordinal: int) -> str:
+    """Formatează o dată ordinală ca DD.MM.YYYY"""
+    value = date.fromordinal(ordinal)
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
+class Certificate:
+    """
+    Clasa pentru reprezentarea unui certificat de securitate
+    
+    Reprezentare compactă: fără __dict__ (__slots__), gradul și nivelul sunt
+    păstrate ca poziții în GRADE_MILITARE / NIVELURI_CERTIFICATE, iar datele
+    ca numere ordinale. Atributele publice (grad, data_expirare etc.) rămân
+    aceleași, ca proprietăți.
+    """
+    
+    __slots__ = ('_grad', 'nume', 'prenume', '_data_nasterii', 'serie_certificat',
+                 'numar_certificat', '_nivel', '_data_eliberare', '_data_expirare',
+                 'observatii', 'id')
+    
+    # Câmpurile publice, în ordinea constructorului
+    FIELDS = ('grad', 'nume', 'prenume', 'data_nasterii', 'serie_certificat',
+              'numar_certificat', 'nivel_certificat', 'data_eliberare', 'data_expirare',
+              'observatii', 'id')
+    
+    def __init__(self, grad: str, nume: str, prenume: str, data_nasterii: date,
+                 serie_certificat: str, numar_certificat: str, nivel_certificat: str,
+                 data_eliberare: date, data_expirare: date, observatii: Optional[str] = "",
+                 id: Optional[int] = None):
+        """Creează și validează un certificat"""
+        self.grad = grad
+        self.nivel_certificat = nivel_certificat
+        self.nume = nume
+        self.prenume = prenume
+        self.serie_certificat = serie_certificat
+        self.numar_certificat = numar_certificat
+        self.data_nasterii = data_nasterii
+        self.data_eliberare = data_eliberare
+        self.data_expirare = data_expirare
+        self.observatii = observatii
+        # Identificator stabil, atribuit de DataManager (None până la salvare)
+        self.id = id
         
-        if not isinstance(self.data_eliberare, date):
-            raise ValueError("Data eliberare trebuie să fie de tip date")
+        if self._data_expirare <= self._data_eliberare:
+            raise ValueError("Data expirare trebuie să fie după data eliberare")
+    
+    @classmethod
+    def from_codes(cls, grad_code: int, nume: str, prenume: str, data_nasterii: int,
+                   serie_certificat: str, numar_certificat: str, nivel_code: int,
+                   data_eliberare: int, data_expirare: int, observatii: Optional[str] = "",
+                   id: Optional[int] = None) -> 'Certificate':
+        """
+        Creează un certificat din valori deja validate (coduri și date ordinale),
+        fără validare suplimentară - folosit la conversia pe coloane
         
-        if not isinstance(self.data_expirare, date):
-            raise ValueError("Data expirare trebuie să fie de tip date")
+        Returns:
+            Obiect Certificate
+        """
+        certificate = cls.__new__(cls)
+        certificate._grad = grad_code
+        certificate.nume = nume
+        certificate.prenume = prenume
+        certificate._data_nasterii = data_nasterii
+        certificate.serie_certificat = serie_certificat
+        certificate.numar_certificat = numar_certificat
+        certificate._nivel = nivel_code
+        certificate._data_eliberare = data_eliberare
+        certificate._data_expirare = data_expirare
+        certificate.observatii = observatii
+        certificate.id = id
+        return certificate
+    
+    @property
+    def grad(self) -> str:
+        """Gradul militar (abrevierea oficială)"""
+        return GRADE_MILITARE[self._grad]
+    
+    @grad.setter
+    def grad(self, value: str):
+        """Setează și validează valoarea"""
+        code = GRAD_CODES.get(value)
+        if code is None:
+            raise ValueError(f"Grad invalid: {value}")
+        self._grad = code
+    
+    @property
+    def nivel_certificat(self) -> str:
+        """Nivelul certificatului"""
+        return NIVELURI_CERTIFICATE[self._nivel]
+    
+    @nivel_certificat.setter
+    def nivel_certificat(self, value: str):
+        """Setează și validează valoarea"""
+        code = NIVEL_CODES.get(value)
+        if code is None:
+            raise ValueError(f"Nivel certificat invalid: {value}")
+        self._nivel = code
+    
+    @staticmethod
+    def _ordinal(value, label: str) -> int:
+        """Validează o dată și o convertește în număr ordinal"""
+        if not isinstance(value, date):
+            raise ValueError(f"{label} trebuie să fie de tip date")
+        return value.toordinal()
+    
+    @property
+    def data_nasterii(self) -> date:
+        """Data nașterii"""
+        return date.fromordinal(self._data_nasterii)
+    
+    @data_nasterii.setter
+    def data_nasterii(self, value: date):
+        """Setează și validează valoarea"""
+        self._data_nasterii = self._ordinal(value, "Data nașterii")
+    
+    @property
+    def data_eliberare(self) -> date:
+        """Data eliberării certificatului"""
+        return date.fromordinal(self._data_eliberare)
+    
+    @data_eliberare.setter
+    def data_eliberare(self, value: date):
+        """Setează și validează valoarea"""
+        self._data_eliberare = self._ordinal(value, "Data eliberare")
+    
+    @property
+    def data_expirare(self) -> date:
+        """Data expirării certificatului"""
+        return date.fromordinal(self._data_expirare)
+    
+    @data_expirare.setter
+    def data_expirare(self, value: date):
+        """Setează și validează valoarea"""
+        self._data_expirare = self._ordinal(value, "Data expirare")
+    
+    def _values(self) -> tuple:
+        """Valorile interne (pentru comparare)"""
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+    
+    def __eq__(self, other):
+        """Compară două certificate după toate câmpurile"""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+    
+    # Obiect mutabil - nu poate fi folosit drept cheie (ca un dataclass)
+    __hash__ = None
+    
+    def __repr__(self):
+        """Reprezentare text (aceeași formă ca a unui dataclass)"""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"Certificate({fields})"
+    
+    def replace(self, **changes) -> 'Certificate':
+        """
+        Returnează o copie a certificatului cu câmpurile date modificate
         
-        if self.data_expirare <= self.data_eliberare:
-            raise ValueError("Data expirare trebuie să fie după data eliberare")
+        Returns:
+            Obiect Certificate nou (validat)
+        """
+        values = {name: getattr(self, name) for name in self.FIELDS}
+        values.update(changes)
+        return Certificate(**values)
     
     def to_dict(self):
         """Convertește certificatul într-un dicționar"""
         return {
-            'Grad': self.grad,
+            'Grad': GRADE_MILITARE[self._grad],
             'Nume': self.nume,
             'Prenume': self.prenume,
-            'Data nașterii': self.data_nasterii.strftime('%d.%m.%Y'),
+            'Data nașterii': _format_ordinal(self._data_nasterii),
             'Serie certificat': self.serie_certificat,
             'Număr certificat': self.numar_certificat,
-            'Nivel certificat': self.nivel_certificat,
-            'Data eliberare': self.data_eliberare.strftime('%d.%m.%Y'),
-            'Data expirare': self.data_expirare.strftime('%d.%m.%Y'),
+            'Nivel certificat': NIVELURI_CERTIFICATE[self._nivel],
+            'Data eliberare': _format_ordinal(self._data_eliberare),
+            'Data expirare': _format_ordinal(self._data_expirare),
             'Observații': self.observatii or ''
         }
     
     @classmethod
     def from_dict(cls, data: dict):
         """Crează un certificat dintr-un dicționar"""
-        from datetime import datetime
         import pandas as pd
+        from utils.date_parser import parse_date
         
         # Verifică dacă data este un dicționar valid
         if not isinstance(data, dict):
             raise TypeError(f"Expected dict, got {type(data).__name__}")
         
-        def parse_date(date_value):
-            """Parse date în format DD.MM.YYYY sau YYYY-MM-DD"""
-            # Verifică None sau NaN
-            if date_value is None or (isinstance(date_value, float) and pd.isna(date_value)):
-                raise ValueError("Data lipsă sau invalidă")
-            
-            if isinstance(date_value, date):
-                return date_value
-            
-            if isinstance(date_value, str):
-                date_value = date_value.strip()
-                if not date_value:
-                    raise ValueError("Data goală")
-                
-                # Încearca format DD.MM.YYYY
-                try:
-                    return datetime.strptime(date_value, '%d.%m.%Y').date()
-                except ValueError:
-                    pass
-                # Încearca format YYYY-MM-DD
-                try:
-                    return datetime.strptime(date_value, '%Y-%m-%d').date()
-                except ValueError:
-                    pass
-            
-            raise ValueError(f"Format dată invalid: {date_value} (tip: {type(date_value).__name__})")
-        
         def get_value(key1, key2='', default=''):
             """Obține valoare cu fallback pentru chei multiple"""
             value = data.get(key1)
@@ -173,24 +307,20 @@ class Certificate:
         except Exception as e:
             raise ValueError(f"Eroare la parsarea certificatului: {e}. Date: {data}")
     
-    def zile_pana_la_expirare(self) -> int:
-        """Calculează numărul de zile până la expirare"""
-        from datetime import datetime
-        today = datetime.now().date()
-        return (self.data_expirare - today).days
+    def zile_pana_la_expirare(self, today: Optional[date] = None) -> int:
+        """
+        Calculează numărul de zile până la expirare
+        
+        Args:
+            today: Data de referință (implicit data curentă); la prelucrarea
+                mai multor certificate se transmite aceeași dată tuturor
+        """
+        return self._data_expirare - (today or date.today()).toordinal()
     
-    def get_status_color(self) -> str:
+    def get_status_color(self, today: Optional[date] = None) -> str:
         """Returnează codul de culoare bazat pe statusul expirării"""
-        zile = self.zile_pana_la_expirare()
-        
-        if zile < 0:
-            return "#8B0000"  # Roșu închis - expirat
-        elif zile <= 30:
-            return "#FFB6C1"  # Roșu deschis - 1 lună
-        elif zile <= 90:
-            return "#FFFF99"  # Galben - 3 luni
-        else:
-            return "#FFFFFF"  # Alb - normal
+        # Roșu închis - expirat, roșu deschis - 1 lună, galben - 3 luni, alb - normal
+        return STATUS_COLORS[expiry_status(self.zile_pana_la_expirare(today))]
 
 
 # Coloanele tabelului în ordinea dorită
@@ -207,3 +337,6 @@ COLUMN_NAMES = [
     'Data expirare',
     'Observații'
 ]
+
+# Coloana persistată cu identificatorul stabil (nu este afișată în tabel)
+ID_COLUMN = 'ID'
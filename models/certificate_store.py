@@ -0,0 +1,629 @@
+"""
+Stocare pe coloane (NumPy) a certificatelor, pentru tabel, filtre și alerte
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.certificate import (Certificate, GRADE_MILITARE, NIVELURI_CERTIFICATE,
+                                ZILE_ATENTIE, ZILE_URGENT)
+from models.columnar import (DATE_FIELDS, MISSING_ID, RowError, certificates_from_columns,
+                             empty_columns, parse_columns)
+from models.date_index import DateIndex, add_months
+from models.search_index import SearchIndex, fold_text
+from utils.collation import collation_key
+
+
+# Coloanele afișate (fără Nr.) -> câmpul din stocare
+DISPLAY_FIELDS = {
+    'Grad': 'grad',
+    'Nume': 'nume',
+    'Prenume': 'prenume',
+    'Data nașterii': 'data_nasterii',
+    'Serie certificat': 'serie_certificat',
+    'Număr certificat': 'numar_certificat',
+    'Nivel certificat': 'nivel_certificat',
+    'Data eliberare': 'data_eliberare',
+    'Data expirare': 'data_expirare',
+    'Observații': 'observatii',
+}
+
+
+# Câmpurile sortate după rangul în nomenclator, nu alfabetic
+CODE_FIELDS = ('grad', 'nivel_certificat')
+
+
+def format_ordinals(ordinals: np.ndarray) -> List[str]:
+    """
+    Formatează un vector de date ordinale ca DD.MM.YYYY
+
+    Fiecare dată distinctă este formatată o singură dată.
+
+    Args:
+        ordinals: Vectorul de date ordinale
+
+    Returns:
+        Lista textelor
+    """
+    unique, inverse = np.unique(ordinals, return_inverse=True)
+    texts = [date.fromordinal(ordinal).strftime('%d.%m.%Y') for ordinal in unique.tolist()]
+    return [texts[position] for position in inverse.tolist()]
+
+
+def expiration_filter_range(months: int, today: date) -> Optional[Tuple[Optional[date], date]]:
+    """
+    Intervalul datelor de expirare selectat de filtrul de expirare din tabel
+
+    Lunile sunt calendaristice: "1 lună" de pe 31.01 înseamnă până pe
+    28.02 (sau 29.02), inclusiv.
+
+    Args:
+        months: Numărul de luni (0 = toate, -1 = expirate, altfel = expiră în X luni)
+        today: Data de referință
+
+    Returns:
+        Tuple (prima dată sau None, ultima dată), ambele incluse, sau None
+        dacă filtrul acceptă toate certificatele
+    """
+    if months == 0:
+        return None
+    if months == -1:
+        return None, today - timedelta(days=1)
+    return today, add_months(today, months)
+
+
+@dataclass(frozen=True)
+class ExpirySnapshot:
+    """Zilele până la expirare și statusurile, calculate pentru o singură zi"""
+    today: int          # Data de referință (număr ordinal)
+    days: np.ndarray    # Zilele rămase (int32, negativ pentru expirate)
+    status: np.ndarray  # Statusul fiecărui rând (int8, STATUS_*)
+
+
+class CertificateStore:
+    """
+    Certificatele valide, păstrate pe coloane
+
+    Datele sunt vectori de numere ordinale (int32), gradul și nivelul sunt
+    coduri (int8) în nomenclatoare, iar textele sunt vectori de șiruri.
+    Tabelul, filtrele și alertele citesc direct din acești vectori, fără a
+    construi obiecte Certificate la fiecare reîmprospătare. Rândurile sunt
+    identificate prin ID-ul certificatului (poziția se poate schimba).
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        Inițializează stocarea
+
+        Args:
+            columns: Coloanele tipizate (formatul întors de parse_columns)
+        """
+        self.columns = columns
+        self._positions: Optional[Dict[int, int]] = None
+        self._display: Optional[Dict[str, List[str]]] = None
+        self._search: Optional[SearchIndex] = None
+        # Ultima căutare text (text normalizat, masca), pentru rafinare
+        self._last_text: Optional[Tuple[str, np.ndarray]] = None
+        self._expiry: Optional[ExpirySnapshot] = None
+        # Câmp dată -> indexul sortat (construit la prima interogare)
+        self._date_indexes: Dict[str, DateIndex] = {}
+        # Coloană afișată -> cel mai lung text (pentru lățimea coloanelor)
+        self._longest: Optional[Dict[str, str]] = None
+        # Câmp text -> cheia de colaționare românească a fiecărui rând
+        self._collation: Dict[str, np.ndarray] = {}
+        # Câmp text -> rangul alfabetic al valorii fiecărui rând
+        self._sort_ranks: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> Tuple['CertificateStore', List[RowError]]:
+        """
+        Construiește stocarea dintr-un DataFrame, validând coloană cu coloană
+
+        Args:
+            df: DataFrame-ul sursă
+
+        Returns:
+            Tuple (stocarea rândurilor valide, lista erorilor)
+        """
+        columns, errors = parse_columns(df)
+        return cls(columns), errors
+
+    @classmethod
+    def from_certificates(cls, certificates: List[Certificate]) -> 'CertificateStore':
+        """
+        Construiește stocarea dintr-o listă de certificate
+
+        Args:
+            certificates: Lista certificatelor
+
+        Returns:
+            Stocarea
+        """
+        store = cls(empty_columns())
+        store.extend(certificates)
+        return store
+
+    def __len__(self) -> int:
+        """Numărul de certificate"""
+        return len(self.columns['id'])
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Vectorul ID-urilor, în ordinea rândurilor"""
+        return self.columns['id']
+
+    def _invalidate(self):
+        """Golește datele derivate după o modificare"""
+        self._positions = None
+        self._display = None
+        self._search = None
+        self._last_text = None
+        self._expiry = None
+        self._date_indexes = {}
+        self._longest = None
+        self._collation = {}
+        self._sort_ranks = {}
+
+    def position_of(self, certificate_id: int) -> int:
+        """
+        Returnează poziția certificatului cu ID-ul dat
+
+        Raises:
+            KeyError: Dacă ID-ul nu există
+        """
+        if self._positions is None:
+            self._positions = {record_id: position
+                               for position, record_id in enumerate(self.ids.tolist())}
+        return self._positions[certificate_id]
+
+    def certificate(self, position: int) -> Certificate:
+        """
+        Construiește certificatul de pe o poziție
+
+        Args:
+            position: Poziția rândului
+
+        Returns:
+            Obiect Certificate
+        """
+        columns = self.columns
+        record_id = int(columns['id'][position])
+        return Certificate.from_codes(
+            int(columns['grad'][position]),
+            columns['nume'][position],
+            columns['prenume'][position],
+            int(columns['data_nasterii'][position]),
+            columns['serie_certificat'][position],
+            columns['numar_certificat'][position],
+            int(columns['nivel_certificat'][position]),
+            int(columns['data_eliberare'][position]),
+            int(columns['data_expirare'][position]),
+            columns['observatii'][position],
+            None if record_id == MISSING_ID else record_id
+        )
+
+    def certificates(self) -> List[Certificate]:
+        """
+        Construiește toate certificatele (pentru codul care lucrează cu obiecte)
+
+        Returns:
+            Lista certificatelor, în ordinea rândurilor
+        """
+        return certificates_from_columns(self.columns)
+
+    def _row_values(self, certificate: Certificate) -> Dict[str, object]:
+        """Valorile unui certificat, în formatul coloanelor"""
+        return {
+            'id': MISSING_ID if certificate.id is None else certificate.id,
+            'grad': certificate._grad,
+            'nume': certificate.nume,
+            'prenume': certificate.prenume,
+            'data_nasterii': certificate._data_nasterii,
+            'serie_certificat': certificate.serie_certificat,
+            'numar_certificat': certificate.numar_certificat,
+            'nivel_certificat': certificate._nivel,
+            'data_eliberare': certificate._data_eliberare,
+            'data_expirare': certificate._data_expirare,
+            'observatii': certificate.observatii or '',
+        }
+
+    def extend(self, certificates: List[Certificate]):
+        """
+        Adaugă certificate la sfârșit
+
+        Args:
+            certificates: Certificatele de adăugat
+        """
+        if not certificates:
+            return
+        rows = [self._row_values(certificate) for certificate in certificates]
+        columns = {}
+        for field, values in self.columns.items():
+            columns[field] = np.empty(len(rows), dtype=values.dtype)
+            columns[field][:] = [row[field] for row in rows]
+        self.extend_columns(columns)
+
+    def extend_columns(self, columns: Dict[str, np.ndarray]):
+        """
+        Adaugă la sfârșit rânduri deja tipizate (de exemplu o bucată citită
+        în fundal și convertită cu parse_columns)
+
+        Args:
+            columns: Coloanele rândurilor noi (formatul întors de parse_columns)
+        """
+        if not len(columns['id']):
+            return
+        start = len(self)
+        for field, values in self.columns.items():
+            added = columns[field].astype(values.dtype, copy=False)
+            self.columns[field] = np.concatenate([values, added])
+
+        # Datele derivate sunt completate doar cu rândurile noi
+        if self._positions is not None:
+            for position, record_id in enumerate(columns['id'].tolist(), start=start):
+                self._positions[record_id] = position
+        if self._display is not None:
+            added = self._format_columns(columns)
+            for column, values in self._display.items():
+                values.extend(added[column])
+            self._update_longest(added)
+            if self._search is not None:
+                self._search.extend(added)
+        else:
+            self._search = None
+        for field, index in self._date_indexes.items():
+            index.extend(self.columns[field][start:], start)
+        for field, keys in self._collation.items():
+            added = self._collation_keys(self.columns[field][start:])
+            self._collation[field] = np.concatenate([keys, added])
+        self._sort_ranks = {}
+        self._last_text = None
+        self._expiry = None
+
+    def append(self, certificate: Certificate):
+        """
+        Adaugă un certificat la sfârșit
+
+        Args:
+            certificate: Certificatul de adăugat
+        """
+        self.extend([certificate])
+
+    def update(self, certificate_id: int, certificate: Certificate):
+        """
+        Înlocuiește valorile certificatului cu ID-ul dat
+
+        Args:
+            certificate_id: ID-ul certificatului
+            certificate: Noile valori
+        """
+        position = self.position_of(certificate_id)
+        row = self._row_values(certificate)
+        row['id'] = certificate_id
+        for field, index in self._date_indexes.items():
+            index.update(position, int(self.columns[field][position]), row[field])
+        for field, keys in self._collation.items():
+            keys[position] = collation_key(row[field])
+        for field, value in row.items():
+            self.columns[field][position] = value
+
+        if self._display is not None:
+            changed = self._display_rows([row])
+            for column, values in self._display.items():
+                if self._longest is not None and values[position] == self._longest[column]:
+                    # Textul cel mai lung poate dispărea; recalculat la cerere
+                    self._longest = None
+                values[position] = changed[column][0]
+            self._update_longest(changed)
+            if self._search is not None:
+                self._search.update(position, changed)
+        else:
+            self._search = None
+        self._sort_ranks = {}
+        self._last_text = None
+        self._expiry = None
+
+    def remove(self, certificate_id: int):
+        """
+        Șterge certificatul cu ID-ul dat
+
+        Args:
+            certificate_id: ID-ul certificatului
+
+        Returns:
+            Poziția pe care a avut-o certificatul
+        """
+        position = self.position_of(certificate_id)
+        for field, index in self._date_indexes.items():
+            index.remove(position, int(self.columns[field][position]))
+        for field, keys in self._collation.items():
+            self._collation[field] = np.delete(keys, position)
+        for field, values in self.columns.items():
+            self.columns[field] = np.delete(values, position)
+
+        # Pozițiile de după rândul șters se schimbă; textele sunt doar scurtate
+        self._positions = None
+        if self._display is not None:
+            for column, values in self._display.items():
+                if self._longest is not None and values[position] == self._longest[column]:
+                    self._longest = None
+                del values[position]
+        if self._search is not None:
+            self._search.remove(position)
+        self._sort_ranks = {}
+        self._last_text = None
+        self._expiry = None
+        return position
+
+    def display_columns(self) -> Dict[str, List[str]]:
+        """
+        Returnează textele afișate pentru fiecare coloană (fără Nr.)
+
+        Rezultatul este păstrat până la următoarea modificare.
+
+        Returns:
+            Dicționar nume coloană -> lista textelor, în ordinea rândurilor
+        """
+        if self._display is None:
+            self._display = self._format_columns(self.columns)
+        return self._display
+
+    @staticmethod
+    def _format_columns(columns: Dict[str, np.ndarray]) -> Dict[str, List[str]]:
+        """Formatează coloanele tipizate ca texte afișate"""
+        display = {}
+        for column, field in DISPLAY_FIELDS.items():
+            values = columns[field]
+            if field in DATE_FIELDS:
+                display[column] = format_ordinals(values)
+            elif field == 'grad':
+                display[column] = [GRADE_MILITARE[code] for code in values.tolist()]
+            elif field == 'nivel_certificat':
+                display[column] = [NIVELURI_CERTIFICATE[code] for code in values.tolist()]
+            else:
+                display[column] = list(values)
+        return display
+
+    def longest_texts(self) -> Dict[str, str]:
+        """
+        Returnează cel mai lung text afișat din fiecare coloană (fără Nr.)
+
+        Statistica este păstrată și actualizată la modificări; servește la
+        estimarea lățimii coloanelor fără măsurarea tuturor celulelor.
+
+        Returns:
+            Dicționar nume coloană -> textul cu cele mai multe caractere
+        """
+        if self._longest is None:
+            self._longest = {column: max(values, key=len, default='')
+                             for column, values in self.display_columns().items()}
+        return self._longest
+
+    def _update_longest(self, display: Dict[str, List[str]]):
+        """Actualizează textele cele mai lungi cu texte noi (pe coloane)"""
+        if self._longest is None:
+            return
+        for column, values in display.items():
+            candidate = max(values, key=len, default='')
+            if len(candidate) > len(self._longest[column]):
+                self._longest[column] = candidate
+
+    def _display_rows(self, rows: List[Dict[str, object]]) -> Dict[str, List[str]]:
+        """Textele afișate pentru câteva rânduri (în formatul _row_values)"""
+        columns = {field: np.array([row[field] for row in rows], dtype=self.columns[field].dtype)
+                   for field in DISPLAY_FIELDS.values()}
+        return self._format_columns(columns)
+
+    def text_mask(self, query: str) -> np.ndarray:
+        """
+        Caută un text în toate coloanele afișate, fără diferențe de majuscule
+        sau diacritice ("stefan" găsește "Ștefan")
+
+        Indexul de căutare este construit la prima căutare și actualizat apoi
+        la fiecare modificare. Dacă textul îl conține pe cel căutat anterior
+        (utilizatorul continuă să tasteze), sunt verificate doar rândurile
+        găsite atunci.
+
+        Args:
+            query: Textul căutat
+
+        Returns:
+            Vector boolean, True pentru rândurile care conțin textul
+        """
+        query = fold_text(query.strip())
+        if not query or len(self) == 0:
+            return np.ones(len(self), dtype=bool)
+        if self._search is None:
+            self._search = SearchIndex(self.display_columns())
+
+        within = None
+        if self._last_text is not None and self._last_text[0] in query:
+            within = self._last_text[1]
+        mask = self._search.mask(query, within)
+        self._last_text = (query, mask)
+        return mask
+
+    def expiry(self, today: Optional[date] = None) -> ExpirySnapshot:
+        """
+        Calculează zilele până la expirare și statusul tuturor certificatelor
+
+        Calculul este vectorizat, față de o singură dată de referință, și este
+        păstrat până la schimbarea zilei sau următoarea modificare a datelor.
+        Astfel tabelul, filtrele și alertele folosesc aceleași valori, chiar
+        dacă încărcarea trece de miezul nopții.
+
+        Args:
+            today: Data de referință (implicit data curentă)
+
+        Returns:
+            ExpirySnapshot (vectorii nu trebuie modificați)
+        """
+        today_ordinal = (today or date.today()).toordinal()
+        if self._expiry is None or self._expiry.today != today_ordinal:
+            days = self.columns['data_expirare'] - np.int32(today_ordinal)
+            # < 0 -> EXPIRAT, <= 30 -> URGENT, <= 90 -> ATENȚIE, altfel VALID
+            status = np.digitize(days, [0, ZILE_URGENT + 1, ZILE_ATENTIE + 1]).astype(np.int8)
+            self._expiry = ExpirySnapshot(today_ordinal, days, status)
+        return self._expiry
+
+    def days_to_expiry(self, today: Optional[date] = None) -> np.ndarray:
+        """
+        Returnează zilele rămase până la expirare pentru toate certificatele
+
+        Args:
+            today: Data de referință (implicit data curentă)
+
+        Returns:
+            Vector int32 (negativ pentru certificatele expirate)
+        """
+        return self.expiry(today).days
+
+    def sort_keys(self, field: str) -> np.ndarray:
+        """
+        Returnează cheile de sortare tipizate ale unui câmp
+
+        Datele sunt numere ordinale, gradul și nivelul sunt rangul în
+        nomenclator (ordinea din GRADE_MILITARE, NIVELURI_CERTIFICATE), iar
+        textele sunt rangul valorii în ordinea alfabetului românesc (vezi
+        collation_keys), calculat o singură dată până la următoarea
+        modificare.
+
+        Args:
+            field: Câmpul din stocare
+
+        Returns:
+            Vector de întregi, pe pozițiile din stocare (nu trebuie modificat)
+        """
+        if field in DATE_FIELDS or field in CODE_FIELDS:
+            return self.columns[field]
+        ranks = self._sort_ranks.get(field)
+        if ranks is None:
+            _, ranks = np.unique(self.collation_keys(field), return_inverse=True)
+            ranks = self._sort_ranks[field] = ranks.astype(np.int32)
+        return ranks
+
+    def collation_keys(self, field: str) -> np.ndarray:
+        """
+        Returnează cheile de colaționare românească ale unui câmp text
+
+        Cheile sunt calculate o singură dată (o dată pe valoare distinctă) și
+        actualizate la fiecare modificare; comparația lor ca șiruri dă ordinea
+        alfabetului românesc (Ș după S, Ț după T, Ă și Â după A, Î după I).
+
+        Args:
+            field: Câmpul text
+
+        Returns:
+            Vector de chei (object), pe pozițiile din stocare
+        """
+        keys = self._collation.get(field)
+        if keys is None:
+            keys = self._collation[field] = self._collation_keys(self.columns[field])
+        return keys
+
+    @staticmethod
+    def _collation_keys(values: np.ndarray) -> np.ndarray:
+        """Cheile de colaționare ale unor texte (fiecare text distinct, o dată)"""
+        codes, uniques = pd.factorize(values)
+        keys = np.array([collation_key(str(value)) for value in uniques] + [''], dtype=object)
+        return keys[codes]
+
+    def sort_key(self, field: str, position: int):
+        """
+        Cheia de sortare a unei singure poziții, în aceeași ordine ca sort_keys
+
+        Args:
+            field: Câmpul din stocare
+            position: Poziția rândului
+
+        Returns:
+            Întreg (date, grad, nivel) sau cheia de colaționare a textului
+        """
+        if field in DATE_FIELDS or field in CODE_FIELDS:
+            return int(self.columns[field][position])
+        return self.collation_keys(field)[position]
+
+    def date_index(self, field: str) -> DateIndex:
+        """
+        Returnează indexul sortat al unei coloane de date
+
+        Indexul este construit la prima cerere și actualizat apoi la fiecare
+        modificare.
+
+        Args:
+            field: Câmpul (unul din DATE_FIELDS)
+
+        Returns:
+            DateIndex
+        """
+        index = self._date_indexes.get(field)
+        if index is None:
+            index = self._date_indexes[field] = DateIndex(self.columns[field])
+        return index
+
+    def date_range(self, field: str, start: Optional[date] = None,
+                   end: Optional[date] = None) -> np.ndarray:
+        """
+        Returnează pozițiile cu data în intervalul [start, end] (căutare binară)
+
+        Args:
+            field: Câmpul dată (data_expirare, data_eliberare, data_nasterii)
+            start: Prima dată, inclusiv (None = fără limită)
+            end: Ultima dată, inclusiv (None = fără limită)
+
+        Returns:
+            Pozițiile, în ordinea datelor
+        """
+        return self.date_index(field).positions(
+            None if start is None else start.toordinal(),
+            None if end is None else end.toordinal())
+
+    def date_range_mask(self, field: str, start: Optional[date] = None,
+                        end: Optional[date] = None) -> np.ndarray:
+        """
+        Masca rândurilor cu data în intervalul [start, end]
+
+        Args:
+            field: Câmpul dată
+            start: Prima dată, inclusiv (None = fără limită)
+            end: Ultima dată, inclusiv (None = fără limită)
+
+        Returns:
+            Vector boolean
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.date_range(field, start, end)] = True
+        return mask
+
+    def expiring_mask(self, days: int, today: Optional[date] = None) -> np.ndarray:
+        """
+        Masca certificatelor care expiră în următoarele zile (inclusiv expirate)
+
+        Args:
+            days: Numărul de zile
+            today: Data de referință (implicit data curentă)
+
+        Returns:
+            Vector boolean
+        """
+        return self.date_range_mask('data_expirare', None,
+                                    (today or date.today()) + timedelta(days=days))
+
+    def expiration_filter_mask(self, months: int, today: Optional[date] = None) -> np.ndarray:
+        """
+        Masca filtrului de expirare din tabel (vezi expiration_filter_range)
+
+        Args:
+            months: Numărul de luni (0 = toate, -1 = expirate, altfel = expiră în X luni)
+            today: Data de referință (implicit data curentă)
+
+        Returns:
+            Vector boolean
+        """
+        limits = expiration_filter_range(months, today or date.today())
+        if limits is None:
+            return np.ones(len(self), dtype=bool)
+        return self.date_range_mask('data_expirare', *limits)
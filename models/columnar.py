@@ -0,0 +1,291 @@
+"""
+Conversie vectorizată (pe coloane) între DataFrame și certificate
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.certificate import (Certificate, COLUMN_NAMES, GRAD_CODES, ID_COLUMN,
+                                NIVEL_CODES)
+from utils.date_parser import try_parse_date
+
+
+# Coloanele sursă pentru fiecare câmp (formatul nou, apoi formatul vechi)
+FIELD_COLUMNS = {
+    'grad': ('Grad',),
+    'nume': ('Nume',),
+    'prenume': ('Prenume',),
+    'data_nasterii': ('Data nașterii', 'Data Nașterii'),
+    'serie_certificat': ('Serie certificat', 'Serie Certificat'),
+    'numar_certificat': ('Număr certificat', 'Număr Certificat'),
+    'nivel_certificat': ('Nivel certificat', 'Nivel Certificat'),
+    'data_eliberare': ('Data eliberare', 'Data Eliberare'),
+    'data_expirare': ('Data expirare', 'Data Expirare'),
+    'observatii': ('Observații',),
+}
+
+DATE_FIELDS = ('data_nasterii', 'data_eliberare', 'data_expirare')
+TEXT_FIELDS = ('grad', 'nume', 'prenume', 'serie_certificat',
+               'numar_certificat', 'nivel_certificat', 'observatii')
+
+# Numărul ordinal al datei 01.01.1970 (originea datetime64)
+EPOCH_ORDINAL = 719163
+
+# Valoarea coloanei 'id' pentru rândurile fără identificator
+MISSING_ID = -1
+
+
+@dataclass
+class RowError:
+    """Eroare de validare pentru un rând"""
+    row: int
+    column: str
+    reason: str
+
+
+def _field_series(df: pd.DataFrame, field: str) -> Tuple[str, pd.Series]:
+    """
+    Returnează coloana pentru un câmp, cu fallback pe denumirea veche
+
+    Returns:
+        Tuple (numele coloanei, valorile ca Series de tip object)
+    """
+    names = FIELD_COLUMNS[field]
+    result = None
+    for name in names:
+        if name in df.columns:
+            values = df[name].astype(object)
+            result = values if result is None else result.where(result.notna(), values)
+    if result is None:
+        result = pd.Series([None] * len(df), index=df.index, dtype=object)
+    return names[0], result
+
+
+def non_empty_rows(df: pd.DataFrame) -> pd.Series:
+    """
+    Returnează masca rândurilor care nu sunt goale (au completat numele)
+
+    Args:
+        df: DataFrame-ul sursă
+
+    Returns:
+        Series booleană, True pentru rândurile cu nume
+    """
+    _, nume = _field_series(df, 'nume')
+    return nume.notna() & (nume.map(str).str.strip() != '')
+
+
+def _text_column(values: pd.Series) -> pd.Series:
+    """Convertește o coloană în text (valorile lipsă devin șir gol)"""
+    missing = values.isna()
+    return values.where(~missing, '').map(str)
+
+
+def parse_date_column(values: pd.Series) -> pd.Series:
+    """
+    Parsează o coloană de date (DD.MM.YYYY, YYYY-MM-DD, date sau serial Excel)
+
+    Fiecare valoare distinctă este parsată o singură dată (utils.date_parser),
+    iar rezultatul este distribuit vectorizat pe toate rândurile.
+
+    Args:
+        values: Valorile brute
+
+    Returns:
+        Series datetime64 (NaT pentru valorile invalide)
+    """
+    codes, uniques = pd.factorize(values.astype(object))
+    parsed = [try_parse_date(value) for value in uniques]
+    # Ultimul element (NaT) corespunde codului -1 (valoare lipsă)
+    lookup = np.array([np.datetime64('NaT') if value is None else np.datetime64(value, 'D')
+                       for value in parsed] + [np.datetime64('NaT')], dtype='datetime64[s]')
+    return pd.Series(lookup[codes], index=values.index)
+
+
+def ordinal_column(values: pd.Series) -> np.ndarray:
+    """
+    Convertește o coloană datetime în numere ordinale (date.toordinal())
+
+    Args:
+        values: Series datetime64 fără valori lipsă
+
+    Returns:
+        Vector int32 cu numerele ordinale
+    """
+    days = values.to_numpy().astype('datetime64[D]').astype('int64') + EPOCH_ORDINAL
+    return days.astype(np.int32)
+
+
+def shared_int_list(values: np.ndarray) -> list:
+    """
+    Convertește un vector de întregi într-o listă Python
+
+    Valorile egale primesc același obiect int, astfel încât memoria ocupată
+    (de exemplu de date ordinale) nu crește cu numărul de rânduri.
+
+    Args:
+        values: Vectorul de întregi
+
+    Returns:
+        Lista valorilor
+    """
+    unique, inverse = np.unique(values, return_inverse=True)
+    shared = unique.tolist()
+    return [shared[position] for position in inverse.tolist()]
+
+
+def empty_columns() -> Dict[str, np.ndarray]:
+    """Coloanele tipizate pentru un tabel fără rânduri (vezi parse_columns)"""
+    columns = {'id': np.empty(0, dtype=np.int64),
+               'grad': np.empty(0, dtype=np.int8),
+               'nivel_certificat': np.empty(0, dtype=np.int8)}
+    for field in DATE_FIELDS:
+        columns[field] = np.empty(0, dtype=np.int32)
+    for field in TEXT_FIELDS:
+        if field not in columns:
+            columns[field] = np.empty(0, dtype=object)
+    return columns
+
+
+def parse_columns(df: pd.DataFrame) -> Tuple[Dict[str, np.ndarray], List[RowError]]:
+    """
+    Validează un DataFrame coloană cu coloană și întoarce coloanele tipizate
+
+    Rândurile fără nume sunt ignorate (rânduri goale), iar rândurile invalide
+    sunt raportate ca erori structurate. Pentru rândurile valide se întorc:
+    'id' (int64, MISSING_ID dacă lipsește), 'grad' și 'nivel_certificat'
+    (coduri int8), datele (ordinale int32) și textele (vectori object).
+
+    Args:
+        df: DataFrame-ul sursă
+
+    Returns:
+        Tuple (coloanele rândurilor valide, lista erorilor)
+    """
+    if df.empty:
+        return empty_columns(), []
+
+    columns = {}
+    raw = {}
+    for field in FIELD_COLUMNS:
+        columns[field], raw[field] = _field_series(df, field)
+
+    # Ignoră rânduri goale (fără nume)
+    keep = non_empty_rows(df)
+    if not keep.all():
+        df = df[keep]
+        raw = {field: values[keep] for field, values in raw.items()}
+
+    text = {field: _text_column(raw[field]) for field in TEXT_FIELDS}
+    dates = {field: parse_date_column(raw[field]) for field in DATE_FIELDS}
+
+    errors: List[RowError] = []
+    invalid = pd.Series(False, index=df.index)
+
+    def reject(mask: pd.Series, field: str, reason):
+        """Înregistrează erorile pentru rândurile din mască"""
+        nonlocal invalid
+        if not mask.any():
+            return
+        invalid = invalid | mask
+        for row in mask[mask].index:
+            errors.append(RowError(int(row), columns[field], reason(row)))
+
+    reject(~text['grad'].isin(GRAD_CODES.keys()), 'grad',
+           lambda row: f"Grad invalid: {text['grad'][row]}")
+    reject(~text['nivel_certificat'].isin(NIVEL_CODES.keys()), 'nivel_certificat',
+           lambda row: f"Nivel certificat invalid: {text['nivel_certificat'][row]}")
+
+    for field in DATE_FIELDS:
+        missing = raw[field].isna() | (raw[field].map(lambda v: str(v).strip()) == '')
+        reject(missing, field, lambda row: "Data lipsă sau invalidă")
+        reject(~missing & dates[field].isna(), field,
+               lambda row, field=field: f"Format dată invalid: {raw[field][row]}")
+
+    both = dates['data_eliberare'].notna() & dates['data_expirare'].notna()
+    reject(both & (dates['data_expirare'] <= dates['data_eliberare']), 'data_expirare',
+           lambda row: "Data expirare trebuie să fie după data eliberare")
+    errors.sort(key=lambda error: error.row)
+
+    valid = ~invalid
+    if not valid.all():
+        text = {field: values[valid] for field, values in text.items()}
+        dates = {field: values[valid] for field, values in dates.items()}
+
+    result = {}
+    if ID_COLUMN in df.columns:
+        ids = pd.to_numeric(df[ID_COLUMN][valid], errors='coerce')
+        result['id'] = ids.fillna(MISSING_ID).to_numpy().astype(np.int64)
+    else:
+        result['id'] = np.full(int(valid.sum()), MISSING_ID, dtype=np.int64)
+
+    result['grad'] = text['grad'].map(GRAD_CODES).to_numpy().astype(np.int8)
+    result['nivel_certificat'] = text['nivel_certificat'].map(NIVEL_CODES).to_numpy().astype(np.int8)
+    for field in DATE_FIELDS:
+        result[field] = ordinal_column(dates[field])
+    for field in TEXT_FIELDS:
+        if field not in result:
+            result[field] = text[field].to_numpy(dtype=object)
+    return result, errors
+
+
+def parse_certificates(df: pd.DataFrame) -> Tuple[List[Certificate], List[RowError]]:
+    """
+    Convertește un DataFrame în certificate, validând coloană cu coloană
+
+    Rândurile fără nume sunt ignorate (rânduri goale), iar rândurile invalide
+    sunt raportate ca erori structurate.
+
+    Args:
+        df: DataFrame-ul sursă
+
+    Returns:
+        Tuple (lista certificatelor valide, lista erorilor)
+    """
+    columns, errors = parse_columns(df)
+    return certificates_from_columns(columns), errors
+
+
+def certificates_from_columns(columns: Dict[str, np.ndarray]) -> List[Certificate]:
+    """
+    Construiește certificatele din coloanele tipizate (vezi parse_columns)
+
+    Args:
+        columns: Coloanele tipizate
+
+    Returns:
+        Lista certificatelor
+    """
+    ids = [None if record_id == MISSING_ID else record_id for record_id in columns['id'].tolist()]
+    ordinals = {field: shared_int_list(columns[field]) for field in DATE_FIELDS}
+    from_codes = Certificate.from_codes
+    return [
+        from_codes(grad, nume, prenume, data_nasterii, serie, numar, nivel,
+                   data_eliberare, data_expirare, observatii, record_id)
+        for grad, nume, prenume, data_nasterii, serie, numar, nivel,
+            data_eliberare, data_expirare, observatii, record_id in zip(
+            columns['grad'].tolist(), columns['nume'].tolist(), columns['prenume'].tolist(),
+            ordinals['data_nasterii'], columns['serie_certificat'].tolist(),
+            columns['numar_certificat'].tolist(), columns['nivel_certificat'].tolist(),
+            ordinals['data_eliberare'], ordinals['data_expirare'],
+            columns['observatii'].tolist(), ids
+        )
+    ]
+
+
+def certificates_to_frame(certificates: List[Certificate]) -> pd.DataFrame:
+    """
+    Construiește rândurile registrului din certificate deja parsate
+
+    Args:
+        certificates: Lista certificatelor
+
+    Returns:
+        DataFrame cu coloanele de date (fără Nr.), în formatul registrului
+    """
+    columns = [col for col in COLUMN_NAMES if col != 'Nr.']
+    if not certificates:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame([certificate.to_dict() for certificate in certificates], columns=columns)
@@ -1,40 +1,187 @@
 """
 Manager pentru gestionarea datelor certificate
 """
+import bisect
+import numpy as np
 import pandas as pd
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List, Optional
-from models.certificate import Certificate, COLUMN_NAMES
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from models.certificate import Certificate, COLUMN_NAMES, ID_COLUMN, NIVELURI_CERTIFICATE
+from models.certificate_store import CertificateStore, expiration_filter_range
+from models.columnar import RowError, certificates_to_frame, parse_certificates, parse_columns
+from models.exporter import StreamingExcelExporter
+from models.importer import ProgressCallback, StreamingImporter, write_error_report
+from models.storage import StorageEngine, apply_change, create_storage_engine
+
+
+# Funcție de alegere a modului de rezolvare a duplicatelor la import:
+# (numărul de certificate duplicate) -> mod (CONFLICT_*) sau None pentru anulare
+ConflictCallback = Callable[[int], Optional[str]]
+
+# Funcție notificată după fiecare modificare a datelor:
+# (operație CHANGE_*, ID-ul certificatului, poziția în stocarea pe coloane)
+ChangeListener = Callable[[str, int, int], None]
 
 
 class DataManager:
     """Gestionează operațiile CRUD pentru certificate"""
     
-    def __init__(self, file_path: str):
+    # Moduri de rezolvare a duplicatelor (serie + număr) la import
+    CONFLICT_SKIP = 'skip'            # păstrează certificatul existent
+    CONFLICT_OVERWRITE = 'overwrite'  # înlocuiește cu certificatul importat
+    CONFLICT_MERGE = 'merge'          # datele importate, observațiile combinate
+    
+    # Tipurile de modificări transmise ascultătorilor (vezi add_change_listener)
+    CHANGE_ADD = 'add'        # poziția noului certificat
+    CHANGE_UPDATE = 'update'  # poziția certificatului modificat
+    CHANGE_DELETE = 'delete'  # poziția pe care a avut-o certificatul șters
+    CHANGE_RESET = 'reset'    # datele trebuie reîncărcate integral (ID și poziție -1)
+    
+    # Numărul de rânduri citite și convertite deodată la încărcarea pe bucăți
+    LOAD_CHUNK_SIZE = 2000
+    
+    # Numărul de ștergeri după care indexul ID -> poziție este reconstruit
+    ID_INDEX_REBUILD_DELETES = 256
+    
+    def __init__(self, file_path: str, journal_mode: bool = False, load: bool = True):
         """
         Inițializează managerul de date
         
         Args:
-            file_path: Calea către fișierul Excel
+            file_path: Calea către fișierul de date (.xlsx sau .db/.sqlite)
+            journal_mode: Dacă True, modificările sunt scrise în jurnal și
+                integrate în registru doar la checkpoint (doar pentru Excel)
+            load: Dacă False, datele nu sunt citite acum, ci pe bucăți cu
+                iter_load_chunks (de exemplu pe un fir separat), urmat de
+                finish_load; până atunci managerul nu are date
         """
         self.file_path = Path(file_path)
+        self.journal_mode = journal_mode
         self.df: Optional[pd.DataFrame] = None
-        self._load_or_create()
+        # True după preluarea datelor; până atunci nu se salvează nimic
+        self.loaded = False
+        self._engine: Optional[StorageEngine] = None
+        self._saver = None
+        # Rândurile respinse la ultima conversie (get_store)
+        self.rejected_rows: List[RowError] = []
+        # Erorile de validare ale ultimului import eșuat
+        self.import_errors: List[RowError] = []
+        # Stocarea pe coloane a rândurilor valide din df (None = trebuie reconstruită)
+        self._store: Optional[CertificateStore] = None
+        # Indexul ID -> poziția rândului în df la ultima reconstruire și
+        # următorul ID liber
+        self._id_to_row: Dict[int, int] = {}
+        self._next_id = 1
+        # Pozițiile (din index) ale rândurilor șterse de la ultima
+        # reconstruire, sortate; vezi _row_of
+        self._deleted_rows: List[int] = []
+        # Indexul de unicitate (serie, număr) -> ID
+        self._serial_index: Dict[Tuple[str, str], int] = {}
+        self._listeners: List[ChangeListener] = []
+        if load:
+            self._load_or_create()
+        else:
+            self._open()
+    
+    def _open(self):
+        """Deschide sursa de date, fără a citi datele (tabel gol)"""
+        self._engine = create_storage_engine(self.file_path, journal_mode=self.journal_mode)
+        self._store = None
+        self._next_id = 1
+        self.loaded = False
+        self.df = pd.DataFrame(columns=COLUMN_NAMES + [ID_COLUMN])
+        self.rejected_rows = []
     
     def _load_or_create(self):
-        """Încarcă fișierul Excel sau creează unul nou"""
-        if self.file_path.exists():
+        """Încarcă fișierul de date sau creează unul nou"""
+        self._open()
+        try:
+            df = self._engine.load() if self._engine.exists() else None
+        except Exception as e:
+            raise Exception(f"Eroare la încărcarea fișierului: {str(e)}")
+        self._adopt(df)
+    
+    def _adopt(self, df: Optional[pd.DataFrame]) -> bool:
+        """
+        Preia datele citite din sursă sau creează o sursă nouă
+        
+        Args:
+            df: Tabelul citit (None dacă sursa nu există și trebuie creată)
+            
+        Returns:
+            True dacă rândurile au primit acum ID-uri noi
+        """
+        ids_assigned = False
+        if df is not None:
             try:
-                self.df = pd.read_excel(self.file_path)
+                self.df = df
                 # Verifică structura
                 if not self._validate_structure():
                     raise ValueError("Structura fișierului este invalidă")
+                # Fișierele vechi (fără ID) primesc identificatori, salvați imediat
+                ids_assigned = self._ensure_ids()
+                if ids_assigned:
+                    self._save()
             except Exception as e:
+                self.df = pd.DataFrame(columns=COLUMN_NAMES + [ID_COLUMN])
                 raise Exception(f"Eroare la încărcarea fișierului: {str(e)}")
         else:
             # Creează fișier nou cu structură goală
-            self.df = pd.DataFrame(columns=COLUMN_NAMES)
+            self.df = pd.DataFrame(columns=COLUMN_NAMES + [ID_COLUMN])
+            self._ensure_ids()
             self._save()
+        self.loaded = True
+        return ids_assigned
+    
+    def iter_load_chunks(self, chunk_size: int = LOAD_CHUNK_SIZE
+                         ) -> Iterator[Tuple[pd.DataFrame, Dict[str, np.ndarray], List[RowError]]]:
+        """
+        Citește sursa de date pe bucăți și convertește fiecare bucată
+        
+        Poate rula pe un fir de execuție separat: doar motorul de stocare
+        citește sursa, starea managerului nu este modificată. Datele sunt
+        preluate apoi cu finish_load, pe firul principal.
+        
+        Args:
+            chunk_size: Numărul maxim de rânduri pe bucată
+            
+        Yields:
+            Tuple (bucata din tabel, coloanele tipizate ale rândurilor ei
+            valide, erorile ei); nimic dacă sursa nu există încă
+        """
+        if not self._engine.exists():
+            return
+        for chunk in self._engine.iter_load(chunk_size):
+            columns, errors = parse_columns(chunk)
+            yield chunk, columns, errors
+    
+    def finish_load(self, df: Optional[pd.DataFrame], store: Optional[CertificateStore] = None,
+                    rejected: Optional[List[RowError]] = None) -> bool:
+        """
+        Preia datele citite cu iter_load_chunks
+        
+        Args:
+            df: Tabelul complet (bucățile reunite cu concat_chunks; None dacă
+                sursa nu există și trebuie creată)
+            store: Stocarea construită din coloanele bucăților
+            rejected: Erorile tuturor bucăților
+            
+        Returns:
+            True dacă stocarea din bucăți a fost păstrată; False dacă
+            get_store o reconstruiește (de exemplu rândurile au primit acum
+            ID-uri)
+            
+        Raises:
+            Exception: Dacă structura fișierului este invalidă
+        """
+        if self._adopt(df) or store is None:
+            self._store = None
+            return False
+        self._store = store
+        self.rejected_rows = list(rejected or [])
+        self._report_rejected()
+        return True
     
     def _validate_structure(self) -> bool:
         """
@@ -78,90 +225,466 @@ class DataManager:
         
         return has_new_columns or has_old_columns
     
-    def _save(self):
-        """Salvează datele în fișierul Excel"""
-        # Asigură că directorul există
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+    def _ensure_ids(self) -> bool:
+        """
+        Atribuie ID-uri noi rândurilor fără ID sau cu ID duplicat
         
-        # Salvează cu formatare
-        with pd.ExcelWriter(self.file_path, engine='openpyxl') as writer:
-            self.df.to_excel(writer, index=False, sheet_name='Certificate')
+        Returns:
+            True dacă au fost atribuite ID-uri noi
+        """
+        if ID_COLUMN in self.df.columns:
+            ids = pd.to_numeric(self.df[ID_COLUMN], errors='coerce')
+        else:
+            ids = pd.Series(float('nan'), index=self.df.index)
+        
+        missing = ids.isna() | ids.duplicated()
+        if missing.any():
+            start = int(ids[~missing].max()) + 1 if (~missing).any() else 1
+            ids[missing] = range(start, start + int(missing.sum()))
+        
+        self.df[ID_COLUMN] = ids.astype('int64')
+        self._rebuild_id_index()
+        self._rebuild_serial_index()
+        return bool(missing.any())
+    
+    def _rebuild_id_index(self):
+        """Reconstruiește indexul ID -> poziție după modificări care mută rândurile"""
+        ids = self.df[ID_COLUMN].tolist()
+        self._id_to_row = {int(record_id): row for row, record_id in enumerate(ids)}
+        self._deleted_rows = []
+        # ID-urile nu sunt refolosite în sesiunea curentă, nici după ștergere
+        self._next_id = max(self._next_id, max(self._id_to_row, default=0) + 1)
+    
+    @staticmethod
+    def _serial_key(serie, numar) -> Tuple[str, str]:
+        """Cheia de unicitate a unui certificat (serie și număr normalizate)"""
+        return str(serie).strip().upper(), str(numar).strip().upper()
+    
+    def _row_serial_key(self, row: int) -> Tuple[str, str]:
+        """Cheia de unicitate a unui rând din DataFrame"""
+        return self._serial_key(self.df.iloc[row]['Serie certificat'], self.df.iloc[row]['Număr certificat'])
+    
+    def _rebuild_serial_index(self):
+        """Reconstruiește indexul (serie, număr) -> ID din DataFrame"""
+        series = self.df['Serie certificat'].fillna('').astype(str).str.strip().str.upper()
+        numbers = self.df['Număr certificat'].fillna('').astype(str).str.strip().str.upper()
+        self._serial_index = {}
+        for key, record_id in zip(zip(series.tolist(), numbers.tolist()),
+                                  self.df[ID_COLUMN].tolist()):
+            # Pentru duplicatele deja existente în fișier se păstrează primul rând
+            if key != ('', '') and key not in self._serial_index:
+                self._serial_index[key] = int(record_id)
+    
+    def find_duplicate(self, serie: str, numar: str,
+                       exclude_id: Optional[int] = None) -> Optional[int]:
+        """
+        Caută un certificat existent cu aceeași serie și același număr
+        
+        Args:
+            serie: Seria certificatului
+            numar: Numărul certificatului
+            exclude_id: ID ignorat la căutare (certificatul în curs de editare)
             
-            # Ajustează lățimea coloanelor
-            worksheet = writer.sheets['Certificate']
-            for idx, col in enumerate(self.df.columns):
-                max_length = max(
-                    self.df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+        Returns:
+            ID-ul certificatului existent sau None
+        """
+        record_id = self._serial_index.get(self._serial_key(serie, numar))
+        return None if record_id == exclude_id else record_id
+    
+    def _check_unique(self, certificate: Certificate, exclude_id: Optional[int] = None):
+        """
+        Verifică unicitatea seriei și numărului
+        
+        Raises:
+            ValueError: Dacă există deja un certificat cu aceeași serie și număr
+        """
+        if self.find_duplicate(certificate.serie_certificat, certificate.numar_certificat,
+                               exclude_id) is not None:
+            raise ValueError(
+                f"Există deja un certificat cu seria {certificate.serie_certificat} "
+                f"și numărul {certificate.numar_certificat}"
+            )
+    
+    def _row_of(self, certificate_id: int) -> int:
+        """
+        Returnează poziția rândului cu ID-ul dat
+        
+        Indexul păstrează pozițiile de la ultima reconstruire; poziția curentă
+        este cea din index minus numărul rândurilor șterse înaintea ei
+        (căutare binară), deci o ștergere nu mută intrările celorlalte ID-uri.
+        
+        Args:
+            certificate_id: ID-ul certificatului
+            
+        Returns:
+            Poziția rândului în DataFrame
+            
+        Raises:
+            KeyError: Dacă ID-ul nu există
+        """
+        try:
+            row = self._id_to_row[certificate_id]
+        except KeyError:
+            raise KeyError(f"ID inexistent: {certificate_id}") from None
+        return row - bisect.bisect_left(self._deleted_rows, row)
+    
+    def add_change_listener(self, listener: ChangeListener):
+        """
+        Înregistrează o funcție notificată după fiecare modificare
+        
+        Modificările unui singur certificat sunt transmise ca delte (operație,
+        ID, poziție în stocarea întoarsă de get_store), astfel încât afișarea
+        poate fi actualizată fără reîncărcare completă.
+        
+        Args:
+            listener: Funcția apelată cu (operație CHANGE_*, ID, poziție)
+        """
+        self._listeners.append(listener)
+    
+    def remove_change_listener(self, listener: ChangeListener):
+        """
+        Elimină o funcție înregistrată cu add_change_listener
+        
+        Args:
+            listener: Funcția de eliminat
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, op: str, certificate_id: int = -1, position: int = -1):
+        """Notifică ascultătorii; fără stocare construită, cere reîncărcarea"""
+        if self._store is None:
+            op, certificate_id, position = self.CHANGE_RESET, -1, -1
+        for listener in list(self._listeners):
+            try:
+                listener(op, certificate_id, position)
+            except Exception as e:
+                print(f"Eroare la notificarea modificării: {e}")
+    
+    def set_saver(self, saver):
+        """
+        Setează salvarea write-behind pentru rescrierile complete
+        
+        Args:
+            saver: Obiect cu metodele schedule(write_fn) și flush()
+                (ex. BackgroundSaver) sau None pentru salvare sincronă
+        """
+        self._saver = saver
+    
+    def _save(self):
+        """Rescrie complet sursa de date (în fundal dacă există un saver)"""
+        if self._saver is not None and self._engine.BACKGROUND_SAVE:
+            # Instantaneu al datelor: firul de salvare nu vede modificările ulterioare
+            engine = self._engine
+            snapshot = self.df.copy()
+            token = engine.snapshot_token()
+            self._saver.schedule(lambda: engine.save(snapshot, token))
+        else:
+            self._engine.save(self.df)
+    
+    def _save_now(self):
+        """
+        Rescrie sincron sursa de date, după salvările deja programate
+        
+        Folosită când eșecul scrierii trebuie tratat de apelant (de exemplu
+        pentru a reveni la datele anterioare); erorile sunt propagate.
+        """
+        if self._saver is not None:
+            # O salvare programată mai veche nu trebuie să suprascrie datele noi
+            self._saver.flush()
+        self._engine.save(self.df)
+    
+    def _persist(self, op: str, index: Optional[int] = None, data: Optional[dict] = None,
+                 record_id: Optional[int] = None):
+        """
+        Persistă o modificare deja aplicată asupra DataFrame-ului
+        
+        Args:
+            op: Tipul operației ('add', 'update', 'delete')
+            index: Poziția rândului (pentru 'update' și 'delete')
+            data: Valorile rândului (pentru 'add' și 'update')
+            record_id: ID-ul certificatului modificat
+        """
+        if self._engine.record(self.df, op, index=index, data=data, record_id=record_id):
+            self._save()
+    
+    def has_pending_changes(self) -> bool:
+        """
+        Verifică dacă există modificări nescrise încă în sursa de date
+        
+        Returns:
+            True dacă jurnalul conține intrări neintegrate
+        """
+        return self._engine is not None and self._engine.has_pending_changes()
+    
+    def checkpoint(self):
+        """Integrează modificările din jurnal în registrul Excel (doar după încărcare)"""
+        if self.loaded and self.has_pending_changes():
+            self._save()
+    
+    def flush(self):
+        """Integrează modificările pendinte și așteaptă finalizarea salvării"""
+        self.checkpoint()
+        if self._saver is not None:
+            self._saver.flush()
+    
+    def get_store(self) -> CertificateStore:
+        """
+        Returnează stocarea pe coloane a certificatelor valide
+        
+        Rândurile invalide sunt ignorate și păstrate în rejected_rows. Stocarea
+        este construită o singură dată și actualizată apoi la fiecare modificare.
+        
+        Returns:
+            Obiectul CertificateStore
+        """
+        if self._store is None:
+            self._store, self.rejected_rows = CertificateStore.from_dataframe(self.df)
+            self._report_rejected()
+        return self._store
+    
+    def _report_rejected(self):
+        """Afișează rândurile respinse la conversie"""
+        for error in self.rejected_rows:
+            print(f"Eroare la parsarea certificatului (rând {error.row + 2}, {error.column}): {error.reason}")
     
     def get_all_certificates(self) -> List[Certificate]:
         """
         Returnează toate certificatele
         
+        Rândurile invalide sunt ignorate și păstrate în rejected_rows.
+        
         Returns:
             Lista de obiecte Certificate
         """
-        certificates = []
+        return self.get_store().certificates()
+    
+    def get_certificate(self, certificate_id: int) -> Certificate:
+        """
+        Returnează certificatul cu ID-ul dat
         
-        # Dacă DataFrame-ul este gol, returnează listă goală
-        if self.df.empty:
-            return certificates
+        Args:
+            certificate_id: ID-ul certificatului
+            
+        Returns:
+            Obiectul Certificate
+            
+        Raises:
+            KeyError: Dacă ID-ul nu există
+            ValueError: Dacă rândul nu poate fi convertit în certificat
+        """
+        row = self._row_of(certificate_id)
+        certificates, errors = parse_certificates(self.df.iloc[[row]])
+        if not certificates:
+            raise ValueError(errors[0].reason if errors else "Rând gol")
+        return certificates[0]
+    
+    def get_expiring_certificates(self, days: int) -> List[Certificate]:
+        """
+        Returnează certificatele care expiră în următoarele zile (inclusiv cele expirate)
         
-        for _, row in self.df.iterrows():
-            try:
-                row_dict = row.to_dict()
-                
-                # Ignoră rânduri goale sau cu valori NaN
-                if pd.isna(row_dict.get('Nume')) or row_dict.get('Nume') == '':
-                    continue
-                
-                cert = Certificate.from_dict(row_dict)
-                certificates.append(cert)
-            except Exception as e:
-                print(f"Eroare la parsarea certificatului: {e}")
-                continue
-        return certificates
+        Certificatele sunt citite din stocarea pe coloane (get_store), în
+        ordinea rândurilor.
+        
+        Args:
+            days: Numărul de zile
+            
+        Returns:
+            Lista de obiecte Certificate
+        """
+        store = self.get_store()
+        return [store.certificate(position)
+                for position in np.flatnonzero(self.expiring_mask(days, store))]
+    
+    def _query_mask(self, store: CertificateStore, **criteria) -> Optional[np.ndarray]:
+        """
+        Selectează certificatele prin indecșii motorului de stocare
+        
+        Args:
+            store: Stocarea pe ale cărei poziții este construită masca
+            **criteria: Criteriile pentru StorageEngine.query_ids
+            
+        Returns:
+            Vector boolean pe pozițiile din stocare sau None dacă motorul nu
+            are indecși (Excel)
+        """
+        ids = self._engine.query_ids(**criteria)
+        if ids is None:
+            return None
+        # Potrivirea după ID funcționează și pe o stocare parțială (în timpul
+        # încărcării), iar rândurile invalide din bază nu sunt în stocare
+        return np.isin(store.ids, ids)
+    
+    def expiring_mask(self, days: int, store: Optional[CertificateStore] = None,
+                      today: Optional[date] = None) -> np.ndarray:
+        """
+        Masca certificatelor care expiră în următoarele zile (inclusiv expirate)
+        
+        Pentru SQLite interogarea folosește indexul pe data expirării; altfel
+        masca este calculată pe coloanele stocării.
+        
+        Args:
+            days: Numărul de zile
+            store: Stocarea (implicit get_store())
+            today: Data de referință (implicit data curentă)
+            
+        Returns:
+            Vector boolean pe pozițiile din stocare
+        """
+        store = store if store is not None else self.get_store()
+        today = today or date.today()
+        mask = self._query_mask(store, last_expiry=today + timedelta(days=days))
+        return mask if mask is not None else store.expiring_mask(days, today)
+    
+    def expiration_filter_mask(self, months: int, store: Optional[CertificateStore] = None,
+                               today: Optional[date] = None) -> np.ndarray:
+        """
+        Masca filtrului de expirare din tabel (luni calendaristice)
+        
+        Pentru SQLite interogarea folosește indexul pe data expirării; altfel
+        masca este calculată pe coloanele stocării.
+        
+        Args:
+            months: Numărul de luni (0 = toate, -1 = expirate, altfel = expiră în X luni)
+            store: Stocarea (implicit get_store())
+            today: Data de referință (implicit data curentă)
+            
+        Returns:
+            Vector boolean pe pozițiile din stocare
+        """
+        store = store if store is not None else self.get_store()
+        today = today or date.today()
+        limits = expiration_filter_range(months, today)
+        mask = None
+        if limits is not None:
+            mask = self._query_mask(store, first_expiry=limits[0], last_expiry=limits[1])
+        return mask if mask is not None else store.expiration_filter_mask(months, today)
+    
+    def level_mask(self, codes: List[int], store: Optional[CertificateStore] = None) -> np.ndarray:
+        """
+        Masca certificatelor cu anumite niveluri
+        
+        Pentru SQLite interogarea folosește indexul pe nivel; altfel masca
+        este calculată pe coloana de coduri a stocării.
+        
+        Args:
+            codes: Codurile nivelurilor (poziții în NIVELURI_CERTIFICATE)
+            store: Stocarea (implicit get_store())
+            
+        Returns:
+            Vector boolean pe pozițiile din stocare
+        """
+        store = store if store is not None else self.get_store()
+        mask = self._query_mask(store, levels=[NIVELURI_CERTIFICATE[code] for code in codes])
+        return mask if mask is not None else np.isin(store.columns['nivel_certificat'], codes)
     
     def add_certificate(self, certificate: Certificate):
         """
         Adaugă un certificat nou
         
         Args:
-            certificate: Obiect Certificate de adăugat
+            certificate: Obiect Certificate de adăugat (primește un ID nou)
+            
+        Raises:
+            ValueError: Dacă există deja un certificat cu aceeași serie și număr
         """
-        new_row = pd.DataFrame([certificate.to_dict()])
-        self.df = pd.concat([self.df, new_row], ignore_index=True)
-        self._save()
+        self._check_unique(certificate)
+        certificate.id = self._next_id
+        data = certificate.to_dict()
+        data[ID_COLUMN] = certificate.id
+        self._apply_add(data)
+        if self._store is not None:
+            # Rândul nou este ultimul din df, deci și ultimul din stocare
+            self._store.append(certificate)
+        self._persist('add', data=data, record_id=certificate.id)
+        self._notify(self.CHANGE_ADD, certificate.id,
+                     len(self._store) - 1 if self._store is not None else -1)
     
-    def update_certificate(self, index: int, certificate: Certificate):
+    def update_certificate(self, certificate_id: int, certificate: Certificate):
         """
         Actualizează un certificat existent
         
         Args:
-            index: Indexul rândului de actualizat
+            certificate_id: ID-ul certificatului de actualizat
             certificate: Noul obiect Certificate
+            
+        Raises:
+            KeyError: Dacă ID-ul nu există
+            ValueError: Dacă seria și numărul aparțin altui certificat
         """
-        if 0 <= index < len(self.df):
-            for col, value in certificate.to_dict().items():
-                self.df.at[index, col] = value
-            self._save()
-        else:
-            raise IndexError(f"Index invalid: {index}")
+        row = self._row_of(certificate_id)
+        self._check_unique(certificate, exclude_id=certificate_id)
+        certificate.id = certificate_id
+        data = certificate.to_dict()
+        self._apply_update(row, data)
+        self._update_store(certificate_id, certificate)
+        self._persist('update', index=row, data=data, record_id=certificate_id)
+        self._notify(self.CHANGE_UPDATE, certificate_id,
+                     self._store.position_of(certificate_id) if self._store is not None else -1)
     
-    def delete_certificate(self, index: int):
+    def delete_certificate(self, certificate_id: int):
         """
         Șterge un certificat
         
         Args:
-            index: Indexul rândului de șters
+            certificate_id: ID-ul certificatului de șters
+            
+        Raises:
+            KeyError: Dacă ID-ul nu există
         """
-        if 0 <= index < len(self.df):
-            self.df = self.df.drop(index).reset_index(drop=True)
-            self._save()
-        else:
-            raise IndexError(f"Index invalid: {index}")
+        row = self._row_of(certificate_id)
+        self._apply_delete(row)
+        position = -1
+        if self._store is not None:
+            try:
+                position = self._store.remove(certificate_id)
+            except KeyError:
+                # Rândul era respins la conversie, deci lipsea din stocare
+                self._store = None
+        self._persist('delete', index=row, record_id=certificate_id)
+        self._notify(self.CHANGE_DELETE, certificate_id, position)
+    
+    def _apply_add(self, data: dict):
+        """Adaugă un rând în DataFrame (fără persistare)"""
+        self.df = apply_change(self.df, 'add', data=data)
+        record_id = int(data[ID_COLUMN])
+        # Rândul nou este după toate rândurile șterse
+        self._id_to_row[record_id] = len(self.df) - 1 + len(self._deleted_rows)
+        self._next_id = max(self._next_id, record_id + 1)
+        self._serial_index[self._row_serial_key(len(self.df) - 1)] = record_id
+    
+    def _apply_update(self, index: int, data: dict):
+        """Actualizează un rând în DataFrame (fără persistare)"""
+        record_id = int(self.df.iloc[index][ID_COLUMN])
+        self._unindex_serial(index)
+        self.df = apply_change(self.df, 'update', index=index, data=data)
+        self._serial_index[self._row_serial_key(index)] = record_id
+    
+    def _apply_delete(self, index: int):
+        """Șterge un rând din DataFrame (fără persistare)"""
+        self._unindex_serial(index)
+        record_id = int(self.df.iloc[index][ID_COLUMN])
+        self.df = apply_change(self.df, 'delete', index=index)
+        # Rândurile de după cel șters urcă o poziție (vezi _row_of)
+        bisect.insort(self._deleted_rows, self._id_to_row.pop(record_id))
+        if len(self._deleted_rows) > self.ID_INDEX_REBUILD_DELETES:
+            self._rebuild_id_index()
+    
+    def _update_store(self, certificate_id: int, certificate: Certificate):
+        """Actualizează certificatul în stocarea pe coloane, dacă este construită"""
+        if self._store is None:
+            return
+        try:
+            self._store.update(certificate_id, certificate)
+        except KeyError:
+            # Rândul era respins la conversie; stocarea se reconstruiește
+            self._store = None
+    
+    def _unindex_serial(self, index: int):
+        """Scoate din indexul de unicitate cheia unui rând"""
+        key = self._row_serial_key(index)
+        if self._serial_index.get(key) == int(self.df.iloc[index][ID_COLUMN]):
+            del self._serial_index[key]
     
     def get_dataframe(self) -> pd.DataFrame:
         """
@@ -172,48 +695,142 @@ class DataManager:
         """
         return self.df.copy()
     
-    def import_from_excel(self, file_path: str) -> tuple[bool, str]:
+    def import_from_excel(self, file_path: str,
+                          progress_callback: Optional[ProgressCallback] = None,
+                          conflict_callback: Optional[ConflictCallback] = None) -> tuple[bool, str]:
         """
         Importă date dintr-un fișier Excel extern
         
+        Fișierul este citit și validat în flux, pe bucăți; datele sunt adăugate
+        doar dacă toate rândurile sunt valide (totul sau nimic). Certificatele
+        parsate la validare sunt reutilizate, fără o a doua parsare. La eșec,
+        lista completă a erorilor rămâne în import_errors.
+        
+        Certificatele care au aceeași serie și număr cu unul existent (sau cu
+        un rând anterior din același fișier) sunt tratate după modul ales de
+        conflict_callback (implicit CONFLICT_SKIP).
+        
         Args:
             file_path: Calea către fișierul de importat
+            progress_callback: Apelată după fiecare bucată cu (rânduri procesate,
+                total estimat); dacă întoarce False, importul este anulat
+            conflict_callback: Apelată cu numărul de duplicate, dacă există;
+                întoarce modul de rezolvare sau None pentru anulare
             
         Returns:
             Tuple (succes, mesaj)
         """
         try:
-            df_import = pd.read_excel(file_path)
+            result = StreamingImporter(file_path, progress_callback=progress_callback).run()
+            self.import_errors = result.errors
+            if not result.success:
+                return False, result.message
             
-            # Validează structura (fără Nr. care este generată automat)
-            required_columns = [col for col in COLUMN_NAMES if col != 'Nr.']
-            if not all(col in df_import.columns for col in required_columns):
-                missing = [col for col in required_columns if col not in df_import.columns]
-                return False, f"Lipsesc coloanele: {', '.join(missing)}"
+            keys = [self._serial_key(certificate.serie_certificat, certificate.numar_certificat)
+                    for certificate in result.certificates]
+            duplicates = len(keys) - len(set(keys) - self._serial_index.keys())
+            mode = self.CONFLICT_SKIP
+            if duplicates and conflict_callback is not None:
+                mode = conflict_callback(duplicates)
+                if mode is None:
+                    return False, "Import anulat"
             
-            # Validează fiecare rând
-            errors = []
-            for idx, row in df_import.iterrows():
-                try:
-                    Certificate.from_dict(row.to_dict())
-                except Exception as e:
-                    errors.append(f"Rând {idx + 2}: {str(e)}")
+            # Separă certificatele noi de cele care actualizează certificate existente
+            new_certificates: Dict[Tuple[str, str], Certificate] = {}
+            updates: Dict[int, Certificate] = {}
+            skipped = 0
+            for certificate, key in zip(result.certificates, keys):
+                existing_id = self._serial_index.get(key)
+                if existing_id is None and key not in new_certificates:
+                    new_certificates[key] = certificate
+                    continue
+                if mode == self.CONFLICT_SKIP:
+                    skipped += 1
+                    continue
+                if existing_id is None:
+                    current = new_certificates[key]
+                else:
+                    current = updates.get(existing_id) or self.get_certificate(existing_id)
+                if mode == self.CONFLICT_MERGE:
+                    certificate = self._merge_certificates(current, certificate)
+                if existing_id is None:
+                    new_certificates[key] = certificate
+                else:
+                    updates[existing_id] = certificate
             
-            if errors:
-                return False, "Erori de validare:\n" + "\n".join(errors[:5])
+            # Rândurile importate primesc ID-uri noi (ID-urile din fișier sunt ignorate)
+            added = list(new_certificates.values())
+            rows = certificates_to_frame(added)
+            rows[ID_COLUMN] = range(self._next_id, self._next_id + len(rows))
+            for certificate, record_id in zip(added, rows[ID_COLUMN].tolist()):
+                certificate.id = record_id
             
-            # Dacă totul e OK, adaugă datele (fără Nr. care este generată automat)
-            required_columns = [col for col in COLUMN_NAMES if col != 'Nr.']
-            # Selectează doar coloanele care există în df_import
-            cols_to_import = [col for col in required_columns if col in df_import.columns]
-            self.df = pd.concat([self.df, df_import[cols_to_import]], ignore_index=True)
-            self._save()
+            # Aplică totul deodată și salvează sincron; la eroare de salvare
+            # se revine la datele vechi, înainte de actualizarea stocării
+            previous_df = self.df.copy() if updates else self.df
+            for record_id, certificate in updates.items():
+                certificate.id = record_id
+                self._apply_update(self._row_of(record_id), certificate.to_dict())
+            self.df = pd.concat([self.df, rows], ignore_index=True)
+            self._rebuild_id_index()
+            self._rebuild_serial_index()
+            try:
+                self._save_now()
+            except Exception:
+                # Stocarea pe coloane nu a fost încă modificată
+                self.df = previous_df
+                self._rebuild_id_index()
+                self._rebuild_serial_index()
+                raise
+            for record_id, certificate in updates.items():
+                self._update_store(record_id, certificate)
+            if self._store is not None:
+                self._store.extend(added)
+            self._notify(self.CHANGE_RESET)
             
-            return True, f"Importate cu succes {len(df_import)} înregistrări"
+            message = f"Importate cu succes {len(added)} înregistrări"
+            if updates:
+                message += f", actualizate {len(updates)}"
+            if skipped:
+                message += f", ignorate {skipped} duplicate"
+            return True, message
             
         except Exception as e:
             return False, f"Eroare la import: {str(e)}"
     
+    @staticmethod
+    def _merge_certificates(existing: Certificate, imported: Certificate) -> Certificate:
+        """
+        Combină un certificat existent cu unul importat (CONFLICT_MERGE)
+        
+        Datele importate înlocuiesc datele existente, iar observațiile
+        ambelor certificate sunt păstrate.
+        
+        Returns:
+            Certificatul rezultat
+        """
+        notes = []
+        for note in (existing.observatii, imported.observatii):
+            if note and note not in notes:
+                notes.append(note)
+        return imported.replace(observatii="; ".join(notes), id=existing.id)
+    
+    def export_import_errors(self, file_path: str) -> tuple[bool, str]:
+        """
+        Exportă raportul complet al erorilor ultimului import (CSV sau Excel)
+        
+        Args:
+            file_path: Calea raportului (.csv sau .xlsx)
+            
+        Returns:
+            Tuple (succes, mesaj)
+        """
+        try:
+            count = write_error_report(self.import_errors, file_path)
+            return True, f"Raport salvat: {count} erori"
+        except Exception as e:
+            return False, f"Eroare la salvarea raportului: {str(e)}"
+    
     def export_to_excel(self, file_path: str) -> tuple[bool, str]:
         """
         Exportă datele într-un fișier Excel
@@ -228,19 +845,11 @@ class DataManager:
             export_path = Path(file_path)
             export_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with pd.ExcelWriter(export_path, engine='openpyxl') as writer:
-                self.df.to_excel(writer, index=False, sheet_name='Certificate')
-                
-                # Ajustează lățimea coloanelor
-                worksheet = writer.sheets['Certificate']
-                for idx, col in enumerate(self.df.columns):
-                    max_length = max(
-                        self.df[col].astype(str).apply(len).max(),
-                        len(col)
-                    ) if len(self.df) > 0 else len(col)
-                    worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+            # ID-ul este intern: exportul păstrează doar coloanele registrului
+            export_df = self.df.drop(columns=[ID_COLUMN], errors='ignore')
+            count = StreamingExcelExporter(export_df).write(export_path)
             
-            return True, f"Exportate cu succes {len(self.df)} înregistrări"
+            return True, f"Exportate cu succes {count} înregistrări"
             
         except Exception as e:
             return False, f"Eroare la export: {str(e)}"
@@ -252,5 +861,9 @@ class DataManager:
         Args:
             new_file_path: Calea către noul fișier
         """
+        # Integrează modificările pendinte în fișierul vechi înainte de schimbare
+        self.flush()
+        self._engine.close()
         self.file_path = Path(new_file_path)
         self._load_or_create()
+        self._notify(self.CHANGE_RESET)
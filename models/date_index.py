@@ -0,0 +1,129 @@
+"""
+Indexuri sortate pe coloanele de date, pentru interogări pe intervale
+"""
+import calendar
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def add_months(day: date, months: int) -> date:
+    """
+    Adaugă luni calendaristice unei date
+
+    Ziua este limitată la ultima zi a lunii rezultate (31.01 + 1 lună =
+    28.02 sau 29.02).
+
+    Args:
+        day: Data de pornire
+        months: Numărul de luni (poate fi negativ)
+
+    Returns:
+        Data rezultată
+    """
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+class DateIndex:
+    """
+    Pozițiile unei coloane de date ordinale, sortate după dată
+
+    Un interval de date este găsit prin căutare binară în vectorul sortat,
+    deci costă O(log n + k) pentru k rânduri găsite. La egalitate, pozițiile
+    rămân în ordinea lor din stocare.
+    """
+
+    def __init__(self, ordinals: np.ndarray):
+        """
+        Construiește indexul
+
+        Args:
+            ordinals: Datele (numere ordinale), pe pozițiile din stocare
+        """
+        self._order = np.argsort(ordinals, kind='stable').astype(np.int64)
+        self._keys = ordinals[self._order]
+
+    def __len__(self) -> int:
+        """Numărul de rânduri indexate"""
+        return len(self._keys)
+
+    def _bounds(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        """Capetele în vectorul sortat ale intervalului [start, end]"""
+        low = 0 if start is None else int(np.searchsorted(self._keys, start, 'left'))
+        high = len(self._keys) if end is None else int(np.searchsorted(self._keys, end, 'right'))
+        return low, max(low, high)
+
+    def _locate(self, position: int, ordinal: int) -> int:
+        """Indexul în vectorul sortat al unei poziții cu data dată"""
+        low, high = self._bounds(ordinal, ordinal)
+        return low + int(np.flatnonzero(self._order[low:high] == position)[0])
+
+    def positions(self, start: Optional[int] = None, end: Optional[int] = None) -> np.ndarray:
+        """
+        Returnează pozițiile cu data în intervalul [start, end]
+
+        Args:
+            start: Prima dată (ordinal, inclusiv; None = fără limită)
+            end: Ultima dată (ordinal, inclusiv; None = fără limită)
+
+        Returns:
+            Pozițiile, în ordinea datelor (vectorul nu trebuie modificat)
+        """
+        low, high = self._bounds(start, end)
+        return self._order[low:high]
+
+    def count(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        """Numărul de rânduri cu data în intervalul [start, end], în O(log n)"""
+        low, high = self._bounds(start, end)
+        return high - low
+
+    def extend(self, ordinals: np.ndarray, start: int):
+        """
+        Adaugă rânduri noi
+
+        Args:
+            ordinals: Datele rândurilor noi
+            start: Poziția primului rând nou
+        """
+        order = np.argsort(ordinals, kind='stable')
+        keys = ordinals[order]
+        at = np.searchsorted(self._keys, keys, 'right')
+        self._keys = np.insert(self._keys, at, keys)
+        self._order = np.insert(self._order, at, order + start)
+
+    def update(self, position: int, old: int, new: int):
+        """
+        Mută o poziție după schimbarea datei
+
+        Args:
+            position: Poziția rândului
+            old: Data anterioară
+            new: Noua dată
+        """
+        if old == new:
+            return
+        at = self._locate(position, old)
+        self._keys = np.delete(self._keys, at)
+        self._order = np.delete(self._order, at)
+        # Între datele egale, pozițiile rămân crescătoare
+        low, high = self._bounds(new, new)
+        at = low + int(np.searchsorted(self._order[low:high], position))
+        self._keys = np.insert(self._keys, at, new)
+        self._order = np.insert(self._order, at, position)
+
+    def remove(self, position: int, ordinal: int):
+        """
+        Șterge o poziție (pozițiile următoare scad cu unu)
+
+        Args:
+            position: Poziția rândului
+            ordinal: Data rândului
+        """
+        at = self._locate(position, ordinal)
+        self._keys = np.delete(self._keys, at)
+        self._order = np.delete(self._order, at)
+        self._order[self._order > position] -= 1
@@ -0,0 +1,141 @@
+"""
+Export Excel în flux (openpyxl write-only)
+"""
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import get_column_letter
+
+
+class StreamingExcelExporter:
+    """
+    Scrie un DataFrame într-un registru Excel în modul write-only
+
+    Rândurile sunt generate pe bucăți direct din coloane, fără obiecte celulă
+    openpyxl păstrate în memorie, astfel încât memoria rămâne constantă
+    indiferent de numărul de rânduri. Formatul write-only cere lățimile
+    coloanelor înaintea primului rând, așa că acestea sunt calculate în
+    prealabil, tot pe bucăți (vezi column_widths).
+    """
+
+    SHEET_NAME = 'Certificate'
+    CHUNK_SIZE = 5000
+    MAX_COLUMN_WIDTH = 50
+
+    def __init__(self, df: pd.DataFrame, sheet_name: str = SHEET_NAME):
+        """
+        Inițializează exportul
+
+        Args:
+            df: Datele de exportat
+            sheet_name: Numele foii de calcul
+        """
+        self.df = df
+        self.sheet_name = sheet_name
+
+    def column_widths(self) -> Dict[str, float]:
+        """
+        Calculează lățimea fiecărei coloane (literă Excel -> lățime)
+
+        Coloanele sunt parcurse pe bucăți de CHUNK_SIZE rânduri, deci memoria
+        folosită nu depinde de numărul total de rânduri. O coloană care a
+        atins deja lățimea maximă nu mai este parcursă.
+
+        Returns:
+            Dicționar cu lățimile coloanelor
+        """
+        # În modul write-only fiecare rând este scris direct în fișier, iar
+        # lățimile (<cols>) preced datele foii; ele trebuie deci cunoscute
+        # înainte de primul rând, de aceea sunt calculate într-o trecere separată
+        limit = self.MAX_COLUMN_WIDTH - 2
+        lengths = [len(str(col)) for col in self.df.columns]
+        pending = [idx for idx, length in enumerate(lengths) if length < limit]
+        for start in range(0, len(self.df), self.CHUNK_SIZE):
+            if not pending:
+                break
+            chunk = self.df.iloc[start:start + self.CHUNK_SIZE]
+            for idx in pending:
+                longest = chunk.iloc[:, idx].fillna('').astype(str).str.len().max()
+                lengths[idx] = max(lengths[idx], int(longest))
+            pending = [idx for idx in pending if lengths[idx] < limit]
+        return {get_column_letter(idx): min(length + 2, self.MAX_COLUMN_WIDTH)
+                for idx, length in enumerate(lengths, start=1)}
+
+    def iter_rows(self) -> Iterator[List]:
+        """
+        Generează rândurile de date (valorile lipsă devin celule goale)
+
+        Yields:
+            Lista valorilor unui rând
+        """
+        total = len(self.df)
+        for start in range(0, total, self.CHUNK_SIZE):
+            chunk = self.df.iloc[start:start + self.CHUNK_SIZE]
+            columns = [
+                chunk[col].astype(object).where(chunk[col].notna(), None).tolist()
+                for col in chunk.columns
+            ]
+            yield from zip(*columns)
+
+    def _header_cells(self, worksheet) -> List[WriteOnlyCell]:
+        """Creează celulele antetului (aldin, centrat, cu chenar)"""
+        thin = Side(style='thin')
+        cells = []
+        for col in self.df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(col))
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal='center', vertical='top')
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            cells.append(cell)
+        return cells
+
+    def write(self, file_path) -> int:
+        """
+        Scrie registrul pe disc
+
+        Args:
+            file_path: Calea fișierului de ieșire
+
+        Returns:
+            Numărul de rânduri de date scrise
+        """
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(self.sheet_name)
+
+        # Lățimile trebuie setate înainte de primul rând (modul write-only)
+        for letter, width in self.column_widths().items():
+            worksheet.column_dimensions[letter].width = width
+
+        worksheet.append(self._header_cells(worksheet))
+        count = 0
+        for row in self.iter_rows():
+            worksheet.append(row)
+            count += 1
+
+        workbook.save(str(Path(file_path)))
+        return count
+
+
+def benchmark_export(df: pd.DataFrame, file_path, repeat: int = 3) -> float:
+    """
+    Măsoară debitul exportului în flux
+
+    Args:
+        df: Datele de exportat
+        file_path: Fișierul temporar de ieșire
+        repeat: Numărul de repetări (se păstrează cea mai bună valoare)
+
+    Returns:
+        Rânduri scrise pe secundă
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        StreamingExcelExporter(df).write(file_path)
+        best = min(best, time.perf_counter() - start)
+    return len(df) / best if best > 0 else float('inf')
@@ -0,0 +1,190 @@
+"""
+Filtrele tabelului: câte o mască pe predicat, combinate cu AND
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from models.certificate_store import CertificateStore
+from models.data_manager import DataManager
+
+
+class FilterEngine:
+    """
+    Filtrele active ale tabelului (text, expirare, grad, nivel)
+
+    Fiecare predicat activ păstrează masca sa pe pozițiile din stocare, iar
+    rândurile afișate sunt AND-ul măștilor. La schimbarea unui predicat este
+    recalculată doar masca lui și sunt întoarse pozițiile care și-au schimbat
+    vizibilitatea, pentru a actualiza tabelul doar pe acestea. Numărul
+    rândurilor afișate este păstrat, deci este disponibil în O(1).
+
+    Cu un DataManager, filtrele de expirare și nivel sunt cerute managerului,
+    care folosește indecșii bazei de date când sursa este SQLite.
+    """
+
+    TEXT = 'text'
+    EXPIRY = 'expiry'
+    GRAD = 'grad'
+    NIVEL = 'nivel'
+
+    def __init__(self, data_manager: Optional[DataManager] = None):
+        """
+        Inițializează motorul (fără stocare și fără filtre)
+
+        Args:
+            data_manager: Managerul datelor filtrate (None = filtrare doar pe
+                coloanele stocării)
+        """
+        self._data_manager = data_manager
+        self._store: Optional[CertificateStore] = None
+        # Predicat -> parametrul său (doar predicatele active)
+        self._params: Dict[str, object] = {}
+        # Predicat -> masca sa pe pozițiile din stocare
+        self._masks: Dict[str, np.ndarray] = {}
+        self._mask: Optional[np.ndarray] = None
+        self._count = 0
+
+    @property
+    def mask(self) -> Optional[np.ndarray]:
+        """Masca rândurilor afișate (None = niciun filtru activ)"""
+        return self._mask
+
+    @property
+    def visible_count(self) -> int:
+        """Numărul rândurilor afișate"""
+        return self._count
+
+    def is_active(self) -> bool:
+        """Verifică dacă există cel puțin un filtru activ"""
+        return bool(self._params)
+
+    def set_store(self, store: CertificateStore):
+        """
+        Schimbă stocarea filtrată; filtrele active sunt recalculate
+
+        Args:
+            store: Stocarea certificatelor
+        """
+        self._store = store
+        self.refresh()
+
+    def refresh(self):
+        """Recalculează toate măștile (după o modificare a stocării)"""
+        self._masks = {name: self._predicate_mask(name, value)
+                       for name, value in self._params.items()}
+        self._mask = None
+        self._combine()
+
+    def set_text(self, query: str) -> np.ndarray:
+        """
+        Setează textul căutat (gol = fără filtru text)
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea
+        """
+        return self._set_predicate(self.TEXT, query if query.strip() else None)
+
+    def set_expiry(self, months: int) -> np.ndarray:
+        """
+        Setează filtrul de expirare
+
+        Args:
+            months: Numărul de luni (0 = toate, -1 = expirate, altfel = expiră în X luni)
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea
+        """
+        return self._set_predicate(self.EXPIRY, months or None)
+
+    def set_grades(self, codes: Optional[Iterable[int]]) -> np.ndarray:
+        """
+        Afișează doar anumite grade
+
+        Args:
+            codes: Codurile gradelor (poziții în GRADE_MILITARE; gol/None = toate)
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea
+        """
+        return self._set_predicate(self.GRAD, sorted(codes) if codes else None)
+
+    def set_levels(self, codes: Optional[Iterable[int]]) -> np.ndarray:
+        """
+        Afișează doar anumite niveluri de certificat
+
+        Args:
+            codes: Codurile nivelurilor (poziții în NIVELURI_CERTIFICATE; gol/None = toate)
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea
+        """
+        return self._set_predicate(self.NIVEL, sorted(codes) if codes else None)
+
+    def clear(self) -> np.ndarray:
+        """
+        Dezactivează toate filtrele
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea
+        """
+        self._params.clear()
+        self._masks.clear()
+        return self._combine()
+
+    def _set_predicate(self, name: str, value) -> np.ndarray:
+        """Activează (value nu este None) sau dezactivează un predicat"""
+        if value is None:
+            if name not in self._params:
+                return np.empty(0, dtype=np.int64)
+            del self._params[name]
+            del self._masks[name]
+        else:
+            self._params[name] = value
+            self._masks[name] = self._predicate_mask(name, value)
+        return self._combine()
+
+    def _predicate_mask(self, name: str, value) -> np.ndarray:
+        """Calculează masca unui predicat pe stocarea curentă"""
+        store = self._store
+        if store is None:
+            return np.ones(0, dtype=bool)
+        if name == self.TEXT:
+            return store.text_mask(value)
+        if name == self.EXPIRY:
+            if self._data_manager is not None:
+                return self._data_manager.expiration_filter_mask(value, store)
+            return store.expiration_filter_mask(value)
+        if name == self.GRAD:
+            return np.isin(store.columns['grad'], value)
+        if name == self.NIVEL:
+            if self._data_manager is not None:
+                return self._data_manager.level_mask(value, store)
+            return np.isin(store.columns['nivel_certificat'], value)
+        raise ValueError(f"Filtru necunoscut: {name}")
+
+    def _combine(self) -> np.ndarray:
+        """
+        Recalculează masca afișată și numărul de rânduri
+
+        Returns:
+            Pozițiile care și-au schimbat vizibilitatea față de masca anterioară
+        """
+        old = self._mask
+        size = len(self._store) if self._store is not None else 0
+        if self._masks:
+            self._mask = np.logical_and.reduce(list(self._masks.values()))
+            self._count = int(np.count_nonzero(self._mask))
+        else:
+            self._mask = None
+            self._count = size
+
+        if old is None and self._mask is None:
+            return np.empty(0, dtype=np.int64)
+        if old is None:
+            return np.flatnonzero(~self._mask)
+        if self._mask is None:
+            return np.flatnonzero(~old)
+        if len(old) != len(self._mask):
+            return np.arange(size)
+        return np.flatnonzero(old != self._mask)
@@ -0,0 +1,195 @@
+"""
+Import în flux (pe bucăți) al fișierelor Excel mari
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from models.certificate import Certificate
+from models.columnar import RowError, parse_certificates
+from models.storage import DATA_COLUMNS
+
+
+# Funcție de progres: (rânduri procesate, total estimat sau None) -> continuă?
+ProgressCallback = Callable[[int, Optional[int]], bool]
+
+
+@dataclass
+class ImportResult:
+    """Rezultatul unui import"""
+    success: bool
+    message: str
+    certificates: List[Certificate] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+    cancelled: bool = False
+
+
+class StreamingImporter:
+    """
+    Citește un fișier Excel rând cu rând (openpyxl read-only) și îl validează
+    pe bucăți de dimensiune fixă
+
+    În memorie sunt păstrate doar certificatele acceptate, nu și registrul
+    openpyxl complet. Progresul este raportat după fiecare
+    bucată, iar importul poate fi anulat din funcția de progres.
+    """
+
+    CHUNK_SIZE = 2000
+    # Numărul de erori afișate în mesaj (raportul complet este în errors)
+    MESSAGE_ERRORS = 10
+
+    def __init__(self, file_path: str, chunk_size: int = CHUNK_SIZE,
+                 progress_callback: Optional[ProgressCallback] = None):
+        """
+        Inițializează importul
+
+        Args:
+            file_path: Calea către fișierul de importat
+            chunk_size: Numărul de rânduri validate deodată
+            progress_callback: Apelată după fiecare bucată; dacă întoarce
+                False, importul este anulat
+        """
+        self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.total_rows: Optional[int] = None
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Generează bucățile fișierului ca DataFrame-uri
+
+        Indexul fiecărei bucăți este poziția rândului în fișier (fără antet),
+        astfel încât erorile să poată fi raportate cu numărul rândului din Excel.
+
+        Yields:
+            DataFrame cu rândurile bucății curente
+        """
+        if self.file_path.suffix.lower() not in ('.xlsx', '.xlsm'):
+            # Formatele vechi nu pot fi citite în flux - se citesc integral
+            df = pd.read_excel(self.file_path)
+            self.total_rows = len(df)
+            for start in range(0, len(df), self.chunk_size):
+                yield df.iloc[start:start + self.chunk_size]
+            return
+
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.active
+            if worksheet.max_row:
+                self.total_rows = max(worksheet.max_row - 1, 0)
+
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = [str(name).strip() if name is not None else '' for name in header]
+            yield pd.DataFrame(columns=header)
+
+            buffer = []
+            position = 0
+            for values in rows:
+                buffer.append(values)
+                if len(buffer) >= self.chunk_size:
+                    yield self._make_chunk(header, buffer, position)
+                    position += len(buffer)
+                    buffer = []
+            if buffer:
+                yield self._make_chunk(header, buffer, position)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _make_chunk(header: list, rows: list, start: int) -> pd.DataFrame:
+        """Construiește o bucată din rândurile brute"""
+        width = len(header)
+        rows = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+        chunk = pd.DataFrame(rows, columns=header)
+        chunk.index = pd.RangeIndex(start, start + len(rows))
+        return chunk
+
+    def run(self) -> ImportResult:
+        """
+        Execută importul: citire, validare și colectarea rândurilor acceptate
+
+        Fiecare rând este parsat o singură dată; certificatele rezultate sunt
+        păstrate pentru îmbinare. Toate bucățile sunt validate, chiar și după
+        prima eroare, astfel încât raportul de erori să fie complet.
+
+        Returns:
+            ImportResult; certificates conține rândurile acceptate doar dacă
+            importul a reușit în întregime
+        """
+        accepted: List[Certificate] = []
+        errors: List[RowError] = []
+        processed = 0
+        checked_columns = False
+
+        for chunk in self.iter_chunks():
+            if not checked_columns:
+                # Validează structura (fără Nr. care este generată automat)
+                missing = [col for col in DATA_COLUMNS if col not in chunk.columns]
+                if missing:
+                    return ImportResult(False, f"Lipsesc coloanele: {', '.join(missing)}")
+                checked_columns = True
+                if chunk.empty:
+                    continue
+
+            chunk = chunk[DATA_COLUMNS]
+            # Rândurile goale sunt ignorate de parsare
+            certificates, chunk_errors = parse_certificates(chunk)
+            errors.extend(chunk_errors)
+            if not errors:
+                accepted.extend(certificates)
+
+            processed += len(chunk)
+            if self.progress_callback and not self.progress_callback(processed, self.total_rows):
+                return ImportResult(False, "Import anulat", cancelled=True)
+
+        if not checked_columns:
+            return ImportResult(False, "Fișierul nu conține date")
+
+        if errors:
+            return ImportResult(False, self._errors_message(errors), errors=errors)
+
+        return ImportResult(True, f"Importate cu succes {len(accepted)} înregistrări",
+                            certificates=accepted)
+
+    @classmethod
+    def _errors_message(cls, errors: List[RowError]) -> str:
+        """Rezumatul erorilor de validare (primele MESSAGE_ERRORS erori)"""
+        rows = len({error.row for error in errors})
+        details = "\n".join(f"Rând {error.row + 2} ({error.column}): {error.reason}"
+                            for error in errors[:cls.MESSAGE_ERRORS])
+        if len(errors) > cls.MESSAGE_ERRORS:
+            details += f"\n... și încă {len(errors) - cls.MESSAGE_ERRORS} erori"
+        return f"Erori de validare: {len(errors)} erori în {rows} rânduri\n{details}"
+
+
+def write_error_report(errors: List[RowError], file_path: str) -> int:
+    """
+    Scrie raportul complet al erorilor de validare (CSV sau Excel)
+
+    Numerele rândurilor sunt cele din Excel (antetul este rândul 1).
+
+    Args:
+        errors: Erorile de raportat
+        file_path: Calea raportului (.csv sau .xlsx)
+
+    Returns:
+        Numărul de erori scrise
+    """
+    path = Path(file_path)
+    report = pd.DataFrame({
+        'Rând': [error.row + 2 for error in errors],
+        'Coloană': [error.column for error in errors],
+        'Motiv': [error.reason for error in errors],
+    })
+    if path.suffix.lower() == '.xlsx':
+        report.to_excel(path, index=False, sheet_name='Erori')
+    else:
+        # utf-8-sig pentru ca Excel să afișeze corect diacriticele
+        report.to_csv(path, index=False, encoding='utf-8-sig')
+    return len(report)
@@ -0,0 +1,201 @@
+"""
+Jurnal de modificări (append-only) pentru fișierul de date
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+
+class ChangeJournal:
+    """
+    Jurnal append-only al modificărilor care nu au fost încă scrise în registrul Excel
+
+    Fiecare modificare este scrisă ca o linie JSON într-un fișier alăturat
+    registrului (``<registru>.journal``). Prima linie a jurnalului conține
+    amprenta (dimensiune, mtime) registrului peste care se aplică intrările.
+    Dacă registrul a fost rescris după ultima intrare (checkpoint finalizat,
+    dar jurnalul nu a mai fost golit), amprenta nu mai corespunde, iar
+    intrările sunt considerate deja aplicate.
+
+    Intrările sunt numerotate cu o secvență crescătoare, astfel încât o
+    salvare făcută în fundal pe baza unui instantaneu să poată elimina din
+    jurnal doar intrările incluse în acel instantaneu. Pentru aceasta,
+    integrarea se face în două etape: antetul anunță mai întâi amprenta
+    noului registru și câte intrări conține acesta (``next``), apoi, după
+    înlocuirea registrului, jurnalul este rescris fără intrările integrate.
+    """
+
+    SUFFIX = ".journal"
+
+    def __init__(self, data_file: Path):
+        """
+        Inițializează jurnalul
+
+        Args:
+            data_file: Calea către registrul Excel asociat
+        """
+        self.data_file = Path(data_file)
+        self.path = self.data_file.with_name(self.data_file.name + self.SUFFIX)
+        # Secvența ultimei intrări scrise și secvența de la care începe fișierul
+        self.sequence = 0
+        self._base_sequence = 0
+        self._lock = threading.RLock()
+
+    @property
+    def entry_count(self) -> int:
+        """Numărul de intrări din jurnal neintegrate în registru"""
+        return self.sequence - self._base_sequence
+
+    @staticmethod
+    def _fingerprint(file_path: Path) -> Optional[dict]:
+        """
+        Returnează amprenta unui fișier
+
+        Args:
+            file_path: Calea către fișier
+
+        Returns:
+            Dicționar cu dimensiunea și mtime sau None dacă fișierul nu există
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _read_lines(self) -> List[str]:
+        """Citește liniile jurnalului (listă goală dacă nu există)"""
+        if not self.path.exists():
+            return []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def _rewrite(self, header: dict, lines: List[str]):
+        """Rescrie atomic jurnalul cu antetul și intrările date"""
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + '\n')
+            for line in lines:
+                f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def pending_entries(self) -> List[dict]:
+        """
+        Citește intrările neaplicate încă în registru
+
+        Returns:
+            Lista intrărilor, în ordinea în care au fost scrise
+        """
+        lines = self._read_lines()
+        if not lines:
+            return []
+
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            print(f"Jurnal corupt, se ignoră: {self.path}")
+            return []
+
+        if header.get('op') != 'base':
+            return []
+
+        current = self._fingerprint(self.data_file)
+        base = {'size': header.get('size'), 'mtime_ns': header.get('mtime_ns')}
+        following = header.get('next') or {}
+        if base == current:
+            skip = 0
+        elif {'size': following.get('size'), 'mtime_ns': following.get('mtime_ns')} == current:
+            # Registrul a fost înlocuit, dar jurnalul nu a mai fost golit
+            skip = following.get('skip', 0)
+        else:
+            # Registrul a fost rescris după jurnal - intrările sunt deja incluse
+            return []
+
+        entries = []
+        for line in lines[1:]:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Ultima linie poate fi incompletă după o cădere - nu a fost confirmată
+                break
+
+        if skip:
+            # Finalizează integrarea întreruptă: elimină intrările deja incluse
+            valid_lines = lines[1:len(entries) + 1]
+            self._rewrite({'op': 'base', **current}, valid_lines[skip:])
+            entries = entries[skip:]
+
+        self.sequence = len(entries)
+        self._base_sequence = 0
+        return entries
+
+    def append(self, op: str, **payload):
+        """
+        Adaugă o intrare în jurnal și o scrie pe disc (fsync)
+
+        Args:
+            op: Tipul operației ('add', 'update', 'delete')
+            **payload: Datele operației
+        """
+        entry = {'op': op, **payload}
+        with self._lock:
+            if not self.path.exists():
+                self.reset()
+
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.sequence += 1
+
+    def size_bytes(self) -> int:
+        """
+        Returnează dimensiunea jurnalului pe disc
+
+        Returns:
+            Dimensiunea în octeți (0 dacă jurnalul nu există)
+        """
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def fold(self, new_data_file: Path, upto_sequence: Optional[int] = None):
+        """
+        Înlocuiește registrul cu o versiune nouă și elimină intrările incluse în ea
+
+        Args:
+            new_data_file: Fișierul temporar cu noul registru
+            upto_sequence: Ultima secvență inclusă în noul registru; intrările
+                scrise după ea sunt păstrate (implicit se golește tot)
+        """
+        with self._lock:
+            if upto_sequence is None:
+                upto_sequence = self.sequence
+            folded = upto_sequence - self._base_sequence
+
+            # Etapa 1: anunță noul registru și câte intrări conține
+            lines = self._read_lines()
+            if lines:
+                header = json.loads(lines[0])
+                header['next'] = {**(self._fingerprint(new_data_file) or {}), 'skip': folded}
+                self._rewrite(header, lines[1:])
+
+            # Etapa 2: înlocuiește registrul (rename păstrează mtime)
+            os.replace(new_data_file, self.data_file)
+
+            # Etapa 3: păstrează doar intrările scrise după instantaneu
+            remaining = lines[1:][folded:] if lines else []
+            self._rewrite({'op': 'base', **(self._fingerprint(self.data_file) or {})}, remaining)
+            self._base_sequence = upto_sequence
+
+    def reset(self):
+        """Golește jurnalul și îl leagă de starea curentă a registrului"""
+        with self._lock:
+            self._rewrite({'op': 'base', **(self._fingerprint(self.data_file) or {})}, [])
+            self._base_sequence = self.sequence
@@ -0,0 +1,229 @@
+"""
+Cache binar pe coloane al registrului Excel, pentru pornire rapidă
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Tipurile celulelor din coloanele de tip object
+KIND_NULL = 0
+KIND_TEXT = 1
+KIND_DATETIME = 2
+KIND_INT = 3
+KIND_FLOAT = 4
+
+
+class ParsedDataCache:
+    """
+    Cache al tabelului citit din registru, într-un fișier .npz alăturat
+
+    Cheia cache-ului este formată din dimensiunea, mtime și hash-ul SHA-256
+    al registrului. Dacă cheia corespunde, tabelul este încărcat direct din
+    cache, fără parsarea XML a registrului. Fișierul conține doar vectori
+    numerici și text (fără pickle), deci nu poate executa cod la încărcare.
+    """
+
+    SUFFIX = ".cache.npz"
+    VERSION = 1
+
+    def __init__(self, data_file: Path):
+        """
+        Inițializează cache-ul
+
+        Args:
+            data_file: Calea către registrul Excel asociat
+        """
+        self.data_file = Path(data_file)
+        self.path = self.data_file.with_name(self.data_file.name + self.SUFFIX)
+
+    def compute_key(self) -> Optional[dict]:
+        """
+        Calculează cheia registrului (dimensiune, mtime, hash conținut)
+
+        Returns:
+            Dicționar cu cheia sau None dacă registrul nu există
+        """
+        try:
+            stat = self.data_file.stat()
+            digest = hashlib.sha256()
+            with open(self.data_file, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+        except OSError:
+            return None
+        return {
+            'version': self.VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest.hexdigest(),
+        }
+
+    def load(self, key: Optional[dict] = None) -> Optional[pd.DataFrame]:
+        """
+        Încarcă tabelul din cache dacă acesta corespunde registrului
+
+        Args:
+            key: Cheia registrului (calculată dacă lipsește)
+
+        Returns:
+            DataFrame-ul sau None dacă cache-ul lipsește ori este învechit
+        """
+        if not self.path.exists():
+            return None
+
+        key = key or self.compute_key()
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                if json.loads(str(data['__key__'])) != key:
+                    return None
+                columns = json.loads(str(data['__columns__']))
+                return pd.DataFrame({
+                    name: self._decode_column(data, idx)
+                    for idx, name in enumerate(columns)
+                }, columns=columns)
+        except Exception as e:
+            print(f"Cache invalid, se ignoră: {e}")
+            return None
+
+    def store(self, df: pd.DataFrame, key: Optional[dict] = None):
+        """
+        Scrie tabelul în cache (atomic)
+
+        Args:
+            df: Tabelul de salvat (exact cum a fost citit din registru)
+            key: Cheia registrului (calculată dacă lipsește)
+        """
+        key = key or self.compute_key()
+        if key is None:
+            return
+
+        arrays = {
+            '__key__': np.array(json.dumps(key)),
+            '__columns__': np.array(json.dumps([str(col) for col in df.columns])),
+        }
+        for idx, col in enumerate(df.columns):
+            arrays.update(self._encode_column(df[col], idx))
+
+        tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"Eroare la scrierea cache-ului: {e}")
+
+    def rebuild_async(self, df: pd.DataFrame, key: Optional[dict] = None) -> threading.Thread:
+        """
+        Reconstruiește cache-ul pe un fir de execuție separat
+
+        Args:
+            df: Tabelul citit din registru
+            key: Cheia registrului din momentul citirii
+
+        Returns:
+            Firul de execuție pornit
+        """
+        snapshot = df.copy()
+        thread = threading.Thread(target=self.store, args=(snapshot, key),
+                                  name="ParsedDataCache", daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _encode_column(values: pd.Series, idx: int) -> dict:
+        """Codifică o coloană în vectori numpy fără obiecte Python"""
+        prefix = f"c{idx}"
+        dtype = values.dtype
+        if (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_dtype(dtype)) \
+                and not pd.api.types.is_object_dtype(dtype):
+            return {f"{prefix}_values": values.to_numpy()}
+
+        count = len(values)
+        kinds = np.zeros(count, dtype=np.uint8)
+        numbers = np.zeros(count, dtype=np.float64)
+        integers = np.zeros(count, dtype=np.int64)
+        stamps = np.full(count, np.datetime64('NaT'), dtype='datetime64[us]')
+        texts = []
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        position = 0
+
+        for row, value in enumerate(values.tolist()):
+            if value is None or (isinstance(value, float) and np.isnan(value)) or value is pd.NaT:
+                kind = KIND_NULL
+            elif isinstance(value, str):
+                kind = KIND_TEXT
+            elif isinstance(value, (datetime, date)):
+                kind = KIND_DATETIME
+                stamps[row] = np.datetime64(pd.Timestamp(value), 'us')
+            elif isinstance(value, (bool, np.bool_)):
+                kind = KIND_TEXT
+                value = str(value)
+            elif isinstance(value, (int, np.integer)):
+                kind = KIND_INT
+                integers[row] = value
+            elif isinstance(value, (float, np.floating)):
+                kind = KIND_FLOAT
+                numbers[row] = value
+            else:
+                kind = KIND_TEXT
+                value = str(value)
+
+            kinds[row] = kind
+            if kind == KIND_TEXT:
+                texts.append(value)
+                position += len(value)
+            offsets[row + 1] = position
+
+        arrays = {
+            f"{prefix}_kinds": kinds,
+            f"{prefix}_text": np.frombuffer(''.join(texts).encode('utf-8'), dtype=np.uint8),
+            f"{prefix}_offsets": offsets,
+        }
+        # Vectorii auxiliari sunt scriși doar dacă coloana conține astfel de valori
+        if (kinds == KIND_INT).any():
+            arrays[f"{prefix}_int"] = integers
+        if (kinds == KIND_FLOAT).any():
+            arrays[f"{prefix}_float"] = numbers
+        if (kinds == KIND_DATETIME).any():
+            arrays[f"{prefix}_datetime"] = stamps
+        return arrays
+
+    @staticmethod
+    def _decode_column(data, idx: int) -> pd.Series:
+        """Reconstruiește o coloană codificată cu _encode_column"""
+        prefix = f"c{idx}"
+        if f"{prefix}_values" in data:
+            return pd.Series(data[f"{prefix}_values"])
+
+        kinds = data[f"{prefix}_kinds"]
+        offsets = data[f"{prefix}_offsets"]
+        text = data[f"{prefix}_text"].tobytes().decode('utf-8')
+
+        result = np.empty(len(kinds), dtype=object)
+        result[:] = None
+
+        rows = np.flatnonzero(kinds == KIND_TEXT)
+        starts = offsets[rows].tolist()
+        ends = offsets[rows + 1].tolist()
+        result[rows] = [text[start:end] for start, end in zip(starts, ends)]
+
+        rows = np.flatnonzero(kinds == KIND_DATETIME)
+        if len(rows):
+            result[rows] = list(pd.DatetimeIndex(data[f"{prefix}_datetime"][rows]))
+        rows = np.flatnonzero(kinds == KIND_INT)
+        if len(rows):
+            result[rows] = data[f"{prefix}_int"][rows].tolist()
+        rows = np.flatnonzero(kinds == KIND_FLOAT)
+        if len(rows):
+            result[rows] = data[f"{prefix}_float"][rows].tolist()
+
+        return pd.Series(result, dtype=object)
@@ -0,0 +1,198 @@
+"""
+Index de căutare text (n-grame) peste valorile afișate ale certificatelor
+"""
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.collation import search_key
+
+
+# Lungimea n-gramelor indexate
+NGRAM = 3
+
+
+def fold_text(text: str) -> str:
+    """
+    Normalizează un text pentru căutare: fără majuscule și fără diacritice
+
+    "Ștefan", "Ştefan" (sedilă) și "stefan" devin toate "stefan". Folosește
+    același tabel de litere ca ordonarea românească (utils.collation).
+
+    Args:
+        text: Textul
+
+    Returns:
+        Textul normalizat
+    """
+    return search_key(text)
+
+
+def ngrams(text: str) -> Set[str]:
+    """
+    Cheile de index ale unui text: n-gramele sale sau, dacă este mai scurt
+    decât NGRAM, textul întreg
+    """
+    if len(text) < NGRAM:
+        return {text}
+    return {text[start:start + NGRAM] for start in range(len(text) - NGRAM + 1)}
+
+
+class SearchIndex:
+    """
+    Index inversat pentru filtrul text al tabelului
+
+    Valorile distincte ale fiecărei coloane sunt normalizate (fold_text) și
+    primesc un număr; fiecare n-gram indică valorile care îl conțin. Pentru
+    fiecare coloană se păstrează numărul valorii de pe fiecare rând. O
+    interogare găsește întâi valorile potrivite (intersecția listelor
+    n-gramelor, verificată apoi ca subșir), apoi, vectorizat, rândurile lor
+    de pe coloanele în care apar, fără a parcurge textele tuturor rândurilor.
+    """
+
+    def __init__(self, display: Dict[str, List[str]]):
+        """
+        Construiește indexul
+
+        Args:
+            display: Textele afișate pe coloane (formatul display_columns)
+        """
+        self._columns = list(display)
+        # Numărul valorii -> textul normalizat și coloana în care apare
+        self._values: List[str] = []
+        self._value_columns: List[int] = []
+        self._value_columns_array: Optional[np.ndarray] = None
+        # (coloană, text afișat) -> numărul valorii
+        self._value_ids: Dict[Tuple[int, str], int] = {}
+        # n-gram -> numerele valorilor care îl conțin
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        # Coloană -> numărul valorii de pe fiecare rând
+        self._rows = [np.empty(0, dtype=np.int32) for _ in self._columns]
+        self.extend(display)
+
+    def __len__(self) -> int:
+        """Numărul de rânduri indexate"""
+        return len(self._rows[0]) if self._rows else 0
+
+    def _value_id(self, column: int, text: str) -> int:
+        """Numărul unei valori, adăugată în index dacă este nouă"""
+        key = (column, text)
+        value_id = self._value_ids.get(key)
+        if value_id is None:
+            value_id = len(self._values)
+            folded = fold_text(text)
+            self._values.append(folded)
+            self._value_columns.append(column)
+            self._value_columns_array = None
+            self._value_ids[key] = value_id
+            postings = self._postings
+            for gram in ngrams(folded):
+                postings[gram].add(value_id)
+        return value_id
+
+    def _column_ids(self, column: int, texts: List[str]) -> np.ndarray:
+        """Numerele valorilor unei coloane (fiecare text distinct, o dată)"""
+        codes, uniques = pd.factorize(np.array(texts, dtype=object))
+        value_ids = np.array([self._value_id(column, text) for text in uniques],
+                             dtype=np.int32)
+        return value_ids[codes]
+
+    def extend(self, display: Dict[str, List[str]]):
+        """
+        Adaugă rânduri la sfârșit
+
+        Args:
+            display: Textele rândurilor noi, pe coloane
+        """
+        for column, name in enumerate(self._columns):
+            self._rows[column] = np.concatenate([self._rows[column],
+                                                 self._column_ids(column, display[name])])
+        self._value_columns_array = np.array(self._value_columns, dtype=np.int32)
+
+    def update(self, position: int, display: Dict[str, List[str]]):
+        """
+        Înlocuiește valorile unui rând
+
+        Args:
+            position: Poziția rândului
+            display: Noile texte ale rândului, pe coloane (câte un element)
+        """
+        for column, name in enumerate(self._columns):
+            self._rows[column][position] = self._value_id(column, display[name][0])
+
+    def remove(self, position: int):
+        """
+        Șterge un rând (rândurile următoare urcă o poziție)
+
+        Valorile rămân în index; fără rânduri care să le folosească, nu mai
+        apar în rezultate.
+
+        Args:
+            position: Poziția rândului
+        """
+        self._rows = [np.delete(value_ids, position) for value_ids in self._rows]
+
+    def matching_values(self, query: str) -> np.ndarray:
+        """
+        Găsește valorile care conțin un text deja normalizat
+
+        Args:
+            query: Textul căutat (rezultatul fold_text, nevid)
+
+        Returns:
+            Numerele valorilor potrivite
+        """
+        if len(query) < NGRAM:
+            # Orice valoare care conține textul are o cheie care îl conține
+            matches = set().union(*(values for gram, values in self._postings.items()
+                                    if query in gram))
+        else:
+            postings = []
+            for start in range(len(query) - NGRAM + 1):
+                values = self._postings.get(query[start:start + NGRAM])
+                if values is None:
+                    return np.empty(0, dtype=np.int64)
+                postings.append(values)
+            # Intersecția pornește de la cea mai scurtă listă; n-gramele comune
+            # nu garantează subșirul, deci candidații sunt verificați
+            postings.sort(key=len)
+            matches = postings[0].intersection(*postings[1:])
+            if len(query) > NGRAM:
+                matches = [value_id for value_id in matches if query in self._values[value_id]]
+        return np.fromiter(matches, dtype=np.int64, count=len(matches))
+
+    def mask(self, query: str, within: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Caută un text (fără majuscule și diacritice) în toate coloanele
+
+        Args:
+            query: Textul căutat
+            within: Masca rândurilor candidate (de exemplu rezultatul unei
+                căutări al cărei text este cuprins în query); celelalte
+                rânduri nu sunt verificate
+
+        Returns:
+            Vector boolean, True pentru rândurile care conțin textul
+        """
+        query = fold_text(query.strip())
+        if not query:
+            return np.ones(len(self), dtype=bool) if within is None else within.copy()
+        matches = self.matching_values(query)
+        result = np.zeros(len(self), dtype=bool)
+        if len(matches) == 0:
+            return result
+
+        if self._value_columns_array is None:
+            self._value_columns_array = np.array(self._value_columns, dtype=np.int32)
+        hits = np.zeros(len(self._values), dtype=bool)
+        hits[matches] = True
+        rows = None if within is None else np.flatnonzero(within)
+        # Doar coloanele în care apare cel puțin o valoare potrivită
+        for column in np.unique(self._value_columns_array[matches]).tolist():
+            if rows is None:
+                result |= hits[self._rows[column]]
+            else:
+                result[rows] |= hits[self._rows[column][rows]]
+        return result
@@ -0,0 +1,594 @@
+"""
+Motoare de stocare pentru datele certificatelor (Excel, SQLite)
+"""
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from models.certificate import COLUMN_NAMES, ID_COLUMN
+from models.columnar import parse_date_column
+from models.exporter import StreamingExcelExporter
+from models.journal import ChangeJournal
+from models.parsed_cache import ParsedDataCache
+from utils.date_parser import try_parse_date
+
+
+# Coloanele persistate (fără Nr. care este generată automat)
+DATA_COLUMNS = [col for col in COLUMN_NAMES if col != 'Nr.']
+
+# Extensiile recunoscute pentru baze de date SQLite
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def row_of_id(df: pd.DataFrame, record_id: int) -> int:
+    """
+    Caută poziția rândului cu identificatorul dat (parcurge coloana ID)
+
+    Args:
+        df: DataFrame-ul curent
+        record_id: Identificatorul certificatului
+
+    Returns:
+        Poziția rândului
+
+    Raises:
+        KeyError: Dacă identificatorul nu există
+    """
+    if ID_COLUMN in df.columns:
+        ids = pd.to_numeric(df[ID_COLUMN], errors='coerce').to_numpy()
+        matches = np.flatnonzero(ids == record_id)
+        if len(matches):
+            return int(matches[0])
+    raise KeyError(f"ID inexistent: {record_id}")
+
+
+def split_frame(df: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Împarte un tabel în bucăți consecutive de rânduri
+
+    Args:
+        df: Tabelul
+        chunk_size: Numărul maxim de rânduri pe bucată
+
+    Yields:
+        Bucățile, cu indexul original (cel puțin una, goală pentru un tabel gol)
+    """
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Reunește bucățile citite cu iter_load într-un singur tabel
+
+    Bucățile goale (de exemplu doar antetul) contează doar dacă nu există
+    rânduri, pentru a nu schimba tipurile coloanelor.
+
+    Args:
+        chunks: Bucățile, în ordinea rândurilor (cel puțin una)
+
+    Returns:
+        Tabelul, cu rândurile numerotate de la 0
+    """
+    rows = [chunk for chunk in chunks if len(chunk)] or chunks[:1]
+    return pd.concat(rows, ignore_index=True)
+
+
+def apply_change(df: pd.DataFrame, op: str, index: Optional[int] = None,
+                 data: Optional[dict] = None, record_id: Optional[int] = None) -> pd.DataFrame:
+    """
+    Aplică o modificare asupra unui DataFrame (fără persistare)
+
+    Args:
+        df: DataFrame-ul curent
+        op: Tipul operației ('add', 'update', 'delete')
+        index: Poziția rândului (pentru 'update' și 'delete')
+        data: Valorile rândului (pentru 'add' și 'update')
+        record_id: Identificatorul rândului, folosit dacă poziția lipsește
+
+    Returns:
+        DataFrame-ul rezultat
+    """
+    if index is None and record_id is not None and op != 'add':
+        index = row_of_id(df, record_id)
+    if op == 'add':
+        new_row = pd.DataFrame([data])
+        return pd.concat([df, new_row], ignore_index=True)
+    if op == 'update':
+        for col, value in data.items():
+            # Coloanele citite ca numere (ex. număr certificat) devin text la
+            # prima valoare text, în loc de eroare de tip
+            if (col in df.columns and isinstance(value, str)
+                    and not pd.api.types.is_string_dtype(df[col].dtype)):
+                df[col] = df[col].astype(object)
+            df.at[index, col] = value
+        return df
+    if op == 'delete':
+        return df.drop(index).reset_index(drop=True)
+    raise ValueError(f"Operație necunoscută: {op}")
+
+
+class StorageEngine(ABC):
+    """Interfața comună pentru motoarele de stocare folosite de DataManager"""
+
+    # Dacă True, rescrierile complete pot fi făcute pe un fir de execuție separat
+    BACKGROUND_SAVE = False
+
+    def __init__(self, file_path: Path):
+        """
+        Inițializează motorul de stocare
+
+        Args:
+            file_path: Calea către fișierul de date
+        """
+        self.file_path = Path(file_path)
+
+    def exists(self) -> bool:
+        """
+        Verifică dacă sursa de date există deja
+
+        Returns:
+            True dacă fișierul există
+        """
+        return self.file_path.exists()
+
+    @abstractmethod
+    def load(self) -> pd.DataFrame:
+        """
+        Încarcă toate datele
+
+        Returns:
+            DataFrame cu toate înregistrările
+        """
+
+    def iter_load(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Încarcă datele pe bucăți, în ordinea rândurilor
+
+        Implicit datele sunt încărcate integral cu load() și apoi împărțite;
+        motoarele care pot citi în flux întorc prima bucată înainte de a
+        citi restul sursei.
+
+        Args:
+            chunk_size: Numărul maxim de rânduri pe bucată
+
+        Yields:
+            Bucăți cu indexul egal cu poziția rândului (cel puțin una; prima
+            poate fi goală, doar cu antetul)
+        """
+        yield from split_frame(self.load(), chunk_size)
+
+    @abstractmethod
+    def save(self, df: pd.DataFrame, token=None):
+        """
+        Rescrie complet sursa de date
+
+        Args:
+            df: DataFrame-ul de salvat
+            token: Marcajul obținut prin snapshot_token() în momentul în care
+                a fost copiat DataFrame-ul (pentru salvări în fundal)
+        """
+
+    @abstractmethod
+    def record(self, df: pd.DataFrame, op: str, index: Optional[int] = None,
+               data: Optional[dict] = None, record_id: Optional[int] = None) -> bool:
+        """
+        Persistă o modificare deja aplicată asupra DataFrame-ului
+
+        Args:
+            df: DataFrame-ul după modificare
+            op: Tipul operației ('add', 'update', 'delete')
+            index: Poziția rândului (pentru 'update' și 'delete')
+            data: Valorile rândului (pentru 'add' și 'update')
+            record_id: Identificatorul certificatului modificat
+
+        Returns:
+            True dacă sursa de date trebuie rescrisă complet prin save()
+        """
+
+    def snapshot_token(self):
+        """
+        Returnează un marcaj al modificărilor persistate până acum
+
+        Returns:
+            Marcajul de transmis lui save() sau None
+        """
+        return None
+
+    def has_pending_changes(self) -> bool:
+        """
+        Verifică dacă există modificări nescrise încă în sursa de date
+
+        Returns:
+            True dacă există modificări pendinte
+        """
+        return False
+
+    def expiring_rows(self, df: pd.DataFrame, days: int,
+                      today: Optional[date] = None) -> List[int]:
+        """
+        Returnează pozițiile certificatelor care expiră în următoarele zile
+        (inclusiv cele deja expirate)
+
+        Args:
+            df: DataFrame-ul curent
+            days: Numărul de zile
+            today: Data de referință (implicit data curentă)
+
+        Returns:
+            Lista pozițiilor rândurilor
+        """
+        if df.empty:
+            return []
+        today = today or date.today()
+        limit = pd.Timestamp(today + timedelta(days=days))
+        expirare = parse_date_column(df['Data expirare'])
+        return [int(pos) for pos in (expirare <= limit).to_numpy().nonzero()[0]]
+
+    def query_ids(self, first_expiry: Optional[date] = None, last_expiry: Optional[date] = None,
+                  levels: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """
+        Selectează certificatele prin indecșii sursei de date
+
+        Criteriile date sunt combinate cu AND; cele lăsate None nu filtrează.
+
+        Args:
+            first_expiry: Prima dată de expirare acceptată (inclusiv)
+            last_expiry: Ultima dată de expirare acceptată (inclusiv)
+            levels: Nivelurile de certificat acceptate (ex. ['S', 'SS'])
+
+        Returns:
+            ID-urile certificatelor găsite sau None dacă sursa nu are indecși
+            (certificatele sunt filtrate atunci în memorie)
+        """
+        return None
+
+    def close(self):
+        """Eliberează resursele motorului de stocare"""
+
+
+class ExcelStorageEngine(StorageEngine):
+    """Stocare într-un registru Excel (.xlsx), cu jurnal de modificări opțional"""
+
+    BACKGROUND_SAVE = True
+
+    # Praguri după care jurnalul este integrat automat în registru
+    JOURNAL_MAX_ENTRIES = 200
+    JOURNAL_MAX_BYTES = 256 * 1024
+
+    def __init__(self, file_path: Path, journal_mode: bool = False):
+        """
+        Inițializează motorul Excel
+
+        Args:
+            file_path: Calea către fișierul Excel
+            journal_mode: Dacă True, modificările sunt scrise în jurnal și
+                integrate în registru doar la checkpoint
+        """
+        super().__init__(file_path)
+        self.journal_mode = journal_mode
+        self._journal = ChangeJournal(self.file_path)
+        self._cache = ParsedDataCache(self.file_path)
+
+    def load(self) -> pd.DataFrame:
+        """Încarcă registrul (din cache dacă e valid) și reaplică modificările din jurnal"""
+        key = self._cache.compute_key()
+        df = self._cache.load(key)
+        if df is None:
+            df = pd.read_excel(self.file_path)
+            # Cache-ul este reconstruit în fundal pentru pornirea următoare
+            self._cache.rebuild_async(df, key)
+        return self._replay_journal(df, self._journal.pending_entries())
+
+    def iter_load(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Încarcă registrul pe bucăți
+
+        Fără cache valid și fără intrări în jurnal, registrul este citit în
+        flux (openpyxl read-only), deci prima bucată este disponibilă după
+        parsarea primelor rânduri, nu a întregului fișier. Altfel tabelul
+        complet (cache sau jurnal reaplicat) este împărțit în bucăți.
+        """
+        entries = self._journal.pending_entries()
+        key = self._cache.compute_key()
+        df = self._cache.load(key)
+        if df is None and not entries:
+            # Importul depinde de acest modul (DATA_COLUMNS)
+            from models.importer import StreamingImporter
+
+            chunks = []
+            for chunk in StreamingImporter(self.file_path, chunk_size).iter_chunks():
+                chunks.append(chunk)
+                yield chunk
+            if not chunks:
+                # Foaie fără antet
+                chunks.append(pd.DataFrame())
+                yield chunks[0]
+            self._cache.rebuild_async(concat_chunks(chunks), key)
+            return
+
+        if df is None:
+            df = pd.read_excel(self.file_path)
+            self._cache.rebuild_async(df, key)
+        yield from split_frame(self._replay_journal(df, entries), chunk_size)
+
+    def _replay_journal(self, df: pd.DataFrame, entries: List[dict]) -> pd.DataFrame:
+        """Reaplică intrările din jurnal (și le integrează, dacă este cazul)"""
+        for entry in entries:
+            try:
+                df = apply_change(df, entry.get('op'), entry.get('index'), entry.get('data'),
+                                  entry.get('id'))
+            except KeyError as e:
+                print(f"Intrare din jurnal ignorată: {e}")
+
+        if entries and (not self.journal_mode or self._needs_checkpoint()):
+            self.save(df)
+
+        return df
+
+    def save(self, df: pd.DataFrame, token=None):
+        """Rescrie registrul Excel (atomic) și elimină din jurnal intrările incluse"""
+        # Asigură că directorul există
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Scrie într-un fișier temporar și îl înlocuiește atomic pe cel vechi,
+        # astfel încât o cădere în timpul scrierii să nu corupă registrul
+        tmp_path = self.file_path.with_name(f"~{self.file_path.stem}.tmp.xlsx")
+
+        try:
+            # Salvează în flux, cu lățimile coloanelor ajustate
+            StreamingExcelExporter(df).write(tmp_path)
+
+            if self.journal_mode or self._journal.path.exists():
+                self._journal.fold(tmp_path, token)
+            else:
+                os.replace(tmp_path, self.file_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Tabelul salvat este exact conținutul noului registru
+        self._cache.store(df)
+
+    def record(self, df: pd.DataFrame, op: str, index: Optional[int] = None,
+               data: Optional[dict] = None, record_id: Optional[int] = None) -> bool:
+        """Scrie modificarea în jurnal (mod jurnal) sau cere rescrierea registrului"""
+        if not self.journal_mode:
+            return True
+
+        # Intrările sunt adresate prin ID, nu prin poziție
+        payload = {}
+        if record_id is not None:
+            payload['id'] = record_id
+        elif index is not None:
+            payload['index'] = index
+        if data is not None:
+            payload['data'] = data
+        self._journal.append(op, **payload)
+        return self._needs_checkpoint()
+
+    def _needs_checkpoint(self) -> bool:
+        """Verifică dacă jurnalul a depășit pragurile de integrare"""
+        return (self._journal.entry_count >= self.JOURNAL_MAX_ENTRIES or
+                self._journal.size_bytes() >= self.JOURNAL_MAX_BYTES)
+
+    def snapshot_token(self):
+        """Returnează secvența ultimei intrări din jurnal"""
+        return self._journal.sequence
+
+    def has_pending_changes(self) -> bool:
+        """Verifică dacă jurnalul conține intrări neintegrate"""
+        return self._journal.entry_count > 0
+
+
+class SQLiteStorageEngine(StorageEngine):
+    """
+    Stocare într-o bază de date SQLite, cu indecși pe serie/număr, nivel
+    și data expirării
+
+    Datele sunt păstrate în format ISO (AAAA-LL-ZZ) pentru a permite
+    interogări pe intervale direct în baza de date. Cheia primară este
+    identificatorul stabil al certificatului (coloana ID).
+    """
+
+    # Maparea coloanelor din baza de date la coloanele din DataFrame
+    COLUMN_MAP = [
+        ('grad', 'Grad'),
+        ('nume', 'Nume'),
+        ('prenume', 'Prenume'),
+        ('data_nasterii', 'Data nașterii'),
+        ('serie_certificat', 'Serie certificat'),
+        ('numar_certificat', 'Număr certificat'),
+        ('nivel_certificat', 'Nivel certificat'),
+        ('data_eliberare', 'Data eliberare'),
+        ('data_expirare', 'Data expirare'),
+        ('observatii', 'Observații'),
+    ]
+    DATE_FIELDS = ('data_nasterii', 'data_eliberare', 'data_expirare')
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS certificate (
+            id INTEGER PRIMARY KEY,
+            grad TEXT,
+            nume TEXT,
+            prenume TEXT,
+            data_nasterii TEXT,
+            serie_certificat TEXT,
+            numar_certificat TEXT,
+            nivel_certificat TEXT,
+            data_eliberare TEXT,
+            data_expirare TEXT,
+            observatii TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_certificate_serie_numar
+            ON certificate (serie_certificat, numar_certificat);
+        CREATE INDEX IF NOT EXISTS idx_certificate_nivel
+            ON certificate (nivel_certificat);
+        CREATE INDEX IF NOT EXISTS idx_certificate_data_expirare
+            ON certificate (data_expirare);
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Inițializează motorul SQLite
+
+        Args:
+            file_path: Calea către baza de date
+        """
+        super().__init__(file_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Deschide o conexiune nouă și creează schema, dacă lipsește"""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.file_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Deschide (o singură dată) conexiunea folosită pentru scrieri"""
+        if self._conn is None:
+            self._conn = self._open_connection()
+        return self._conn
+
+    @staticmethod
+    def _to_iso(value) -> Optional[str]:
+        """Convertește o dată (DD.MM.YYYY, date, Timestamp sau serial Excel) în format ISO"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        parsed = try_parse_date(value)
+        if parsed is None:
+            return str(value).strip()
+        return parsed.isoformat()
+
+    def _row_values(self, data: dict) -> list:
+        """Transformă un rând din DataFrame în valori pentru SQL"""
+        values = []
+        for field, column in self.COLUMN_MAP:
+            value = data.get(column)
+            if field in self.DATE_FIELDS:
+                value = self._to_iso(value)
+            elif value is None or (isinstance(value, float) and pd.isna(value)):
+                value = None
+            else:
+                value = str(value)
+            values.append(value)
+        return values
+
+    def load(self) -> pd.DataFrame:
+        """
+        Încarcă toate înregistrările, cu datele în format DD.MM.YYYY
+
+        Citirea folosește o conexiune proprie, închisă la final: încărcarea
+        poate rula pe un fir de fundal, iar o conexiune SQLite poate fi
+        folosită doar pe firul care a creat-o (scrierile rămân pe firul GUI).
+        """
+        select = ", ".join(
+            f"COALESCE(strftime('%d.%m.%Y', {field}), {field}) AS \"{column}\""
+            if field in self.DATE_FIELDS else f"{field} AS \"{column}\""
+            for field, column in self.COLUMN_MAP
+        )
+        conn = self._open_connection()
+        try:
+            return pd.read_sql_query(
+                f"SELECT {select}, id AS \"{ID_COLUMN}\" FROM certificate ORDER BY id", conn
+            )
+        finally:
+            conn.close()
+
+    def save(self, df: pd.DataFrame, token=None):
+        """Rescrie complet tabelul într-o singură tranzacție"""
+        conn = self._connect()
+        fields = [field for field, _ in self.COLUMN_MAP]
+        placeholders = ", ".join("?" for _ in range(len(fields) + 1))
+        rows = [
+            [int(data[ID_COLUMN])] + self._row_values(data)
+            for data in df.to_dict('records')
+        ]
+        with conn:
+            conn.execute("DELETE FROM certificate")
+            conn.executemany(
+                f"INSERT INTO certificate (id, {', '.join(fields)}) VALUES ({placeholders})",
+                rows
+            )
+
+    def record(self, df: pd.DataFrame, op: str, index: Optional[int] = None,
+               data: Optional[dict] = None, record_id: Optional[int] = None) -> bool:
+        """Persistă modificarea printr-o singură instrucțiune SQL pe cheia primară"""
+        conn = self._connect()
+        fields = [field for field, _ in self.COLUMN_MAP]
+        with conn:
+            if op == 'add':
+                placeholders = ", ".join("?" for _ in range(len(fields) + 1))
+                conn.execute(
+                    f"INSERT INTO certificate (id, {', '.join(fields)}) VALUES ({placeholders})",
+                    [record_id] + self._row_values(data)
+                )
+            elif op == 'update':
+                assignments = ", ".join(f"{field} = ?" for field in fields)
+                conn.execute(
+                    f"UPDATE certificate SET {assignments} WHERE id = ?",
+                    self._row_values(data) + [record_id]
+                )
+            elif op == 'delete':
+                conn.execute("DELETE FROM certificate WHERE id = ?", (record_id,))
+            else:
+                raise ValueError(f"Operație necunoscută: {op}")
+        return False
+
+    def expiring_rows(self, df: pd.DataFrame, days: int,
+                      today: Optional[date] = None) -> List[int]:
+        """Interoghează indexul pe data expirării în loc să parcurgă DataFrame-ul"""
+        today = today or date.today()
+        ids = self.query_ids(last_expiry=today + timedelta(days=days))
+        if not len(ids) or ID_COLUMN not in df.columns:
+            return []
+        matches = np.isin(pd.to_numeric(df[ID_COLUMN], errors='coerce').to_numpy(), ids)
+        return np.flatnonzero(matches).tolist()
+
+    def query_ids(self, first_expiry: Optional[date] = None, last_expiry: Optional[date] = None,
+                  levels: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """Interoghează indecșii pe nivel și pe data expirării (datele ISO se compară ca text)"""
+        conditions, params = [], []
+        if first_expiry is not None:
+            conditions.append("data_expirare >= ?")
+            params.append(first_expiry.isoformat())
+        if last_expiry is not None:
+            conditions.append("data_expirare <= ?")
+            params.append(last_expiry.isoformat())
+        if levels is not None:
+            conditions.append(f"nivel_certificat IN ({', '.join('?' for _ in levels)})")
+            params.extend(levels)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self._connect().execute(f"SELECT id FROM certificate{where}", params)
+        return np.fromiter((rowid for (rowid,) in cursor), dtype=np.int64)
+
+    def close(self):
+        """Închide conexiunea la baza de date"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def create_storage_engine(file_path, journal_mode: bool = False) -> StorageEngine:
+    """
+    Creează motorul de stocare potrivit pentru fișierul dat
+
+    Args:
+        file_path: Calea către fișierul de date
+        journal_mode: Activează jurnalul de modificări (doar pentru Excel)
+
+    Returns:
+        Motorul de stocare (SQLite pentru .db/.sqlite, altfel Excel)
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in SQLITE_SUFFIXES:
+        return SQLiteStorageEngine(file_path)
+    return ExcelStorageEngine(file_path, journal_mode=journal_mode)
@@ -0,0 +1,46 @@
+"""
+Configurarea comună a testelor
+"""
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+# Testele rulează fără afișaj și importă modulele din rădăcina proiectului
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.certificate import Certificate
+
+
+def make_certificate(serie: str = 'AB', numar: str = '1', nume: str = 'Popescu',
+                     expira_peste: int = 365, **changes) -> Certificate:
+    """
+    Creează un certificat valid pentru teste
+
+    Args:
+        serie: Seria certificatului
+        numar: Numărul certificatului
+        nume: Numele titularului
+        expira_peste: Zilele rămase până la expirare (negativ = expirat)
+        **changes: Alte câmpuri ale certificatului
+
+    Returns:
+        Obiectul Certificate
+    """
+    today = date.today()
+    fields = dict(grad='Cpt.', nume=nume, prenume='Ion', data_nasterii=date(1980, 5, 17),
+                  serie_certificat=serie, numar_certificat=numar, nivel_certificat='S',
+                  data_eliberare=today - timedelta(days=1000),
+                  data_expirare=today + timedelta(days=expira_peste), observatii='')
+    fields.update(changes)
+    return Certificate(**fields)
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """Aplicația Qt (una pe sesiune), pentru testele cu fire și modele Qt"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
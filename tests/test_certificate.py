@@ -0,0 +1,66 @@
+"""
+Teste pentru modelul certificatului (models.certificate)
+"""
+from datetime import date
+
+import pytest
+
+from models.certificate import (Certificate, GRAD_CODES, NIVEL_CODES, STATUS_ATENTIE,
+                                STATUS_COLORS, STATUS_EXPIRAT, STATUS_URGENT, STATUS_VALID,
+                                expiry_status)
+from tests.conftest import make_certificate
+
+
+def test_compact_representation():
+    certificate = make_certificate()
+    assert not hasattr(certificate, '__dict__')
+    assert certificate._grad == GRAD_CODES['Cpt.']
+    assert certificate._nivel == NIVEL_CODES['S']
+    assert certificate._data_nasterii == date(1980, 5, 17).toordinal()
+    assert certificate.grad == 'Cpt.' and certificate.data_nasterii == date(1980, 5, 17)
+
+
+@pytest.mark.parametrize('changes, message', [
+    ({'grad': 'Căpitan'}, 'Grad invalid'),
+    ({'nivel_certificat': 'X'}, 'Nivel certificat invalid'),
+    ({'data_nasterii': '17.05.1980'}, 'Data nașterii trebuie să fie de tip date'),
+    ({'data_expirare': date(2000, 1, 1)}, 'Data expirare trebuie să fie după data eliberare'),
+])
+def test_validation(changes, message):
+    with pytest.raises(ValueError, match=message):
+        make_certificate(**changes)
+
+
+def test_from_codes_equals_validated_constructor():
+    certificate = make_certificate(id=5)
+    copy = Certificate.from_codes(
+        certificate._grad, certificate.nume, certificate.prenume, certificate._data_nasterii,
+        certificate.serie_certificat, certificate.numar_certificat, certificate._nivel,
+        certificate._data_eliberare, certificate._data_expirare, certificate.observatii, 5)
+    assert copy == certificate
+
+
+def test_replace_and_dict_round_trip():
+    certificate = make_certificate(observatii='nota')
+    changed = certificate.replace(nume='Ionescu')
+    assert changed.nume == 'Ionescu' and certificate.nume == 'Popescu'
+    assert changed != certificate
+    assert Certificate.from_dict(certificate.to_dict()) == certificate
+    assert certificate.to_dict()['Data nașterii'] == '17.05.1980'
+
+
+@pytest.mark.parametrize('zile, status', [
+    (-1, STATUS_EXPIRAT), (0, STATUS_URGENT), (30, STATUS_URGENT),
+    (31, STATUS_ATENTIE), (90, STATUS_ATENTIE), (91, STATUS_VALID),
+])
+def test_expiry_status_limits(zile, status):
+    assert expiry_status(zile) == status
+
+
+def test_days_and_color_use_reference_date():
+    certificate = make_certificate(data_expirare=date(2030, 1, 31))
+    today = date(2029, 12, 1)
+    assert certificate.zile_pana_la_expirare(today) == 61
+    assert certificate.get_status_color(today) == STATUS_COLORS[STATUS_ATENTIE]
+    assert certificate.get_status_color(date(2030, 2, 1)) == STATUS_COLORS[STATUS_EXPIRAT]
+    assert certificate.zile_pana_la_expirare() == (date(2030, 1, 31) - date.today()).days
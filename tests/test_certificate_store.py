@@ -0,0 +1,140 @@
+"""
+Teste pentru stocarea pe coloane (models.certificate_store)
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate import expiry_status
+from models.certificate_store import CertificateStore, format_ordinals
+from tests.conftest import make_certificate
+
+
+def _certificates(count: int):
+    """Certificate cu ID-uri 1..count și nume diferite"""
+    names = ['Popescu', 'Ștefănescu', 'Ionescu', 'Țurcanu', 'Albu', 'Ălbescu']
+    return [make_certificate(numar=str(index), nume=names[index % len(names)],
+                             expira_peste=index * 40 - 100, id=index)
+            for index in range(1, count + 1)]
+
+
+def _derived(store: CertificateStore) -> dict:
+    """Toate datele derivate ale stocării, construite sau actualizate"""
+    today = date.today()
+    return {
+        'positions': [store.position_of(record_id) for record_id in store.ids.tolist()],
+        'display': {column: list(values) for column, values in store.display_columns().items()},
+        'longest': dict(store.longest_texts()),
+        'search': store.text_mask('escu').tolist(),
+        'dates': sorted(store.date_range('data_expirare', today, today + timedelta(days=200)).tolist()),
+        'ranks': store.sort_keys('nume').tolist(),
+        'collation': store.collation_keys('prenume').tolist(),
+        'status': store.expiry(today).status.tolist(),
+    }
+
+
+def test_from_dataframe_reports_invalid_rows():
+    df = make_certificates_df(20)
+    df.loc[3, 'Grad'] = 'Căpitan'
+    store, errors = CertificateStore.from_dataframe(df)
+    assert len(store) == 19
+    assert [error.row for error in errors] == [3]
+
+
+def test_certificate_round_trip():
+    certificates = _certificates(5)
+    store = CertificateStore.from_certificates(certificates)
+    assert store.ids.tolist() == [1, 2, 3, 4, 5]
+    assert store.position_of(4) == 3
+    assert store.certificate(3) == certificates[3]
+    assert store.certificates() == certificates
+    with pytest.raises(KeyError):
+        store.position_of(99)
+
+
+def test_display_columns_format_codes_and_dates():
+    store = CertificateStore.from_certificates([make_certificate(id=1)])
+    display = store.display_columns()
+    assert display['Grad'] == ['Cpt.']
+    assert display['Nivel certificat'] == ['S']
+    assert display['Data nașterii'] == ['17.05.1980']
+    assert 'Nr.' not in display
+
+
+def test_format_ordinals():
+    ordinals = np.array([date(2024, 2, 29).toordinal(), date(2001, 1, 1).toordinal(),
+                         date(2024, 2, 29).toordinal()])
+    assert format_ordinals(ordinals) == ['29.02.2024', '01.01.2001', '29.02.2024']
+
+
+def test_deltas_keep_derived_data_consistent():
+    store = CertificateStore.from_certificates(_certificates(12))
+    _derived(store)
+
+    store.append(make_certificate(numar='100', nume='Șerban', expira_peste=10, id=100))
+    store.update(5, make_certificate(numar='5', nume='Constantinescu-Marinescu',
+                                     prenume='Ana', expira_peste=-3))
+    assert store.remove(2) == 1
+    store.extend([make_certificate(numar='101', nume='Ăvram', id=101),
+                  make_certificate(numar='102', nume='Dan', expira_peste=60, id=102)])
+    store.remove(12)
+
+    fresh = CertificateStore.from_certificates(store.certificates())
+    assert _derived(store) == _derived(fresh)
+    assert store.certificate(store.position_of(5)).nume == 'Constantinescu-Marinescu'
+
+
+def test_update_shrinking_longest_text():
+    store = CertificateStore.from_certificates([
+        make_certificate(numar='1', nume='Foarte-Lung-Nume-De-Familie', id=1),
+        make_certificate(numar='2', nume='Scurt', id=2),
+    ])
+    assert store.longest_texts()['Nume'] == 'Foarte-Lung-Nume-De-Familie'
+    store.update(1, make_certificate(numar='1', nume='Pop'))
+    assert store.longest_texts()['Nume'] == 'Scurt'
+
+
+def test_text_mask_folds_diacritics_and_refines():
+    store = CertificateStore.from_certificates(_certificates(12))
+    assert store.text_mask('').all()
+    assert store.text_mask('stef').tolist() == [name == 'Ștefănescu' for name in
+                                                store.display_columns()['Nume']]
+    # Textul extins este căutat doar printre rândurile găsite anterior
+    assert store.text_mask('stefanescu').tolist() == store.text_mask('ȘTEFĂNESCU').tolist()
+
+
+def test_expiration_filter_mask_uses_calendar_months():
+    today = date(2025, 1, 31)
+    store = CertificateStore.from_certificates([
+        make_certificate(numar='1', data_expirare=date(2025, 1, 30), id=1),
+        make_certificate(numar='2', data_expirare=date(2025, 1, 31), id=2),
+        make_certificate(numar='3', data_expirare=date(2025, 2, 28), id=3),
+        make_certificate(numar='4', data_expirare=date(2025, 3, 1), id=4),
+    ])
+    assert store.expiration_filter_mask(0, today).all()
+    assert store.expiration_filter_mask(-1, today).tolist() == [True, False, False, False]
+    assert store.expiration_filter_mask(1, today).tolist() == [False, True, True, False]
+
+
+def test_expiry_matches_per_certificate_status():
+    today = date.today()
+    certificates = [make_certificate(numar=str(days), expira_peste=days, id=index)
+                    for index, days in enumerate([-5, -1, 0, 30, 31, 90, 91, 400])]
+    store = CertificateStore.from_certificates(certificates)
+    snapshot = store.expiry(today)
+    assert snapshot.days.tolist() == [-5, -1, 0, 30, 31, 90, 91, 400]
+    assert snapshot.status.tolist() == [expiry_status(days) for days in snapshot.days.tolist()]
+    assert store.days_to_expiry(today) is snapshot.days
+    assert store.expiring_mask(30, today).tolist() == [True] * 4 + [False] * 4
+
+
+def test_expiry_snapshot_is_kept_per_day_and_reset_by_changes():
+    today = date(2026, 6, 1)
+    store = CertificateStore.from_certificates(_certificates(3))
+    snapshot = store.expiry(today)
+    assert store.expiry(today) is snapshot
+    assert store.expiry(today + timedelta(days=1)).days.tolist() == (snapshot.days - 1).tolist()
+    store.remove(1)
+    assert store.expiry(today + timedelta(days=1)).days.tolist() == (snapshot.days[1:] - 1).tolist()
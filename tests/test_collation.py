@@ -0,0 +1,64 @@
+"""
+Teste pentru ordonarea românească (utils.collation)
+"""
+import pytest
+
+from models.certificate_store import CertificateStore
+from tests.conftest import make_certificate
+from utils.collation import collation_key, search_key
+
+
+def _primary(text: str) -> str:
+    """Cheia de colaționare fără departajarea după textul original"""
+    return collation_key(text).split('\x00')[0]
+
+
+@pytest.mark.parametrize('words', [
+    ['a', 'ă', 'â', 'b'],
+    ['i', 'î', 'j'],
+    ['s', 'ș', 't', 'ț', 'u'],
+    ['Andrei', 'Ălbescu', 'Âmbru', 'Bălan'],
+    ['Sava', 'Șerban', 'Tudor', 'Țurcanu', 'Ursu'],
+    ['Ion', 'Ionescu', 'Îndrea'],
+    ['1', 'A', 'z'],
+])
+def test_romanian_alphabet_order(words):
+    assert sorted(words, key=collation_key) == words
+    assert sorted(reversed(words), key=collation_key) == words
+
+
+def test_case_insensitive_with_stable_tiebreak():
+    assert _primary('ȘTEFAN') == _primary('ștefan')
+    assert sorted(['popa', 'Pop', 'POPA', 'Popescu'], key=collation_key) == \
+        ['Pop', 'POPA', 'popa', 'Popescu']
+
+
+def test_cedilla_forms_are_equivalent():
+    assert _primary('Şerban') == _primary('Șerban')
+    assert _primary('Ţepeş') == _primary('Țepeș')
+    assert collation_key('Şerban') != collation_key('Șerban')
+
+
+def test_other_accents_sort_as_base_letter():
+    assert _primary('José') == _primary('jose')
+    assert sorted(['Müller', 'Muntean', 'Mureșan'], key=collation_key) == \
+        ['Müller', 'Muntean', 'Mureșan']
+
+
+def test_search_key():
+    assert search_key('Ștefan') == search_key('Ştefan') == search_key('STEFAN') == 'stefan'
+    assert search_key('Âmbru Îndrea Țăndărei') == 'ambru indrea tandarei'
+    assert search_key('plain') == 'plain'
+
+
+def test_store_sort_keys_follow_collation():
+    names = ['Țurcanu', 'Sava', 'Ălbescu', 'Șerban', 'Andrei', 'Sava', 'Tudor']
+    store = CertificateStore.from_certificates(
+        [make_certificate(numar=str(index), nume=name, id=index) for index, name in enumerate(names)])
+    ranks = store.sort_keys('nume').tolist()
+    assert [name for _, name in sorted(zip(ranks, names))] == sorted(names, key=collation_key)
+    assert ranks[1] == ranks[5]
+    assert store.sort_key('nume', 3) == collation_key('Șerban')
+
+    store.update(0, make_certificate(numar='0', nume='Albu'))
+    assert store.sort_keys('nume').tolist()[0] == 0
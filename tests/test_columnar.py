@@ -0,0 +1,106 @@
+"""
+Teste pentru conversia pe coloane (models.columnar)
+"""
+from datetime import date
+
+import pandas as pd
+
+from models.certificate import Certificate, ID_COLUMN
+from models.columnar import (MISSING_ID, certificates_to_frame, parse_certificates,
+                             parse_columns)
+from models.data_manager import DataManager
+from tests.conftest import make_certificate
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """Un DataFrame cu certificate valide și diferite"""
+    grades = ['Sold.', 'Cpt.', 'Mr.', 'Col.']
+    levels = ['SSv', 'S', 'SS', 'SSID']
+    return pd.DataFrame([
+        make_certificate(numar=str(row), nume=f'Nume{row}', expira_peste=row * 7 - 50,
+                         grad=grades[row % 4], nivel_certificat=levels[row % 4],
+                         observatii='nota' if row % 3 else '').to_dict()
+        for row in range(rows)
+    ])
+
+
+def test_matches_row_by_row_conversion():
+    df = make_frame(50)
+    certificates, errors = parse_certificates(df)
+    assert errors == []
+    assert certificates == [Certificate.from_dict(row) for row in df.to_dict('records')]
+
+
+def test_invalid_rows_are_reported_and_skipped():
+    df = make_frame(6)
+    df.loc[1, 'Grad'] = 'General de armată'
+    df.loc[2, 'Nivel certificat'] = 'XX'
+    df.loc[3, 'Data nașterii'] = ''
+    df.loc[4, 'Data eliberare'] = '31.02.2020'
+    df.loc[5, 'Data expirare'] = df.loc[5, 'Data eliberare']
+
+    certificates, errors = parse_certificates(df)
+    assert len(certificates) == 1
+    assert [(error.row, error.column) for error in errors] == [
+        (1, 'Grad'), (2, 'Nivel certificat'), (3, 'Data nașterii'),
+        (4, 'Data eliberare'), (5, 'Data expirare'),
+    ]
+    assert errors[0].reason == 'Grad invalid: General de armată'
+    assert errors[3].reason == 'Format dată invalid: 31.02.2020'
+
+
+def test_rows_without_name_are_ignored():
+    df = make_frame(3)
+    df.loc[1, :] = None
+    certificates, errors = parse_certificates(df)
+    assert len(certificates) == 2 and errors == []
+
+
+def test_old_column_names_and_mixed_date_types():
+    df = make_frame(2).rename(columns={
+        'Data nașterii': 'Data Nașterii', 'Serie certificat': 'Serie Certificat',
+        'Data expirare': 'Data Expirare'})
+    df['Data Nașterii'] = df['Data Nașterii'].astype(object)
+    df.loc[0, 'Data Nașterii'] = pd.Timestamp(1985, 3, 9)
+    certificates, errors = parse_certificates(df)
+    assert errors == []
+    assert certificates[0].data_nasterii == date(1985, 3, 9)
+    assert certificates[1].serie_certificat == df.loc[1, 'Serie Certificat']
+
+
+def test_columns_are_typed_and_keep_ids():
+    df = make_frame(4)
+    df[ID_COLUMN] = [7, None, 9, 10]
+    columns, _ = parse_columns(df)
+    assert columns['id'].tolist() == [7, MISSING_ID, 9, 10]
+    assert columns['grad'].dtype.name == 'int8'
+    assert columns['data_expirare'].dtype.name == 'int32'
+    assert columns['nume'].dtype == object
+
+
+def test_empty_frame():
+    columns, errors = parse_columns(pd.DataFrame())
+    assert errors == [] and all(len(values) == 0 for values in columns.values())
+
+
+def test_frame_round_trip():
+    certificates = [make_certificate(numar=str(number), observatii=f'nota {number}')
+                    for number in range(3)]
+    parsed, errors = parse_certificates(certificates_to_frame(certificates))
+    assert errors == [] and parsed == certificates
+
+
+def test_manager_uses_columnar_conversion(tmp_path):
+    df = make_frame(8)
+    df.loc[3, 'Grad'] = 'Căpitan'
+    path = tmp_path / 'registru.xlsx'
+    df.to_excel(path, index=False)
+    manager = DataManager(str(path))
+    certificates = manager.get_all_certificates()
+    assert [certificate.nume for certificate in certificates] == \
+        [f'Nume{row}' for row in range(8) if row != 3]
+    # Același rezultat ca la conversia rând cu rând, cu ID-urile rândurilor
+    rows = manager.df.drop(index=3).to_dict('records')
+    assert certificates == [Certificate.from_dict(row).replace(id=int(row[ID_COLUMN]))
+                            for row in rows]
+    assert [certificate.id for certificate in certificates] == [1, 2, 3, 5, 6, 7, 8]
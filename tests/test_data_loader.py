@@ -0,0 +1,90 @@
+"""
+Teste pentru încărcarea pe bucăți (controllers.data_loader)
+"""
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+
+from benchmarks.synthetic import make_certificates_df
+from controllers.data_loader import DataLoader
+from models.certificate import ID_COLUMN
+from models.data_manager import DataManager
+from models.exporter import StreamingExcelExporter
+
+
+def run_loader(qapp, manager: DataManager, cancel_after: Optional[int] = None) -> list:
+    """
+    Rulează încărcarea și întoarce semnalele primite, în ordine
+
+    cancel_after: numărul de rânduri trimise după care încărcarea este
+    anulată, pe firul de încărcare (0 = înainte de pornire, None = niciodată)
+    """
+    events = []
+    loader = DataLoader(manager, chunk_size=10)
+    loaded = []
+
+    def cancel_when_loaded(columns, errors):
+        loaded.append(len(columns['id']))
+        if sum(loaded) == cancel_after:
+            loader.cancel()
+
+    loader.chunk_loaded.connect(cancel_when_loaded, Qt.ConnectionType.DirectConnection)
+    loader.chunk_loaded.connect(lambda columns, errors: events.append(('chunk', len(columns['id']))))
+    loader.load_finished.connect(lambda df: events.append(('finished', df)))
+    loader.load_cancelled.connect(lambda: events.append(('cancelled', None)))
+    loader.load_failed.connect(lambda message: events.append(('failed', message)))
+    if cancel_after == 0:
+        loader.cancel()
+    loader.start()
+    assert loader.wait(10000)
+    qapp.processEvents()
+    return events
+
+
+def make_workbook(path, rows: int):
+    """Scrie un registru Excel cu rânduri sintetice"""
+    df = make_certificates_df(rows)
+    df[ID_COLUMN] = range(1, rows + 1)
+    StreamingExcelExporter(df).write(path)
+
+
+def test_chunks_then_one_finished_signal(qapp, tmp_path):
+    make_workbook(tmp_path / 'registru.xlsx', rows=25)
+    events = run_loader(qapp, DataManager(str(tmp_path / 'registru.xlsx'), load=False))
+    names = [name for name, _ in events]
+    assert names[-1] == 'finished' and set(names[:-1]) == {'chunk'}
+    # Prima bucată poate fi goală (doar antetul), apoi câte cel mult 10 rânduri
+    assert [size for _, size in events[:-1] if size] == [10, 10, 5]
+    assert len(events[-1][1]) == 25
+
+
+def test_cancel_emits_only_cancelled(qapp, tmp_path):
+    make_workbook(tmp_path / 'registru.xlsx', rows=25)
+    events = run_loader(qapp, DataManager(str(tmp_path / 'registru.xlsx'), load=False),
+                        cancel_after=0)
+    assert events == [('cancelled', None)]
+
+
+def test_cancel_between_chunks_stops_before_the_next_one(qapp, tmp_path):
+    make_workbook(tmp_path / 'registru.xlsx', rows=25)
+    events = run_loader(qapp, DataManager(str(tmp_path / 'registru.xlsx'), load=False),
+                        cancel_after=10)
+    assert events[-1] == ('cancelled', None)
+    assert [size for _, size in events[:-1] if size] == [10]
+
+
+def test_cancel_after_last_chunk_still_finishes(qapp, tmp_path):
+    make_workbook(tmp_path / 'registru.xlsx', rows=25)
+    events = run_loader(qapp, DataManager(str(tmp_path / 'registru.xlsx'), load=False),
+                        cancel_after=25)
+    names = [name for name, _ in events]
+    assert 'cancelled' not in names and names[-1] == 'finished'
+    assert len(events[-1][1]) == 25
+
+
+def test_missing_source_finishes_without_data(qapp, tmp_path):
+    manager = DataManager(str(tmp_path / 'nou.xlsx'), load=False)
+    assert run_loader(qapp, manager) == [('finished', None)]
+    manager.finish_load(None)
+    manager.flush()
+    assert (tmp_path / 'nou.xlsx').exists()
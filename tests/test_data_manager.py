@@ -0,0 +1,209 @@
+"""
+Teste pentru managerul de date (models.data_manager)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate import ID_COLUMN
+from models.data_manager import DataManager
+from models.exporter import StreamingExcelExporter
+from tests.conftest import make_certificate
+
+
+@pytest.fixture
+def manager(tmp_path) -> DataManager:
+    """Manager de date cu 60 de certificate sintetice"""
+    df = make_certificates_df(60)
+    df[ID_COLUMN] = range(1, 61)
+    StreamingExcelExporter(df).write(tmp_path / 'registru.xlsx')
+    return DataManager(str(tmp_path / 'registru.xlsx'), journal_mode=True)
+
+
+@pytest.mark.parametrize('rebuild_after', [DataManager.ID_INDEX_REBUILD_DELETES, 4])
+def test_ids_resolve_after_deletes(manager, rebuild_after):
+    manager.ID_INDEX_REBUILD_DELETES = rebuild_after
+    ids = manager.df[ID_COLUMN].tolist()
+    for record_id in ids[::3] + ids[1:6]:
+        if record_id in manager.df[ID_COLUMN].tolist():
+            manager.delete_certificate(record_id)
+    manager.add_certificate(make_certificate(serie='ZZ', numar='1'))
+    for row, record_id in enumerate(manager.df[ID_COLUMN].tolist()):
+        assert manager._row_of(record_id) == row
+    with pytest.raises(KeyError):
+        manager._row_of(ids[0])
+    assert manager.get_certificate(ids[-1]).id == ids[-1]
+
+
+def test_certificate_getters_read_the_store(manager):
+    manager.add_certificate(make_certificate(serie='ZZ', numar='1', expira_peste=-2))
+    manager.delete_certificate(3)
+    store = manager.get_store()
+    assert manager.get_all_certificates() == store.certificates()
+    expiring = manager.get_expiring_certificates(45)
+    assert expiring == [store.certificate(position)
+                        for position in np.flatnonzero(store.expiring_mask(45))]
+    assert expiring[-1].serie_certificat == 'ZZ'
+
+
+def test_ids_are_assigned_kept_and_not_reused(tmp_path):
+    path = tmp_path / 'registru.xlsx'
+    StreamingExcelExporter(make_certificates_df(5)).write(path)
+    manager = DataManager(str(path))
+    assert manager.df[ID_COLUMN].tolist() == [1, 2, 3, 4, 5]
+
+    manager.delete_certificate(5)
+    manager.add_certificate(make_certificate(serie='ZZ', numar='1'))
+    manager.update_certificate(2, make_certificate(serie='ZZ', numar='2'))
+    manager.flush()
+    assert manager.df[ID_COLUMN].tolist() == [1, 2, 3, 4, 6]
+
+    reopened = DataManager(str(path))
+    assert reopened.df[ID_COLUMN].tolist() == [1, 2, 3, 4, 6]
+    assert reopened.get_certificate(2).numar_certificat == '2'
+    assert reopened.get_certificate(6).serie_certificat == 'ZZ'
+
+
+def write_import_file(path, numbers: list):
+    """Scrie un fișier de import cu câte un certificat pentru fiecare număr"""
+    df = make_certificates_df(len(numbers), seed=3)
+    df['Serie certificat'] = 'IM'
+    df['Număr certificat'] = [str(number) for number in numbers]
+    StreamingExcelExporter(df).write(path)
+
+
+class RecordingSaver:
+    """Saver de test: păstrează salvările programate până la flush"""
+
+    def __init__(self):
+        self.pending = []
+
+    def schedule(self, write_fn):
+        self.pending.append(write_fn)
+
+    def flush(self):
+        pending, self.pending = self.pending, []
+        for write_fn in pending:
+            write_fn()
+
+
+def test_import_rolls_back_when_save_fails(manager, tmp_path, monkeypatch):
+    write_import_file(tmp_path / 'import.xlsx', [1, 2, 3])
+    manager.set_saver(RecordingSaver())
+    store = manager.get_store()
+    before = manager.df.copy()
+    changes = []
+    manager.add_change_listener(lambda *change: changes.append(change))
+
+    def failing_save(df, token=None):
+        raise OSError("disc plin")
+
+    monkeypatch.setattr(manager._engine, 'save', failing_save)
+    success, message = manager.import_from_excel(str(tmp_path / 'import.xlsx'))
+    assert not success and 'disc plin' in message
+    assert manager.df.equals(before)
+    assert manager.find_duplicate('IM', '1') is None
+    assert manager.get_store() is store and len(store) == 60
+    assert changes == []
+
+
+def test_import_saves_before_reporting_success(manager, tmp_path):
+    write_import_file(tmp_path / 'import.xlsx', [1, 2, 3])
+    saver = RecordingSaver()
+    manager.set_saver(saver)
+    success, message = manager.import_from_excel(str(tmp_path / 'import.xlsx'))
+    assert success, message
+    assert saver.pending == []
+    reloaded = DataManager(str(manager.file_path))
+    assert len(reloaded.df) == 63
+    assert reloaded.find_duplicate('IM', '2') is not None
+
+
+def test_export_has_no_id_column(manager, tmp_path):
+    success, message = manager.export_to_excel(str(tmp_path / 'export' / 'date.xlsx'))
+    assert success, message
+    exported = pd.read_excel(tmp_path / 'export' / 'date.xlsx')
+    assert ID_COLUMN not in exported.columns
+    assert list(exported.columns) == [column for column in manager.df.columns
+                                      if column != ID_COLUMN]
+    assert len(exported) == 60
+
+
+def test_serial_and_number_are_unique(manager):
+    manager.add_certificate(make_certificate(serie='ab', numar=' 5 '))
+    with pytest.raises(ValueError):
+        manager.add_certificate(make_certificate(serie='AB', numar='5'))
+    record_id = manager.find_duplicate('AB', '5')
+    other_id = manager.df[ID_COLUMN].iloc[0]
+    with pytest.raises(ValueError):
+        manager.update_certificate(int(other_id), make_certificate(serie='AB', numar='5'))
+    # Certificatul își poate păstra propria serie și număr la editare
+    manager.update_certificate(record_id, make_certificate(serie='AB', numar='5', nume='Popa'))
+    manager.delete_certificate(record_id)
+    assert manager.find_duplicate('AB', '5') is None
+
+
+def import_conflicts(manager, tmp_path, mode):
+    """Importă un certificat existent (IM/1, modificat) și unul nou (IM/2)"""
+    manager.add_certificate(make_certificate(serie='IM', numar='1', observatii='existent'))
+    existing_id = manager.find_duplicate('IM', '1')
+    write_import_file(tmp_path / 'import.xlsx', [1, 2])
+    imported = pd.read_excel(tmp_path / 'import.xlsx')
+    imported['Observații'] = ['importat', '']
+    StreamingExcelExporter(imported).write(tmp_path / 'import.xlsx')
+
+    asked = []
+    success, message = manager.import_from_excel(
+        str(tmp_path / 'import.xlsx'),
+        conflict_callback=lambda count: asked.append(count) or mode)
+    assert asked == [1]
+    return success, message, existing_id, imported
+
+
+def test_import_conflict_skip_keeps_existing(manager, tmp_path):
+    success, message, existing_id, _ = import_conflicts(manager, tmp_path, DataManager.CONFLICT_SKIP)
+    assert success and "ignorate 1 duplicate" in message
+    assert manager.get_certificate(existing_id).observatii == 'existent'
+    assert manager.find_duplicate('IM', '2') is not None
+    assert len(manager.df) == 62
+
+
+def test_import_conflict_overwrite_replaces_existing(manager, tmp_path):
+    success, message, existing_id, imported = import_conflicts(
+        manager, tmp_path, DataManager.CONFLICT_OVERWRITE)
+    assert success and "actualizate 1" in message
+    updated = manager.get_certificate(existing_id)
+    assert updated.observatii == 'importat'
+    assert updated.nume == imported['Nume'][0]
+    assert manager.get_store().certificate(manager.get_store().position_of(existing_id)) == updated
+
+
+def test_import_conflict_merge_combines_notes(manager, tmp_path):
+    success, _, existing_id, imported = import_conflicts(manager, tmp_path, DataManager.CONFLICT_MERGE)
+    assert success
+    merged = manager.get_certificate(existing_id)
+    assert merged.observatii == 'existent; importat'
+    assert merged.nume == imported['Nume'][0]
+
+
+def test_import_conflict_cancel_changes_nothing(manager, tmp_path):
+    before = None
+
+    def cancel(count):
+        nonlocal before
+        before = manager.df.copy()
+        return None
+
+    manager.add_certificate(make_certificate(serie='IM', numar='1'))
+    write_import_file(tmp_path / 'import.xlsx', [1, 2])
+    success, message = manager.import_from_excel(str(tmp_path / 'import.xlsx'),
+                                                 conflict_callback=cancel)
+    assert not success and message == "Import anulat"
+    assert manager.df.equals(before)
+
+
+def test_duplicates_within_import_file(manager, tmp_path):
+    write_import_file(tmp_path / 'import.xlsx', [4, 4, 5])
+    success, message = manager.import_from_excel(str(tmp_path / 'import.xlsx'))
+    assert success and "Importate cu succes 2" in message and "ignorate 1" in message
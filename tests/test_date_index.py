@@ -0,0 +1,63 @@
+"""
+Teste pentru indexurile de date (models.date_index)
+"""
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from models.date_index import DateIndex, add_months
+
+
+@pytest.mark.parametrize('day, months, expected', [
+    (date(2025, 1, 31), 1, date(2025, 2, 28)),
+    (date(2024, 1, 31), 1, date(2024, 2, 29)),
+    (date(2025, 3, 31), -1, date(2025, 2, 28)),
+    (date(2025, 11, 15), 3, date(2026, 2, 15)),
+    (date(2025, 1, 15), -13, date(2023, 12, 15)),
+    (date(2025, 8, 31), 0, date(2025, 8, 31)),
+])
+def test_add_months(day, months, expected):
+    assert add_months(day, months) == expected
+
+
+def _brute(ordinals, start, end):
+    """Pozițiile din interval, găsite prin parcurgerea tuturor datelor"""
+    return sorted(position for position, ordinal in enumerate(ordinals)
+                  if (start is None or ordinal >= start) and (end is None or ordinal <= end))
+
+
+def test_range_queries_are_inclusive():
+    ordinals = np.array([10, 5, 20, 10, 15], dtype=np.int32)
+    index = DateIndex(ordinals)
+    assert index.positions().tolist() == [1, 0, 3, 4, 2]
+    assert index.positions(10, 15).tolist() == [0, 3, 4]
+    assert index.positions(None, 9).tolist() == [1]
+    assert index.positions(16).tolist() == [2]
+    assert index.positions(15, 10).tolist() == []
+    assert index.count(10, 10) == 2 and len(index) == 5
+
+
+def test_deltas_match_rebuilt_index():
+    generator = random.Random(7)
+    ordinals = [generator.randrange(50) for _ in range(40)]
+    index = DateIndex(np.array(ordinals, dtype=np.int32))
+    for _ in range(200):
+        operation = generator.choice(['extend', 'update', 'remove'])
+        if operation == 'extend' or len(ordinals) < 2:
+            added = [generator.randrange(50) for _ in range(generator.randrange(1, 4))]
+            index.extend(np.array(added, dtype=np.int32), len(ordinals))
+            ordinals.extend(added)
+        elif operation == 'update':
+            position, new = generator.randrange(len(ordinals)), generator.randrange(50)
+            index.update(position, ordinals[position], new)
+            ordinals[position] = new
+        else:
+            position = generator.randrange(len(ordinals))
+            index.remove(position, ordinals.pop(position))
+
+        rebuilt = DateIndex(np.array(ordinals, dtype=np.int32))
+        assert index.positions().tolist() == rebuilt.positions().tolist()
+    start, end = 12, 30
+    assert sorted(index.positions(start, end).tolist()) == _brute(ordinals, start, end)
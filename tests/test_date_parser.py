@@ -0,0 +1,55 @@
+"""
+Teste pentru parserul de date (utils.date_parser)
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.date_parser import excel_serial_to_date, parse_date, try_parse_date
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('17.05.1980', date(1980, 5, 17)),
+    ('1980-05-17', date(1980, 5, 17)),
+    (' 17.05.1980 ', date(1980, 5, 17)),
+    ('1.5.1980', date(1980, 5, 1)),
+    ('29.02.2024', date(2024, 2, 29)),
+    (date(1980, 5, 17), date(1980, 5, 17)),
+    (datetime(1980, 5, 17, 13, 45), date(1980, 5, 17)),
+    (pd.Timestamp('1980-05-17 08:00'), date(1980, 5, 17)),
+    (29358, date(1980, 5, 17)),
+    (29358.75, date(1980, 5, 17)),
+    (np.int64(29358), date(1980, 5, 17)),
+])
+def test_accepted_formats(value, expected):
+    assert try_parse_date(value) == expected
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize('value', [
+    None, float('nan'), pd.NaT, pd.NA, '', '31.02.2020', '2020/05/17', '17-05-1980',
+    'ab.cd.efgh', True, 0, 60, 3000000, object(),
+])
+def test_invalid_values(value):
+    assert try_parse_date(value) is None
+    with pytest.raises(ValueError):
+        parse_date(value)
+
+
+def test_error_messages():
+    with pytest.raises(ValueError, match='Data lipsă'):
+        parse_date(None)
+    with pytest.raises(ValueError, match='Data goală'):
+        parse_date('   ')
+    with pytest.raises(ValueError, match=r'Format dată invalid: 31\.02\.2020 \(tip: str\)'):
+        parse_date('31.02.2020')
+
+
+def test_excel_serial_leap_year_bug():
+    assert excel_serial_to_date(1) == date(1900, 1, 1)
+    assert excel_serial_to_date(59) == date(1900, 2, 28)
+    assert excel_serial_to_date(60) is None
+    assert excel_serial_to_date(61) == date(1900, 3, 1)
+    assert excel_serial_to_date(2958465) == date(9999, 12, 31)
@@ -0,0 +1,44 @@
+"""
+Teste pentru exportul în flux (models.exporter)
+"""
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from benchmarks.synthetic import make_certificates_df
+from models.exporter import StreamingExcelExporter
+
+
+def test_round_trip_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(StreamingExcelExporter, 'CHUNK_SIZE', 7)
+    df = make_certificates_df(30)
+    assert StreamingExcelExporter(df).write(tmp_path / 'export.xlsx') == 30
+    exported = pd.read_excel(tmp_path / 'export.xlsx', dtype=str, keep_default_na=False)
+    assert exported.equals(df.astype(str))
+
+
+def test_missing_values_become_empty_cells(tmp_path):
+    df = pd.DataFrame({'Nume': ['Popa', None], 'Număr': [np.nan, 2.0]})
+    StreamingExcelExporter(df).write(tmp_path / 'export.xlsx')
+    sheet = load_workbook(tmp_path / 'export.xlsx').active
+    assert [[cell.value for cell in row] for row in sheet.iter_rows()] == [
+        ['Nume', 'Număr'], ['Popa', None], [None, 2]]
+
+
+def test_header_and_column_widths(tmp_path):
+    df = pd.DataFrame({'A': ['scurt'], 'Observații': ['x' * 80]})
+    StreamingExcelExporter(df).write(tmp_path / 'export.xlsx')
+    sheet = load_workbook(tmp_path / 'export.xlsx')[StreamingExcelExporter.SHEET_NAME]
+    assert sheet['A1'].font.bold
+    assert sheet.column_dimensions['A'].width == len('scurt') + 2
+    assert sheet.column_dimensions['B'].width == StreamingExcelExporter.MAX_COLUMN_WIDTH
+
+
+def test_column_widths_are_computed_chunk_by_chunk(monkeypatch):
+    monkeypatch.setattr(StreamingExcelExporter, 'CHUNK_SIZE', 4)
+    df = pd.DataFrame({'Nr': list(range(11)), 'Nume': ['Pop'] * 10 + ['Constantinescu'],
+                       'Observații': ['x' * 60] + [None] * 10})
+    assert StreamingExcelExporter(df).column_widths() == {
+        'A': len('Nr') + 2, 'B': len('Constantinescu') + 2,
+        'C': StreamingExcelExporter.MAX_COLUMN_WIDTH}
+    assert StreamingExcelExporter(df.iloc[:0]).column_widths()['C'] == len('Observații') + 2
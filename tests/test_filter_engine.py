@@ -0,0 +1,79 @@
+"""
+Teste pentru motorul de filtre al tabelului (models.filter_engine)
+"""
+
+import pytest
+
+from models.certificate import GRAD_CODES, NIVEL_CODES
+from models.certificate_store import CertificateStore
+from models.filter_engine import FilterEngine
+from tests.conftest import make_certificate
+
+
+@pytest.fixture
+def store():
+    return CertificateStore.from_certificates([
+        make_certificate(numar='1', nume='Popescu', grad='Cpt.', expira_peste=-10, id=1),
+        make_certificate(numar='2', nume='Ștefănescu', grad='Mr.', expira_peste=20, id=2),
+        make_certificate(numar='3', nume='Popa', grad='Cpt.', nivel_certificat='SS',
+                         expira_peste=200, id=3),
+        make_certificate(numar='4', nume='Ionescu', grad='Mr.', nivel_certificat='SS',
+                         expira_peste=25, id=4),
+    ])
+
+
+def test_without_filters_everything_is_visible(store):
+    engine = FilterEngine()
+    engine.set_store(store)
+    assert engine.mask is None and not engine.is_active()
+    assert engine.visible_count == 4
+    assert engine.set_text('  ').tolist() == []
+
+
+def test_predicates_are_combined_and_report_changes(store):
+    engine = FilterEngine()
+    engine.set_store(store)
+
+    assert engine.set_text('pop').tolist() == [1, 3]
+    assert engine.visible_count == 2
+    assert engine.set_grades([GRAD_CODES['Cpt.']]).tolist() == []
+    assert engine.set_text('escu').tolist() == [2]
+    assert engine.mask.tolist() == [True, False, False, False]
+
+    assert engine.set_grades(None).tolist() == [1, 3]
+    assert engine.set_expiry(1).tolist() == [0]
+    assert engine.mask.tolist() == [False, True, False, True]
+    assert engine.set_levels([NIVEL_CODES['SS']]).tolist() == [1]
+    assert engine.visible_count == 1
+
+    assert engine.clear().tolist() == [0, 1, 2]
+    assert engine.mask is None and engine.visible_count == 4
+
+
+def test_expired_filter(store):
+    engine = FilterEngine()
+    engine.set_store(store)
+    engine.set_expiry(-1)
+    assert engine.mask.tolist() == [True, False, False, False]
+    assert engine.set_expiry(0).tolist() == [1, 2, 3]
+    assert not engine.is_active()
+
+
+def test_refresh_after_store_changes(store):
+    engine = FilterEngine()
+    engine.set_store(store)
+    engine.set_text('pop')
+    store.append(make_certificate(numar='5', nume='Popovici', id=5))
+    store.remove(1)
+    engine.refresh()
+    assert engine.mask.tolist() == [False, True, False, True]
+    assert engine.visible_count == 2
+
+
+def test_set_store_recomputes_active_filters(store):
+    engine = FilterEngine()
+    engine.set_store(store)
+    engine.set_text('escu')
+    engine.set_store(CertificateStore.from_certificates([make_certificate(nume='Albu', id=1)]))
+    assert engine.mask.tolist() == [False] and engine.visible_count == 0
+    assert engine.set_text('').tolist() == [0]
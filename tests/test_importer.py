@@ -0,0 +1,107 @@
+"""
+Teste pentru importul în flux (models.importer)
+"""
+import pandas as pd
+from openpyxl import Workbook
+
+from models.importer import StreamingImporter, write_error_report
+from tests.conftest import make_certificate
+
+
+def write_workbook(path, rows: int) -> pd.DataFrame:
+    """Scrie un fișier de import cu certificate valide"""
+    df = pd.DataFrame([make_certificate(numar=str(row)).to_dict() for row in range(rows)])
+    df.to_excel(path, index=False)
+    return df
+
+
+def test_reads_in_fixed_size_chunks(tmp_path):
+    write_workbook(tmp_path / 'import.xlsx', 25)
+    importer = StreamingImporter(tmp_path / 'import.xlsx', chunk_size=10)
+    chunks = list(importer.iter_chunks())
+    # Prima bucată este doar antetul; indexul este poziția rândului în fișier
+    assert [len(chunk) for chunk in chunks] == [0, 10, 10, 5]
+    assert list(chunks[2].index) == list(range(10, 20))
+    assert importer.total_rows == 25
+
+
+def test_run_accepts_all_rows_and_reports_progress(tmp_path):
+    df = write_workbook(tmp_path / 'import.xlsx', 25)
+    progress = []
+    result = StreamingImporter(tmp_path / 'import.xlsx', chunk_size=10,
+                               progress_callback=lambda done, total: progress.append((done, total)) or True).run()
+    assert result.success, result.message
+    assert [certificate.numar_certificat for certificate in result.certificates] == \
+        df['Număr certificat'].tolist()
+    assert progress == [(10, 25), (20, 25), (25, 25)]
+
+
+def test_progress_callback_cancels(tmp_path):
+    write_workbook(tmp_path / 'import.xlsx', 25)
+    result = StreamingImporter(tmp_path / 'import.xlsx', chunk_size=10,
+                               progress_callback=lambda done, total: done < 20).run()
+    assert not result.success and result.cancelled
+    assert result.certificates == []
+
+
+def test_missing_columns(tmp_path):
+    df = pd.DataFrame([make_certificate().to_dict()]).drop(columns=['Grad', 'Observații'])
+    df.to_excel(tmp_path / 'import.xlsx', index=False)
+    result = StreamingImporter(tmp_path / 'import.xlsx').run()
+    assert not result.success
+    assert result.message == "Lipsesc coloanele: Grad, Observații"
+
+
+def test_header_only_file_imports_nothing(tmp_path):
+    workbook = Workbook()
+    workbook.active.append(list(make_certificate().to_dict()))
+    workbook.save(tmp_path / 'import.xlsx')
+    result = StreamingImporter(tmp_path / 'import.xlsx').run()
+    assert result.success and result.certificates == []
+
+
+def test_empty_file(tmp_path):
+    Workbook().save(tmp_path / 'import.xlsx')
+    result = StreamingImporter(tmp_path / 'import.xlsx').run()
+    assert not result.success and result.message == "Fișierul nu conține date"
+
+
+def test_every_error_row_is_reported_across_chunks(tmp_path):
+    df = write_workbook(tmp_path / 'import.xlsx', 25)
+    df.loc[3, 'Grad'] = 'Necunoscut'
+    df.loc[17, 'Data expirare'] = 'mâine'
+    df.loc[24, 'Nivel certificat'] = ''
+    df.to_excel(tmp_path / 'import.xlsx', index=False)
+    result = StreamingImporter(tmp_path / 'import.xlsx', chunk_size=10).run()
+
+    assert not result.success and result.certificates == []
+    assert [(error.row, error.column) for error in result.errors] == [
+        (3, 'Grad'), (17, 'Data expirare'), (24, 'Nivel certificat')]
+    # Rândurile din mesaj sunt cele din Excel (antetul este rândul 1)
+    assert "3 erori în 3 rânduri" in result.message
+    assert "Rând 19 (Data expirare): Format dată invalid: mâine" in result.message
+
+
+def test_message_lists_first_errors_only(tmp_path):
+    df = write_workbook(tmp_path / 'import.xlsx', 15)
+    df['Grad'] = 'Necunoscut'
+    df.to_excel(tmp_path / 'import.xlsx', index=False)
+    result = StreamingImporter(tmp_path / 'import.xlsx').run()
+    assert len(result.errors) == 15
+    assert result.message.endswith(f"... și încă {15 - StreamingImporter.MESSAGE_ERRORS} erori")
+
+
+def test_error_report_csv_and_xlsx(tmp_path):
+    df = write_workbook(tmp_path / 'import.xlsx', 4)
+    df.loc[1, 'Grad'] = 'Necunoscut'
+    df.loc[2, 'Data nașterii'] = None
+    df.to_excel(tmp_path / 'import.xlsx', index=False)
+    errors = StreamingImporter(tmp_path / 'import.xlsx').run().errors
+
+    assert write_error_report(errors, tmp_path / 'erori.csv') == 2
+    report = pd.read_csv(tmp_path / 'erori.csv', encoding='utf-8-sig')
+    assert report['Rând'].tolist() == [3, 4]
+    assert report['Coloană'].tolist() == ['Grad', 'Data nașterii']
+
+    assert write_error_report(errors, tmp_path / 'erori.xlsx') == 2
+    assert pd.read_excel(tmp_path / 'erori.xlsx')['Motiv'][0] == 'Grad invalid: Necunoscut'
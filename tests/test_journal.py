@@ -0,0 +1,102 @@
+"""
+Teste pentru jurnalul de modificări (models.journal) și reaplicarea lui
+"""
+import json
+import os
+
+import pytest
+
+from models.certificate import ID_COLUMN
+from models.data_manager import DataManager
+from models.journal import ChangeJournal
+from tests.conftest import make_certificate
+
+
+@pytest.fixture
+def register(tmp_path):
+    """Un registru oarecare (jurnalul folosește doar amprenta lui)"""
+    path = tmp_path / 'registru.xlsx'
+    path.write_bytes(b'registru v1')
+    return path
+
+
+def test_entries_survive_reopen(register):
+    journal = ChangeJournal(register)
+    journal.append('add', data={'Nume': 'Popescu'})
+    journal.append('delete', index=2)
+
+    reopened = ChangeJournal(register)
+    assert reopened.pending_entries() == [
+        {'op': 'add', 'data': {'Nume': 'Popescu'}},
+        {'op': 'delete', 'index': 2},
+    ]
+    assert reopened.entry_count == 2
+
+
+def test_fingerprint_mismatch_discards_entries(register):
+    journal = ChangeJournal(register)
+    journal.append('delete', index=2)
+    # Registrul rescris după jurnal conține deja modificarea
+    register.write_bytes(b'registru v2, rescris')
+    assert ChangeJournal(register).pending_entries() == []
+
+
+def test_truncated_last_line_is_ignored(register):
+    journal = ChangeJournal(register)
+    journal.append('delete', index=1)
+    journal.append('delete', index=2)
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "delete", "index"')
+    assert [entry['index'] for entry in ChangeJournal(register).pending_entries()] == [1, 2]
+
+
+def test_fold_keeps_entries_after_snapshot(register, tmp_path):
+    journal = ChangeJournal(register)
+    journal.append('delete', index=1)
+    snapshot = journal.sequence
+    journal.append('delete', index=2)
+
+    new_register = tmp_path / 'nou.xlsx'
+    new_register.write_bytes(b'registru v2 cu randul 1 sters')
+    journal.fold(new_register, snapshot)
+
+    assert register.read_bytes() == b'registru v2 cu randul 1 sters'
+    assert ChangeJournal(register).pending_entries() == [{'op': 'delete', 'index': 2}]
+
+
+def test_interrupted_fold_is_completed_on_read(register, tmp_path):
+    journal = ChangeJournal(register)
+    for index in (1, 2, 3):
+        journal.append('delete', index=index)
+
+    # Etapele 1 și 2 ale integrării (antet cu 'next', registru înlocuit),
+    # fără etapa 3: jurnalul conține încă intrările integrate
+    new_register = tmp_path / 'nou.xlsx'
+    new_register.write_bytes(b'registru v2 cu 1 si 2 sterse')
+    lines = journal.path.read_text(encoding='utf-8').splitlines()
+    header = json.loads(lines[0])
+    stat = new_register.stat()
+    header['next'] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'skip': 2}
+    journal.path.write_text('\n'.join([json.dumps(header)] + lines[1:]) + '\n', encoding='utf-8')
+    os.replace(new_register, register)
+
+    assert ChangeJournal(register).pending_entries() == [{'op': 'delete', 'index': 3}]
+    # Jurnalul a fost rescris peste noul registru
+    assert ChangeJournal(register).pending_entries() == [{'op': 'delete', 'index': 3}]
+
+
+def test_manager_replays_journal(tmp_path):
+    path = tmp_path / 'registru.xlsx'
+    manager = DataManager(str(path), journal_mode=True)
+    for numar in ('1', '2', '3'):
+        manager.add_certificate(make_certificate(numar=numar))
+    first, second, _ = manager.df[ID_COLUMN].tolist()
+    manager.update_certificate(second, make_certificate(numar='2', nume='Ionescu'))
+    manager.delete_certificate(first)
+    assert manager.has_pending_changes()
+
+    replayed = DataManager(str(path), journal_mode=True)
+    assert replayed.df[ID_COLUMN].tolist() == [second, second + 1]
+    assert replayed.df['Număr certificat'].astype(str).tolist() == ['2', '3']
+    assert replayed.df['Nume'].tolist() == ['Ionescu', 'Popescu']
+    assert replayed.has_pending_changes()
@@ -0,0 +1,49 @@
+"""
+Teste pentru paleta comună a tabelelor (views.palette)
+"""
+from PyQt6.QtCore import Qt
+
+from models.certificate import (COLUMN_NAMES, STATUS_ATENTIE, STATUS_COLORS, STATUS_EXPIRAT,
+                                STATUS_URGENT, STATUS_VALID)
+from models.certificate_store import CertificateStore
+from tests.conftest import make_certificate
+from views.palette import EXPIRY_CELL_COLORS, shared_palette
+from views.table_model import CertificateTableModel
+
+EXPIRY_COLUMN = COLUMN_NAMES.index('Data expirare')
+NUME_COLUMN = COLUMN_NAMES.index('Nume')
+
+
+def test_model_returns_shared_brushes(qapp):
+    palette = shared_palette()
+    statuses = [STATUS_EXPIRAT, STATUS_URGENT, STATUS_ATENTIE, STATUS_VALID]
+    model = CertificateTableModel()
+    model.set_store(CertificateStore.from_certificates([
+        make_certificate(numar=str(days), expira_peste=days, id=index)
+        for index, days in enumerate([-5, 10, 60, 400, -1], start=1)
+    ]))
+    background, foreground = Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole
+    for row, status in enumerate(statuses + [STATUS_EXPIRAT]):
+        expiry = model.index(row, EXPIRY_COLUMN)
+        assert model.data(expiry, background) is palette.expiry_cell[status]
+        assert model.data(expiry, foreground) is palette.black
+        assert model.data(model.index(row, NUME_COLUMN), background) is palette.white
+        assert model.data(model.index(row, NUME_COLUMN), foreground) is None
+    assert [brush.color().getRgb()[:3] for brush in palette.expiry_cell] == \
+        list(EXPIRY_CELL_COLORS)
+    assert shared_palette() is palette
+
+
+def test_status_items_are_clones_of_prototypes(qapp):
+    palette = shared_palette()
+    for status, color in enumerate(STATUS_COLORS):
+        item = palette.status_item(status, 'Popescu')
+        bold = palette.status_item(status, 'AB 1', bold=True)
+        assert item is not palette.status_item(status, 'Popescu')
+        assert item.text() == 'Popescu' and bold.text() == 'AB 1'
+        assert item.background().color().name() == bold.background().color().name() == \
+            palette.status[status].color().name() == color.lower()
+        assert not item.font().bold() and bold.font().bold()
+        assert not item.flags() & Qt.ItemFlag.ItemIsEditable
+        # Textul copiei nu ajunge în prototip
+        assert palette.status_item(status, '').text() == ''
@@ -0,0 +1,85 @@
+"""
+Teste pentru cache-ul binar al registrului (models.parsed_cache)
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.parsed_cache import ParsedDataCache
+from models.storage import ExcelStorageEngine
+from tests.conftest import make_certificate
+
+
+@pytest.fixture
+def register(tmp_path):
+    """Un registru oarecare (cheia cache-ului depinde doar de fișier)"""
+    path = tmp_path / 'registru.xlsx'
+    path.write_bytes(b'continut registru')
+    return path
+
+
+def mixed_frame() -> pd.DataFrame:
+    """Tabel cu valorile pe care le poate întoarce read_excel"""
+    return pd.DataFrame({
+        'Nume': ['Ștefănescu', None, 'Țurcanu'],
+        'Număr certificat': [123456, 'AB-7', 1.5],
+        'Data expirare': ['01.02.2030', pd.Timestamp(2031, 5, 6), np.nan],
+        'Nr.': np.array([1, 2, 3], dtype=np.int64),
+    })
+
+
+def test_round_trip_keeps_values_and_types(register):
+    cache = ParsedDataCache(register)
+    df = mixed_frame()
+    cache.store(df)
+    loaded = cache.load()
+    assert list(loaded.columns) == list(df.columns)
+    assert loaded['Nume'].tolist() == ['Ștefănescu', None, 'Țurcanu']
+    assert loaded['Număr certificat'].tolist() == [123456, 'AB-7', 1.5]
+    assert loaded['Data expirare'][1] == pd.Timestamp(2031, 5, 6)
+    assert loaded['Data expirare'][2] is None
+    assert loaded['Nr.'].dtype == np.int64
+
+
+def test_content_change_invalidates_even_with_same_size_and_mtime(register):
+    cache = ParsedDataCache(register)
+    cache.store(mixed_frame())
+    stat = register.stat()
+    register.write_bytes(b'CONTINUT REGISTRU')
+    os.utime(register, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.load() is None
+
+
+def test_mtime_change_invalidates(register):
+    cache = ParsedDataCache(register)
+    cache.store(mixed_frame())
+    stat = register.stat()
+    os.utime(register, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.load() is None
+
+
+def test_version_change_invalidates(register, monkeypatch):
+    cache = ParsedDataCache(register)
+    cache.store(mixed_frame())
+    monkeypatch.setattr(ParsedDataCache, 'VERSION', ParsedDataCache.VERSION + 1)
+    assert cache.load() is None
+
+
+def test_corrupt_cache_is_ignored(register):
+    cache = ParsedDataCache(register)
+    cache.path.write_bytes(b'nu este un fisier npz')
+    assert cache.load() is None
+
+
+def test_engine_reads_valid_cache_and_rereads_changed_register(tmp_path):
+    path = tmp_path / 'registru.xlsx'
+    df = pd.DataFrame([make_certificate(numar=str(row)).to_dict() for row in range(8)])
+    df.to_excel(path, index=False)
+    # Cache-ul este scris în fundal; aici sincron, pentru determinism
+    ParsedDataCache(path).store(df.iloc[:5])
+    assert len(ExcelStorageEngine(path).load()) == 5
+
+    df.iloc[:3].to_excel(path, index=False)
+    assert len(ExcelStorageEngine(path).load()) == 3
@@ -0,0 +1,73 @@
+"""
+Teste pentru indexul de căutare text (models.search_index)
+"""
+import numpy as np
+import pytest
+
+from models.search_index import NGRAM, SearchIndex, fold_text, ngrams
+
+
+DISPLAY = {
+    'Nume': ['Ștefănescu', 'Popescu', 'Ţurcanu', 'Ionescu', 'Popa'],
+    'Prenume': ['Ion', 'Ștefan', 'Ana', 'Mihai', 'Ioana'],
+    'Observații': ['', 'mutat la Iași', '', 'ÎNTÂRZIERE', 'pop-up'],
+}
+
+
+def _expected(display, query: str) -> list:
+    """Rezultatul căutării prin parcurgerea tuturor textelor"""
+    query = fold_text(query.strip())
+    rows = zip(*display.values())
+    return [any(query in fold_text(text) for text in row) for row in rows]
+
+
+def test_fold_text():
+    assert fold_text('Ștefan') == fold_text('Ştefan') == fold_text('STEFAN') == 'stefan'
+    assert fold_text('Țăndărei Î') == 'tandarei i'
+
+
+def test_ngrams():
+    assert ngrams('ab') == {'ab'}
+    assert ngrams('popa') == {'pop', 'opa'}
+    assert all(len(gram) == NGRAM for gram in ngrams('stefanescu'))
+
+
+@pytest.mark.parametrize('query', [
+    'stef', 'ȘTEF', 'escu', 'pop', 'po', 'p', 'iasi', 'Iași', 'intar', 'tur', 'ion',
+    'a', 'xyz', 'popescux', 'opa', '   ',
+])
+def test_mask_matches_substring_search(query):
+    index = SearchIndex(DISPLAY)
+    assert index.mask(query).tolist() == _expected(DISPLAY, query)
+
+
+def test_mask_within_checks_only_candidates():
+    index = SearchIndex(DISPLAY)
+    within = index.mask('po')
+    assert within.tolist() == [False, True, False, False, True]
+    assert index.mask('popa', within).tolist() == [False, False, False, False, True]
+    # Rândurile din afara candidaților nu sunt verificate
+    assert index.mask('a', within).tolist() == [False, True, False, False, True]
+    assert index.mask('', within) is not within
+
+
+def test_extend_update_remove():
+    index = SearchIndex({name: values[:3] for name, values in DISPLAY.items()})
+    index.extend({name: values[3:] for name, values in DISPLAY.items()})
+    assert len(index) == 5
+    assert index.mask('mihai').tolist() == [False, False, False, True, False]
+
+    index.update(3, {'Nume': ['Dumitrescu'], 'Prenume': ['Ștefania'], 'Observații': ['']})
+    assert index.mask('stefan').tolist() == [True, True, False, True, False]
+    assert not index.mask('mihai').any()
+
+    index.remove(0)
+    assert len(index) == 4
+    assert index.mask('stefan').tolist() == [True, False, True, False]
+
+
+def test_empty_index():
+    index = SearchIndex({'Nume': []})
+    assert len(index) == 0
+    assert index.mask('pop').tolist() == []
+    assert index.matching_values('pop').dtype == np.int64
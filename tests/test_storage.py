@@ -0,0 +1,207 @@
+"""
+Teste pentru motoarele de stocare (models.storage)
+"""
+import sqlite3
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_certificates_df
+from controllers.data_loader import DataLoader
+from models.certificate import ID_COLUMN
+from models.data_manager import DataManager
+from models.filter_engine import FilterEngine
+from models.storage import (ExcelStorageEngine, SQLiteStorageEngine, apply_change,
+                            concat_chunks, create_storage_engine, split_frame)
+from tests.conftest import make_certificate
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """Un DataFrame cu certificate valide, expirate în zile diferite"""
+    df = pd.DataFrame([make_certificate(numar=str(row), expira_peste=row * 10 - 20).to_dict()
+                       for row in range(rows)])
+    df[ID_COLUMN] = range(1, rows + 1)
+    return df
+
+
+def make_database(path, rows: int = 20) -> SQLiteStorageEngine:
+    """Creează o bază de date SQLite cu rânduri sintetice"""
+    df = make_certificates_df(rows)
+    df[ID_COLUMN] = range(1, rows + 1)
+    engine = SQLiteStorageEngine(path)
+    engine.save(df)
+    engine.close()
+    return engine
+
+
+def test_engine_chosen_by_suffix(tmp_path):
+    assert isinstance(create_storage_engine(tmp_path / 'a.db'), SQLiteStorageEngine)
+    assert isinstance(create_storage_engine(tmp_path / 'a.SQLITE3'), SQLiteStorageEngine)
+    assert isinstance(create_storage_engine(tmp_path / 'a.xlsx'), ExcelStorageEngine)
+
+
+def test_apply_change_addresses_rows_by_id():
+    df = make_frame(4)
+    df[ID_COLUMN] = [10, 20, 30, 40]
+    df = apply_change(df, 'update', data={'Nume': 'Ionescu'}, record_id=30)
+    df = apply_change(df, 'delete', record_id=10)
+    df = apply_change(df, 'add', data={**make_certificate(numar='9').to_dict(), ID_COLUMN: 50})
+    assert df[ID_COLUMN].tolist() == [20, 30, 40, 50]
+    assert df['Nume'].iloc[1] == 'Ionescu'
+
+
+def test_excel_round_trip(tmp_path):
+    df = make_frame(12)
+    ExcelStorageEngine(tmp_path / 'registru.xlsx').save(df)
+    loaded = ExcelStorageEngine(tmp_path / 'registru.xlsx').load()
+    assert loaded['Nume'].tolist() == df['Nume'].tolist()
+    assert loaded['Data expirare'].astype(str).tolist() == df['Data expirare'].tolist()
+
+
+def test_sqlite_round_trip(tmp_path):
+    path = tmp_path / 'date.db'
+    df = make_frame(5)
+    engine = SQLiteStorageEngine(path)
+    engine.save(df)
+    engine.close()
+
+    engine = SQLiteStorageEngine(path)
+    df = engine.load()
+    assert df[ID_COLUMN].tolist() == [1, 2, 3, 4, 5]
+    assert df['Data expirare'].str.match(r'\d{2}\.\d{2}\.\d{4}$').all()
+
+    data = make_certificate(serie='XY', numar='7').to_dict()
+    engine.record(df, 'update', data=data, record_id=4)
+    engine.record(df, 'delete', record_id=1)
+    updated = engine.load().set_index(ID_COLUMN)
+    assert updated['Serie certificat'].tolist() == ['AB', 'AB', 'XY', 'AB']
+    assert updated.loc[4, 'Data nașterii'] == '17.05.1980'
+    engine.close()
+
+    with sqlite3.connect(str(path)) as conn:
+        (stored,) = conn.execute("SELECT data_nasterii FROM certificate WHERE id = 4").fetchone()
+    assert stored == '1980-05-17'
+
+
+def test_expiring_certificates_match_on_both_engines(tmp_path):
+    df = make_frame(10)
+    expected = None
+    for name in ('registru.xlsx', 'date.db'):
+        create_storage_engine(tmp_path / name).save(df)
+        manager = DataManager(str(tmp_path / name))
+        manager.delete_certificate(1)
+        expiring = manager.get_expiring_certificates(30)
+        assert [certificate.numar_certificat for certificate in expiring] == \
+            [str(row) for row in (1, 2, 3, 4, 5)]
+        expected = expected or expiring
+        assert expiring == expected
+
+
+def test_sqlite_queries_use_levels_and_expiry_dates(tmp_path):
+    df = make_frame(10)
+    df['Nivel certificat'] = ['S', 'SS', 'SSID', 'SSv', 'S'] * 2
+    engine = create_storage_engine(tmp_path / 'date.db')
+    engine.save(df)
+    today = date.today()
+    in_10_days, in_30_days = today + timedelta(days=10), today + timedelta(days=30)
+    assert engine.query_ids(levels=['S']).tolist() == [1, 5, 6, 10]
+    assert engine.query_ids(levels=['SS', 'SSID'], last_expiry=in_10_days).tolist() == [2, 3]
+    assert engine.query_ids(first_expiry=today, last_expiry=in_30_days).tolist() == [3, 4, 5, 6]
+    assert engine.query_ids().tolist() == list(range(1, 11))
+    engine.close()
+    assert create_storage_engine(tmp_path / 'registru.xlsx').query_ids(levels=['S']) is None
+
+
+@pytest.mark.parametrize('name', ['registru.xlsx', 'date.db'])
+def test_manager_filter_masks_match_store(tmp_path, monkeypatch, name):
+    df = make_frame(12)
+    df['Nivel certificat'] = ['S', 'SS', 'SSID', 'SSv'] * 3
+    create_storage_engine(tmp_path / name).save(df)
+    manager = DataManager(str(tmp_path / name))
+    manager.delete_certificate(2)
+    manager.add_certificate(make_certificate(serie='ZZ', numar='1', expira_peste=5,
+                                             nivel_certificat='SSID'))
+    store = manager.get_store()
+    answers = []
+    query_ids = manager._engine.query_ids
+
+    def recording_query_ids(**criteria):
+        answers.append(query_ids(**criteria))
+        return answers[-1]
+
+    monkeypatch.setattr(manager._engine, 'query_ids', recording_query_ids)
+
+    assert manager.level_mask([1, 2]).tolist() == \
+        np.isin(store.columns['nivel_certificat'], [1, 2]).tolist()
+    for months in (-1, 0, 1, 3):
+        assert manager.expiration_filter_mask(months).tolist() == \
+            store.expiration_filter_mask(months).tolist()
+    assert manager.expiring_mask(30).tolist() == store.expiring_mask(30).tolist()
+
+    filters = FilterEngine(manager)
+    filters.set_store(store)
+    filters.set_levels([3])
+    filters.set_expiry(1)
+    found = [store.certificate(position) for position in np.flatnonzero(filters.mask)]
+    assert [(certificate.serie_certificat, certificate.numar_certificat)
+            for certificate in found] == [('AB', '2'), ('ZZ', '1')]
+    # Doar baza SQLite răspunde din indecși; pentru Excel se filtrează în memorie
+    assert len(answers) == 7
+    assert all((answer is None) == name.endswith('.xlsx') for answer in answers)
+
+
+def test_split_and_concat_round_trip():
+    df = make_frame(25)
+    chunks = list(split_frame(df, 10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert concat_chunks(chunks).equals(df)
+
+
+def test_split_empty_frame_yields_one_chunk():
+    chunks = list(split_frame(make_frame(0), 10))
+    assert len(chunks) == 1
+    assert list(concat_chunks(chunks).columns) == list(chunks[0].columns)
+
+
+def test_sqlite_load_on_thread_then_write_on_main_thread(tmp_path):
+    make_database(tmp_path / 'date.db', rows=5)
+    engine = SQLiteStorageEngine(tmp_path / 'date.db')
+    loaded = []
+    reader = threading.Thread(target=lambda: loaded.append(engine.load()))
+    reader.start()
+    reader.join()
+
+    data = make_certificate(serie='ZZ', numar='9').to_dict()
+    engine.record(loaded[0], 'add', data=data, record_id=6)
+    engine.record(loaded[0], 'delete', record_id=1)
+    assert engine.load()[ID_COLUMN].tolist() == [2, 3, 4, 5, 6]
+    engine.close()
+
+
+def test_data_loader_then_crud_on_main_thread(qapp, tmp_path):
+    path = tmp_path / 'date.db'
+    make_database(path, rows=30)
+    manager = DataManager(str(path), load=False)
+    chunks = []
+    loader = DataLoader(manager, chunk_size=8)
+    loader.load_finished.connect(chunks.append)
+    loader.start()
+    assert loader.wait(10000)
+    qapp.processEvents()
+    assert len(chunks) == 1
+    manager.finish_load(chunks[0])
+
+    manager.add_certificate(make_certificate(serie='ZZ', numar='9'))
+    new_id = manager.find_duplicate('ZZ', '9')
+    manager.update_certificate(new_id, make_certificate(serie='ZZ', numar='9', nume='Ionescu'))
+    manager.delete_certificate(1)
+    manager.flush()
+
+    with sqlite3.connect(str(path)) as conn:
+        rows = dict(conn.execute("SELECT id, nume FROM certificate").fetchall())
+    assert len(rows) == 30
+    assert 1 not in rows
+    assert rows[new_id] == 'Ionescu'
@@ -0,0 +1,162 @@
+"""
+Teste pentru modelul tabelului (views.table_model): sortare, filtru și delte
+"""
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPersistentModelIndex, Qt
+
+from benchmarks.synthetic import make_certificates_df
+from models.certificate import COLUMN_NAMES, ID_COLUMN
+from models.certificate_store import CertificateStore
+from models.data_manager import DataManager
+from models.exporter import StreamingExcelExporter
+from models.filter_engine import FilterEngine
+from tests.conftest import make_certificate
+from views.table_model import CertificateTableModel, ID_ROLE
+
+NUME_COLUMN = COLUMN_NAMES.index('Nume')
+EXPIRY_COLUMN = COLUMN_NAMES.index('Data expirare')
+
+
+@pytest.fixture
+def manager(tmp_path) -> DataManager:
+    """Manager de date cu 60 de certificate sintetice"""
+    df = make_certificates_df(60)
+    df[ID_COLUMN] = range(1, 61)
+    StreamingExcelExporter(df).write(tmp_path / 'registru.xlsx')
+    return DataManager(str(tmp_path / 'registru.xlsx'), journal_mode=True)
+
+
+def make_store() -> CertificateStore:
+    """Stocare cu patru certificate, în altă ordine decât cea alfabetică"""
+    return CertificateStore.from_certificates([
+        make_certificate(numar='1', nume='Popa', data_expirare=date(2031, 1, 10), id=11),
+        make_certificate(numar='2', nume='Albu', data_expirare=date(2030, 12, 1), id=12),
+        make_certificate(numar='3', nume='Popa', data_expirare=date(2029, 2, 3), id=13),
+        make_certificate(numar='4', nume='Dan', data_expirare=date(2032, 5, 6), id=14),
+    ])
+
+
+def visible_ids(model: CertificateTableModel) -> list:
+    """ID-urile rândurilor afișate, în ordine"""
+    return [model.id_of_row(row) for row in range(model.rowCount())]
+
+
+def expected_ids(model: CertificateTableModel, store, mask) -> list:
+    """ID-urile afișate de un model nou, construit de la zero"""
+    fresh = CertificateTableModel()
+    fresh.set_sort_columns(model.sort_columns())
+    fresh.set_store(store, mask)
+    return visible_ids(fresh)
+
+
+def assert_consistent(model: CertificateTableModel, store, mask):
+    """Modelul actualizat prin delte este identic cu unul reconstruit"""
+    assert visible_ids(model) == expected_ids(model, store, mask)
+    assert model.total_count() == len(store)
+    for row in range(model.rowCount()):
+        assert model._row_of(model.position_of_row(row)) == row
+
+
+def column_texts(model, column: int) -> list:
+    """Textele afișate într-o coloană, în ordinea rândurilor"""
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def test_cells_come_from_the_store(qapp):
+    model = CertificateTableModel()
+    model.set_store(make_store())
+    assert model.rowCount() == 4 and model.columnCount() == len(COLUMN_NAMES)
+    assert column_texts(model, COLUMN_NAMES.index('Nr.')) == ['1', '2', '3', '4']
+    assert column_texts(model, NUME_COLUMN) == ['Popa', 'Albu', 'Popa', 'Dan']
+    assert model.data(model.index(1, EXPIRY_COLUMN)) == '01.12.2030'
+    assert model.data(model.index(3, 0), ID_ROLE) == 14
+    assert model.headerData(NUME_COLUMN, Qt.Orientation.Horizontal) == 'Nume'
+
+
+def test_sort_is_stable_and_dates_are_chronological(qapp):
+    model = CertificateTableModel()
+    model.set_store(make_store())
+    model.sort(NUME_COLUMN)
+    assert visible_ids(model) == [12, 14, 11, 13]
+    model.sort(EXPIRY_COLUMN, Qt.SortOrder.DescendingOrder)
+    assert visible_ids(model) == [14, 11, 12, 13]
+    model.set_sort_columns([(NUME_COLUMN, Qt.SortOrder.DescendingOrder),
+                            (EXPIRY_COLUMN, Qt.SortOrder.AscendingOrder)])
+    assert visible_ids(model) == [13, 11, 14, 12]
+
+
+def test_sort_keeps_persistent_indexes(qapp):
+    model = CertificateTableModel()
+    model.set_store(make_store())
+    persistent = QPersistentModelIndex(model.index(3, 0))
+    model.sort(NUME_COLUMN)
+    assert model.id_of_row(persistent.row()) == 14
+
+
+def test_mask_filters_rows_in_sort_order(qapp):
+    model = CertificateTableModel()
+    model.set_store(make_store(), np.array([True, True, False, True]))
+    model.sort(NUME_COLUMN)
+    assert visible_ids(model) == [12, 14, 11]
+    persistent = QPersistentModelIndex(model.index(1, 0))
+    model.set_mask(model.store.text_mask('popa'))
+    assert visible_ids(model) == [11, 13]
+    assert not persistent.isValid()
+    model.set_mask(None)
+    assert model.rowCount() == model.total_count() == 4
+
+
+@pytest.mark.parametrize('sort_columns', [
+    [],
+    [(NUME_COLUMN, Qt.SortOrder.AscendingOrder)],
+    [(EXPIRY_COLUMN, Qt.SortOrder.DescendingOrder), (NUME_COLUMN, Qt.SortOrder.AscendingOrder)],
+])
+def test_deltas_match_full_rebuild(qapp, manager, sort_columns):
+    store = manager.get_store()
+    model = CertificateTableModel()
+    model.set_sort_columns(sort_columns)
+    model.set_store(store, store.text_mask('an'))
+
+    def apply(op, certificate_id, position):
+        mask = store.text_mask('an')
+        if op == DataManager.CHANGE_ADD:
+            model.insert_position(position, mask)
+        elif op == DataManager.CHANGE_UPDATE:
+            model.update_position(position, mask)
+        elif op == DataManager.CHANGE_DELETE:
+            model.remove_position(position, mask)
+
+    manager.add_change_listener(apply)
+    rng = random.Random(7)
+    names = ['Anghel', 'Zamfir', 'Ionescu', 'Ștefan', 'Bălan']
+    for step in range(40):
+        ids = store.ids.tolist()
+        action = rng.choice(['add', 'update', 'delete'])
+        if action == 'add':
+            manager.add_certificate(make_certificate(serie='T', numar=str(step),
+                                                     nume=rng.choice(names),
+                                                     expira_peste=rng.randint(-30, 900)))
+        elif action == 'update':
+            record_id = rng.choice(ids)
+            current = manager.get_certificate(record_id)
+            manager.update_certificate(record_id, current.replace(nume=rng.choice(names)))
+        else:
+            manager.delete_certificate(rng.choice(ids))
+        assert_consistent(model, store, store.text_mask('an'))
+
+
+def test_filter_change_keeps_rows_in_sort_order(qapp, manager):
+    store = manager.get_store()
+    filters = FilterEngine()
+    filters.set_store(store)
+    model = CertificateTableModel()
+    model.set_sort_columns([(NUME_COLUMN, Qt.SortOrder.AscendingOrder)])
+    model.set_store(store)
+    for query in ('a', 'an', 'ana', 'an', ''):
+        changed = filters.set_text(query)
+        model.set_mask(filters.mask, changed)
+        assert_consistent(model, store, filters.mask)
@@ -0,0 +1,84 @@
+"""
+Teste pentru lățimile coloanelor tabelului (views.table_view)
+"""
+from models.certificate import COLUMN_NAMES
+from models.certificate_store import CertificateStore
+from tests.conftest import make_certificate
+from utils.config_manager import ConfigManager
+from views import table_view
+from views.table_view import CertificateTableView
+
+NUME_COLUMN = COLUMN_NAMES.index('Nume')
+# Ultima coloană se întinde odată cu tabelul, deci nu este comparată
+SIZED_COLUMNS = range(len(COLUMN_NAMES) - 1)
+
+
+def make_store(count: int, long_row: int = -1) -> CertificateStore:
+    """Stocare cu nume scurte și, opțional, un nume foarte lung pe un rând"""
+    return CertificateStore.from_certificates([
+        make_certificate(numar=str(row), id=row + 1,
+                         nume='Constantinescu-Marinescu-Popovici' if row == long_row
+                         else 'N' * (row % 7 + 1), observatii='o' * (row % 40))
+        for row in range(count)
+    ])
+
+
+def section_sizes(view: CertificateTableView) -> list:
+    """Lățimile coloanelor comparate"""
+    header = view.horizontalHeader()
+    return [header.sectionSize(column) for column in SIZED_COLUMNS]
+
+
+def test_estimate_matches_resize_to_contents(qapp):
+    store = make_store(30)
+    view = CertificateTableView()
+    view.load_store(store)
+    measured = CertificateTableView()
+    measured.table_model.set_store(store)
+    measured.resizeColumnsToContents()
+    assert section_sizes(view) == section_sizes(measured)
+
+
+def test_estimate_samples_rows_but_keeps_longest_text(qapp, monkeypatch):
+    store = make_store(100, long_row=37)
+    full = CertificateTableView()
+    full.load_store(store)
+    # Rândul 37 nu face parte din eșantionul rândurilor 0, 20, 40, ...
+    monkeypatch.setattr(table_view, 'COLUMN_WIDTH_SAMPLE', 5)
+    sampled = CertificateTableView()
+    sampled.load_store(store)
+    assert section_sizes(sampled)[NUME_COLUMN] == section_sizes(full)[NUME_COLUMN]
+
+
+def test_estimate_is_reused_until_longest_text_changes(qapp):
+    store = make_store(30)
+    view = CertificateTableView()
+    widths = view._column_widths(store)
+    store.update(5, make_certificate(numar='4', nume='N' * 3))
+    assert view._column_widths(store) is widths
+    store.update(5, make_certificate(numar='4', nume='Constantinescu-Marinescu'))
+    longer = view._column_widths(store)
+    assert longer[NUME_COLUMN] > widths[NUME_COLUMN]
+
+
+def test_manual_width_is_saved_and_restored(qapp, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    store = make_store(30)
+    config = ConfigManager()
+    view = CertificateTableView()
+    view.column_widths_changed.connect(config.set_column_widths)
+    view.load_store(store)
+    estimated = section_sizes(view)
+    # Redimensionare manuală (ca tragerea marginii din antet)
+    view.horizontalHeader().resizeSection(NUME_COLUMN, 321)
+    assert view.user_column_widths() == {'Nume': 321}
+
+    restored = CertificateTableView()
+    restored.set_user_column_widths(ConfigManager().get_column_widths())
+    restored.load_store(store)
+    expected = list(estimated)
+    expected[NUME_COLUMN] = 321
+    assert section_sizes(restored) == expected
+    # Reîncărcarea reestimează doar coloanele nesetate manual
+    restored.load_store(make_store(30, long_row=3))
+    assert section_sizes(restored)[NUME_COLUMN] == 321
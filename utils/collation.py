@@ -0,0 +1,107 @@
+"""
+Ordonare românească a textelor (chei de colaționare) și normalizare pentru căutare
+
+Ambele folosesc același tabel pe caractere, aplicat cu str.translate:
+  - cheia de colaționare ordonează literele după alfabetul românesc
+    (a < ă < â < b ... i < î ... s < ș < t < ț < u), fără diferențe de
+    majuscule;
+  - cheia de căutare elimină diacriticele ("Ștefan" -> "stefan").
+Formele cu sedilă (ş, ţ) sunt echivalente cu cele cu virgulă (ș, ț).
+"""
+import unicodedata
+
+
+# Alfabetul românesc, în ordinea de sortare (plus q, w, y din împrumuturi)
+ALPHABET = 'aăâbcdefghiîjklmnopqrsștțuvwxyz'
+
+# Forme echivalente ale literelor (sedilă -> virgulă)
+EQUIVALENTS = {'ş': 'ș', 'ţ': 'ț'}
+
+# Literele sunt înlocuite în cheia de colaționare cu caractere din zona de uz
+# privat Unicode, în ordinea alfabetului, deci după cifre și punctuație
+_LETTER_KEYS = 0xE000
+
+# Separă cheia principală de textul original (departajare la egalitate)
+_TIEBREAK = '\x00'
+
+
+def _strip_marks(char: str) -> str:
+    """Litera de bază a unui caracter (fără semne diacritice)"""
+    decomposed = unicodedata.normalize('NFKD', char)
+    return ''.join(mark for mark in decomposed if not unicodedata.combining(mark)) or char
+
+
+class _CollationTable(dict):
+    """
+    Tabelul de translatare pentru cheia de colaționare
+
+    Literele alfabetului românesc sunt precalculate; celelalte caractere
+    non-ASCII sunt adăugate la prima întâlnire, după litera lor de bază
+    (é ordonat ca e).
+    """
+
+    def __init__(self):
+        super().__init__()
+        for rank, letter in enumerate(ALPHABET):
+            self[ord(letter)] = chr(_LETTER_KEYS + rank)
+        for variant, letter in EQUIVALENTS.items():
+            self[ord(variant)] = self[ord(letter)]
+
+    def __missing__(self, code: int) -> str:
+        """Cheia unui caracter care nu este literă românească"""
+        key = ''.join(self.get(ord(char), char) for char in _strip_marks(chr(code)))
+        self[code] = key
+        return key
+
+
+class _SearchTable(dict):
+    """
+    Tabelul de translatare pentru cheia de căutare (litere fără diacritice)
+
+    Caracterele non-ASCII sunt adăugate la prima întâlnire.
+    """
+
+    def __missing__(self, code: int) -> str:
+        """Caracterul fără semne diacritice"""
+        base = _strip_marks(chr(code))
+        self[code] = base
+        return base
+
+
+_COLLATION_TABLE = _CollationTable()
+_SEARCH_TABLE = _SearchTable()
+
+
+def collation_key(text: str) -> str:
+    """
+    Cheia de sortare românească a unui text
+
+    Textele se compară corect prin cheile lor (comparație simplă de șiruri):
+    literele după alfabetul românesc, fără diferențe de majuscule, iar la
+    egalitate după textul original.
+
+    Args:
+        text: Textul
+
+    Returns:
+        Cheia de colaționare
+    """
+    return text.casefold().translate(_COLLATION_TABLE) + _TIEBREAK + text
+
+
+def search_key(text: str) -> str:
+    """
+    Normalizează un text pentru căutare: fără majuscule și fără diacritice
+
+    "Ștefan", "Ştefan" (sedilă) și "stefan" devin toate "stefan".
+
+    Args:
+        text: Textul
+
+    Returns:
+        Textul normalizat
+    """
+    folded = text.casefold()
+    if folded.isascii():
+        return folded
+    return folded.translate(_SEARCH_TABLE)
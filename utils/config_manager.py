@@ -81,6 +81,26 @@ class ConfigManager:
         self.config['visible_columns'] = columns
         self._save_config()
     
+    def get_column_widths(self) -> dict:
+        """
+        Returnează lățimile coloanelor setate manual de utilizator
+        
+        Returns:
+            Dicționar nume coloană -> lățime (pixeli)
+        """
+        widths = self.config.get('column_widths')
+        return widths if isinstance(widths, dict) else {}
+    
+    def set_column_widths(self, widths: dict):
+        """
+        Setează lățimile coloanelor setate manual de utilizator
+        
+        Args:
+            widths: Dicționar nume coloană -> lățime (pixeli)
+        """
+        self.config['column_widths'] = widths
+        self._save_config()
+    
     def get_window_geometry(self) -> Optional[dict]:
         """
         Returnează geometria ferestrei
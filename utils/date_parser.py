@@ -0,0 +1,137 @@
+"""
+Parsare rapidă a datelor calendaristice
+
+Formatele acceptate sunt aceleași în toată aplicația: text DD.MM.YYYY sau
+YYYY-MM-DD, obiecte date/datetime (inclusiv pandas Timestamp) și numere
+seriale Excel (celule cu format General).
+"""
+from datetime import date, datetime
+from functools import lru_cache
+from numbers import Real
+from typing import Optional
+
+
+# Numărul maxim de texte distincte păstrate în memoria parserului (acoperă
+# toate zilele dintr-un interval de aproximativ 180 de ani)
+CACHE_SIZE = 65536
+
+# Numerele seriale Excel valide: 1 = 01.01.1900 ... 2958465 = 31.12.9999
+EXCEL_SERIAL_MIN = 1
+EXCEL_SERIAL_MAX = 2958465
+# Excel consideră 1900 an bisect: serialul 60 este 29.02.1900 (inexistent),
+# iar serialele de după el sunt decalate cu o zi
+EXCEL_LEAP_BUG_SERIAL = 60
+_EXCEL_ORIGIN = date(1899, 12, 31).toordinal()
+
+
+def _is_missing(value) -> bool:
+    """Verifică dacă valoarea lipsește (None, NaN, NaT sau pd.NA)"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError:
+        # pd.NA nu poate fi convertit în bool
+        return True
+
+
+def excel_serial_to_date(serial: float) -> Optional[date]:
+    """
+    Convertește un număr serial Excel (sistemul 1900) în dată
+
+    Partea fracționară (ora) este ignorată.
+
+    Args:
+        serial: Numărul serial
+
+    Returns:
+        Data sau None dacă numărul nu este un serial valid
+    """
+    days = int(serial)
+    if not EXCEL_SERIAL_MIN <= days <= EXCEL_SERIAL_MAX or days == EXCEL_LEAP_BUG_SERIAL:
+        return None
+    if days > EXCEL_LEAP_BUG_SERIAL:
+        days -= 1
+    return date.fromordinal(_EXCEL_ORIGIN + days)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_text(text: str) -> Optional[date]:
+    """
+    Parsează un text DD.MM.YYYY sau YYYY-MM-DD (memorat)
+
+    Textele cu lungime fixă sunt despărțite pe poziții, fără strptime;
+    celelalte (de exemplu 1.2.2020) trec prin strptime, cu aceleași reguli
+    ca înainte.
+    """
+    if len(text) == 10:
+        if text[2] == '.' and text[5] == '.':
+            day, month, year = text[:2], text[3:5], text[6:]
+        elif text[4] == '-' and text[7] == '-':
+            year, month, day = text[:4], text[5:7], text[8:]
+        else:
+            day = month = year = ''
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                return None
+
+    for fmt in ('%d.%m.%Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+def try_parse_date(value) -> Optional[date]:
+    """
+    Parsează o dată, fără excepții
+
+    Args:
+        value: Text, date/datetime/Timestamp sau număr serial Excel
+
+    Returns:
+        Data sau None dacă valoarea lipsește sau este invalidă
+    """
+    if _is_missing(value):
+        return None
+    if isinstance(value, str):
+        return _parse_text(value.strip())
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, Real) and not isinstance(value, bool):
+        return excel_serial_to_date(value)
+    return None
+
+
+def parse_date(value) -> date:
+    """
+    Parsează o dată
+
+    Args:
+        value: Text, date/datetime/Timestamp sau număr serial Excel
+
+    Returns:
+        Data
+
+    Raises:
+        ValueError: Dacă valoarea lipsește sau nu este o dată validă
+    """
+    if _is_missing(value):
+        raise ValueError("Data lipsă sau invalidă")
+    if isinstance(value, str) and not value.strip():
+        raise ValueError("Data goală")
+
+    parsed = try_parse_date(value)
+    if parsed is None:
+        raise ValueError(f"Format dată invalid: {value} (tip: {type(value).__name__})")
+    return parsed
+
+
+def cache_info():
+    """Statisticile memoriei parserului (hits, misses, maxsize, currsize)"""
+    return _parse_text.cache_info()
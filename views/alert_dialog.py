@@ -2,18 +2,31 @@
 Dialog de alertă pentru certificate care expiră
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-                              QPushButton, QTableWidget, QTableWidgetItem,
+                              QPushButton, QTableWidget,
                               QHeaderView, QAbstractItemView)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QFont
-from models.certificate import Certificate
+from PyQt6.QtGui import QFont
+from datetime import date
+from typing import Optional
+import numpy as np
+from models.certificate import (Certificate, STATUS_ATENTIE, STATUS_EXPIRAT, STATUS_URGENT,
+                                expiry_status)
+from models.certificate_store import CertificateStore
+from views.palette import shared_palette
+
+
+# Textul coloanei Status pentru fiecare status din alertă
+STATUS_LABELS = {
+    STATUS_EXPIRAT: "🔴 EXPIRAT",
+    STATUS_URGENT: "🔴 URGENT",
+    STATUS_ATENTIE: "🟡 ATENȚIE",
+}
 
 
 class AlertDialog(QDialog):
     """Dialog pentru afișarea alertelor de expirare certificate"""
     
     def __init__(self, expirate: list[Certificate], urgente: list[Certificate], 
-                 atentie: list[Certificate], parent=None):
+                 atentie: list[Certificate], parent=None, today: Optional[date] = None):
         """
         Inițializează dialogul de alertă
         
@@ -22,12 +35,14 @@ class AlertDialog(QDialog):
             urgente: Lista certificate urgente (< 1 lună)
             atentie: Lista certificate cu atenție (1-3 luni)
             parent: Widget părinte
+            today: Data de referință folosită la împărțirea pe categorii
         """
         super().__init__(parent)
         
         self.expirate = expirate
         self.urgente = urgente
         self.atentie = atentie
+        self.today = today or date.today()
         
         self.setWindowTitle("⚠️ ALERTĂ - Certificate care Expiră")
         self.setModal(True)
@@ -145,31 +160,22 @@ class AlertDialog(QDialog):
         """Populează tabelul cu datele"""
         self.table.setSortingEnabled(False)
         
-        # Adaugă certificate în ordinea priorității
-        all_certs = []
-        
-        # Expirate (prioritate maximă)
-        for cert in self.expirate:
-            all_certs.append(("🔴 EXPIRAT", cert, "#8B0000"))
-        
-        # Urgente
-        for cert in self.urgente:
-            all_certs.append(("🔴 URGENT", cert, "#FFB6C1"))
+        # Certificate în ordinea priorității: expirate, urgente, atenție
+        all_certs = ([(STATUS_EXPIRAT, cert) for cert in self.expirate]
+                     + [(STATUS_URGENT, cert) for cert in self.urgente]
+                     + [(STATUS_ATENTIE, cert) for cert in self.atentie])
         
-        # Atenție
-        for cert in self.atentie:
-            all_certs.append(("🟡 ATENȚIE", cert, "#FFFF99"))
+        # Celulele sunt copii ale prototipurilor din paleta comună (fundalul,
+        # fontul îngroșat și flagurile nu sunt create pe rând)
+        palette = shared_palette()
+        self.table.setRowCount(len(all_certs))
         
-        # Adaugă rânduri
-        for status_text, cert, color in all_certs:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            zile = cert.zile_pana_la_expirare()
+        for row, (status, cert) in enumerate(all_certs):
+            zile = cert.zile_pana_la_expirare(self.today)
             zile_text = "EXPIRAT" if zile < 0 else f"{zile}"
             
             data = [
-                status_text,
+                STATUS_LABELS[status],
                 cert.grad,
                 cert.nume,
                 cert.prenume,
@@ -180,20 +186,9 @@ class AlertDialog(QDialog):
                 zile_text
             ]
             
-            bg_color = QColor(color)
-            
             for col, value in enumerate(data):
-                item = QTableWidgetItem(str(value))
-                item.setBackground(bg_color)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                
                 # Bold pentru status
-                if col == 0:
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                
-                self.table.setItem(row, col, item)
+                self.table.setItem(row, col, palette.status_item(status, str(value), bold=col == 0))
         
         self.table.setSortingEnabled(True)
     
@@ -212,20 +207,53 @@ class AlertDialog(QDialog):
         expirate = []
         urgente = []
         atentie = []
+        buckets = {STATUS_EXPIRAT: expirate, STATUS_URGENT: urgente, STATUS_ATENTIE: atentie}
         
+        # O singură dată de referință pentru toate certificatele
+        today = date.today()
         for cert in certificates:
-            zile = cert.zile_pana_la_expirare()
+            bucket = buckets.get(expiry_status(cert.zile_pana_la_expirare(today)))
+            if bucket is not None:
+                bucket.append(cert)
+        
+        # Afișează dialog doar dacă există probleme
+        if expirate or urgente or atentie:
+            dialog = AlertDialog(expirate, urgente, atentie, parent, today)
+            dialog.exec()
+            return True
+        
+        return False
+    
+    @staticmethod
+    def check_store_and_show_alerts(store: CertificateStore, parent=None) -> bool:
+        """
+        Verifică certificatele din stocarea pe coloane și afișează alerta
+        
+        Statusurile sunt luate din instantaneul de expirare al stocării
+        (calculat vectorizat, o dată pe zi), iar doar certificatele din
+        alertă sunt construite ca obiecte.
+        
+        Args:
+            store: Stocarea certificatelor
+            parent: Widget părinte
             
-            if zile < 0:
-                expirate.append(cert)
-            elif zile <= 30:
-                urgente.append(cert)
-            elif zile <= 90:
-                atentie.append(cert)
+        Returns:
+            True dacă au fost găsite alerte și dialogul a fost afișat
+        """
+        today = date.today()
+        status = store.expiry(today).status
+        
+        def bucket(value: int) -> list[Certificate]:
+            positions = np.flatnonzero(status == value).tolist()
+            return [store.certificate(position) for position in positions]
+        
+        expirate = bucket(STATUS_EXPIRAT)
+        urgente = bucket(STATUS_URGENT)
+        atentie = bucket(STATUS_ATENTIE)
         
         # Afișează dialog doar dacă există probleme
         if expirate or urgente or atentie:
-            dialog = AlertDialog(expirate, urgente, atentie, parent)
+            dialog = AlertDialog(expirate, urgente, atentie, parent, today)
             dialog.exec()
             return True
         
@@ -6,22 +6,27 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
                               QPushButton, QMessageBox, QLabel)
 from PyQt6.QtCore import QDate, Qt
 from datetime import datetime
+from typing import Callable, Optional
 from models.certificate import Certificate, GRADE_MILITARE, NIVELURI_CERTIFICATE
 
 
 class CertificateDialog(QDialog):
     """Dialog pentru adăugare/editare certificate"""
     
-    def __init__(self, parent=None, certificate: Certificate = None):
+    def __init__(self, parent=None, certificate: Certificate = None,
+                 duplicate_check: Optional[Callable[[str, str], bool]] = None):
         """
         Inițializează dialogul
         
         Args:
             parent: Widget părinte
             certificate: Certificat de editat (None pentru adăugare)
+            duplicate_check: Funcție (serie, număr) -> True dacă există deja
+                alt certificat cu aceeași serie și număr
         """
         super().__init__(parent)
         self.certificate = certificate
+        self.duplicate_check = duplicate_check
         self.is_edit_mode = certificate is not None
         
         self.setWindowTitle("Editare Certificat" if self.is_edit_mode else "Adăugare Certificat")
@@ -172,6 +177,10 @@ class CertificateDialog(QDialog):
         if not self.numar_edit.text().strip():
             return False, "Numărul certificatului este obligatoriu"
         
+        if self.duplicate_check and self.duplicate_check(self.serie_edit.text().strip(),
+                                                         self.numar_edit.text().strip()):
+            return False, "Există deja un certificat cu această serie și acest număr"
+        
         # Verifică date
         data_nasterii = self.data_nasterii_edit.date().toPyDate()
         data_eliberare = self.data_eliberare_edit.date().toPyDate()
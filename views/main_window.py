@@ -1,39 +1,167 @@
 """
 Fereastra principală a aplicației
 """
+import time
+from typing import Dict, List, Optional
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QPushButton, QLineEdit, QLabel, QMessageBox,
                               QFileDialog, QStatusBar, QToolBar, QComboBox,
                               QDialog, QCheckBox, QDialogButtonBox, QGridLayout,
-                              QSizePolicy)
-from PyQt6.QtCore import Qt
+                              QSizePolicy, QProgressDialog, QApplication, QProgressBar)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon
 from views.table_view import CertificateTableView
 from views.dialogs import CertificateDialog
+from controllers.background_saver import BackgroundSaver
+from controllers.data_loader import DataLoader
 from models.data_manager import DataManager
-from models.certificate import Certificate
+from models.certificate import Certificate, GRADE_MILITARE, NIVELURI_CERTIFICATE
+from models.certificate_store import CertificateStore
+from models.columnar import RowError
+from models.filter_engine import FilterEngine
 from utils.config_manager import ConfigManager
 
 
 class MainWindow(QMainWindow):
     """Fereastra principală a aplicației"""
     
-    def __init__(self, data_manager: DataManager):
+    # Emis după încărcarea completă a datelor pe firul de fundal
+    loading_finished = pyqtSignal()
+    
+    # Intervalul la care jurnalul de modificări este integrat în registru
+    CHECKPOINT_INTERVAL_MS = 60 * 1000
+    
+    # Pauza de tastare după care se aplică filtrul de căutare
+    FILTER_DEBOUNCE_MS = 150
+    
+    # Întârzierea salvării lățimilor de coloane (o singură scriere per redimensionare)
+    COLUMN_WIDTHS_SAVE_MS = 500
+    
+    # Filtrul de expirare: index în dropdown -> luni (0 = toate, -1 = expirate)
+    EXPIRATION_MONTHS = {
+        0: 0,    # Toate
+        1: -1,   # Expirate
+        2: 1,    # 1 lună
+        3: 3,    # 3 luni
+        4: 6,    # 6 luni
+        5: 12    # 12 luni
+    }
+    
+    def __init__(self, data_manager: DataManager, config_manager: Optional[ConfigManager] = None,
+                 started: Optional[float] = None):
         """
         Inițializează fereastra principală
         
+        Dacă managerul de date a fost creat fără date (load=False), fereastra
+        este afișată imediat, iar datele sunt citite pe un fir de fundal și
+        adăugate în tabel pe bucăți.
+        
         Args:
             data_manager: Manager pentru date
+            config_manager: Configurația aplicației (implicit citită din fișier)
+            started: Momentul pornirii aplicației (time.perf_counter), pentru
+                măsurarea timpului până la prima afișare
         """
         super().__init__()
         
         self.data_manager = data_manager
+        self.config_manager = config_manager or ConfigManager()
+        # Numărul rândurilor invalide din fișier (calculat la încărcare)
+        self._rejected_count = 0
+        # Filtrele active ale tabelului
+        self.filters = FilterEngine(data_manager)
+        # Încărcarea în fundal (None = nicio încărcare pornită)
+        self.loader: Optional[DataLoader] = None
+        self._loading = False
+        self._loading_errors: List[RowError] = []
+        # Momentele încărcării, în ms de la pornire: prima desenare a
+        # ferestrei, primele rânduri afișate și încărcarea completă
+        self._started = time.perf_counter() if started is None else started
+        self.load_timings: Dict[str, float] = {}
         
         self.setWindowTitle("Manager Certificate Securitate")
         self.setMinimumSize(1200, 700)
         
         self._init_ui()
-        self._load_data()
+        
+        # Lățimile de coloane alese de utilizator sunt păstrate în configurație
+        self.table.set_user_column_widths(self.config_manager.get_column_widths())
+        self.column_widths_timer = QTimer(self)
+        self.column_widths_timer.setSingleShot(True)
+        self.column_widths_timer.setInterval(self.COLUMN_WIDTHS_SAVE_MS)
+        self.column_widths_timer.timeout.connect(self._save_column_widths)
+        self.table.column_widths_changed.connect(self.column_widths_timer.start)
+        
+        if self.data_manager.loaded:
+            self._load_data()
+        # Modificările sunt aplicate în tabel ca delte, fără reîncărcare
+        self.data_manager.add_change_listener(self._on_data_changed)
+        
+        # Salvare write-behind: rescrierile complete nu blochează interfața
+        self.saver = BackgroundSaver(self)
+        self.saver.save_started.connect(self._on_save_started)
+        self.saver.save_finished.connect(self._on_save_finished)
+        self.saver.save_failed.connect(self._on_save_failed)
+        self.saver.start()
+        self.data_manager.set_saver(self.saver)
+        
+        # Checkpoint periodic al jurnalului de modificări
+        self.checkpoint_timer = QTimer(self)
+        self.checkpoint_timer.timeout.connect(self._on_checkpoint_timer)
+        self.checkpoint_timer.start(self.CHECKPOINT_INTERVAL_MS)
+        
+        if not self.data_manager.loaded:
+            self._start_loading()
+    
+    def paintEvent(self, event):
+        """Desenează fereastra; reține momentul primei desenări"""
+        super().paintEvent(event)
+        if 'first_paint' not in self.load_timings:
+            self.load_timings['first_paint'] = self._elapsed_ms()
+    
+    def _elapsed_ms(self) -> float:
+        """Milisecundele trecute de la pornirea aplicației"""
+        return (time.perf_counter() - self._started) * 1000
+    
+    def _on_checkpoint_timer(self):
+        """Handler pentru checkpoint-ul periodic al jurnalului"""
+        try:
+            self.data_manager.checkpoint()
+        except Exception as e:
+            print(f"Eroare la integrarea jurnalului: {e}")
+    
+    def _on_save_started(self, count: int):
+        """Handler pentru începerea unei salvări în fundal"""
+        self.save_status_label.setText("💾 Salvare în curs...")
+    
+    def _on_save_finished(self, count: int):
+        """Handler pentru finalizarea unei salvări în fundal"""
+        self.save_status_label.setText(f"💾 Salvat ({count} modificări)")
+    
+    def _on_save_failed(self, message: str):
+        """Handler pentru eșecul unei salvări în fundal"""
+        self.save_status_label.setText("⚠️ Salvare eșuată")
+        QMessageBox.critical(self, "Eroare", f"Eroare la salvarea datelor: {message}")
+    
+    def shutdown(self):
+        """Scrie toate modificările pendinte și oprește firele de încărcare și salvare"""
+        self.checkpoint_timer.stop()
+        if self.loader is not None and self.loader.isRunning():
+            self.loader.cancel()
+            self.loader.wait()
+        if self.column_widths_timer.isActive():
+            self._save_column_widths()
+        try:
+            self.data_manager.flush()
+        except Exception as e:
+            print(f"Eroare la salvarea finală: {e}")
+        self.data_manager.set_saver(None)
+        self.saver.stop()
+    
+    def _save_column_widths(self):
+        """Salvează în configurație lățimile de coloane setate manual"""
+        self.column_widths_timer.stop()
+        self.config_manager.set_column_widths(self.table.user_column_widths())
     
     def _init_ui(self):
         """Inițializează interfața utilizator"""
@@ -55,6 +183,13 @@ class MainWindow(QMainWindow):
         self.filter_edit.setPlaceholderText("Introduceți text pentru căutare...")
         self.filter_edit.textChanged.connect(self._on_filter_changed)
         
+        # Filtrul de căutare este aplicat după o pauză de tastare; fiecare
+        # tastă nouă repornește temporizatorul și anulează filtrarea în așteptare
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self._apply_text_filter)
+        
         # Dropdown filtru expirare
         expiration_label = QLabel("Expiră în:")
         self.expiration_combo = QComboBox()
@@ -68,6 +203,17 @@ class MainWindow(QMainWindow):
         ])
         self.expiration_combo.currentIndexChanged.connect(self._on_expiration_filter_changed)
         
+        # Filtre după grad și nivel
+        grade_label = QLabel("Grad:")
+        self.grade_combo = QComboBox()
+        self.grade_combo.addItems(["Toate"] + GRADE_MILITARE)
+        self.grade_combo.currentIndexChanged.connect(self._on_grade_filter_changed)
+        
+        level_label = QLabel("Nivel:")
+        self.level_combo = QComboBox()
+        self.level_combo.addItems(["Toate"] + NIVELURI_CERTIFICATE)
+        self.level_combo.currentIndexChanged.connect(self._on_level_filter_changed)
+        
         clear_filter_btn = QPushButton("Șterge filtre")
         clear_filter_btn.clicked.connect(self._clear_filter)
         
@@ -75,6 +221,10 @@ class MainWindow(QMainWindow):
         filter_layout.addWidget(self.filter_edit)
         filter_layout.addWidget(expiration_label)
         filter_layout.addWidget(self.expiration_combo)
+        filter_layout.addWidget(grade_label)
+        filter_layout.addWidget(self.grade_combo)
+        filter_layout.addWidget(level_label)
+        filter_layout.addWidget(self.level_combo)
         filter_layout.addWidget(clear_filter_btn)
         
         main_layout.addLayout(filter_layout)
@@ -87,6 +237,19 @@ class MainWindow(QMainWindow):
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.save_status_label = QLabel()
+        self.status_bar.addPermanentWidget(self.save_status_label)
+        
+        # Starea încărcării în fundal (ascunsă după încărcare)
+        self.loading_label = QLabel()
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)
+        self.loading_bar.setMaximumWidth(150)
+        self.cancel_loading_btn = QPushButton("Anulare")
+        self.cancel_loading_btn.clicked.connect(self._cancel_loading)
+        for widget in (self.loading_label, self.loading_bar, self.cancel_loading_btn):
+            widget.hide()
+            self.status_bar.addPermanentWidget(widget)
         self._update_status_bar()
     
     def _create_toolbar(self):
@@ -140,9 +303,14 @@ class MainWindow(QMainWindow):
         # Buton Reîmprospătare
         refresh_action = QAction("🔄 Reîmprospătare", self)
         refresh_action.setStatusTip("Reîmprospătează datele")
-        refresh_action.triggered.connect(self._load_data)
+        refresh_action.triggered.connect(self._on_refresh)
         toolbar.addAction(refresh_action)
         
+        # Acțiunile care modifică sau exportă datele (dezactivate până la
+        # încărcarea completă) și cele indisponibile în timpul încărcării
+        self.data_actions = [add_action, edit_action, delete_action, import_action, export_action]
+        self.source_actions = [change_source_action, refresh_action]
+        
         toolbar.addSeparator()
         
         # Buton Selectare Coloane
@@ -165,74 +333,279 @@ class MainWindow(QMainWindow):
     def _load_data(self):
         """Încarcă datele în tabel"""
         try:
-            certificates = self.data_manager.get_all_certificates()
-            self.table.load_certificates(certificates)
-            self._update_status_bar()
+            store = self.data_manager.get_store()
+            self.table.load_store(store)
+            self.filters.set_store(store)
+            self._rejected_count = len({error.row for error in self.data_manager.rejected_rows})
+            self._apply_filters()
         except Exception as e:
             QMessageBox.critical(self, "Eroare", f"Eroare la încărcarea datelor: {str(e)}")
+        if self.data_manager.loaded:
+            # Mesajul unei încărcări anulate anterior
+            self.loading_label.hide()
+        self._update_actions()
+    
+    def _on_refresh(self):
+        """Handler pentru reîmprospătare (reia încărcarea dacă nu s-a terminat)"""
+        if self.data_manager.loaded:
+            self._load_data()
+        else:
+            self._start_loading()
+    
+    def is_loading(self) -> bool:
+        """Verifică dacă datele se încarcă în fundal"""
+        return self._loading
+    
+    def _start_loading(self):
+        """
+        Pornește încărcarea datelor pe firul de fundal
+        
+        Tabelul pornește gol și primește rândurile pe bucăți, pe măsură ce
+        fișierul este citit; filtrele și sortarea funcționează între timp.
+        Modificările datelor sunt dezactivate până la încărcarea completă.
+        """
+        store = CertificateStore.from_certificates([])
+        self.table.load_store(store)
+        self.filters.set_store(store)
+        self._loading_errors = []
+        self._rejected_count = 0
+        self.load_timings.pop('first_rows', None)
+        self.load_timings.pop('total', None)
+        
+        self.loader = DataLoader(self.data_manager, parent=self)
+        self.loader.chunk_loaded.connect(self._on_chunk_loaded)
+        self.loader.load_finished.connect(self._on_load_finished)
+        self.loader.load_failed.connect(self._on_load_failed)
+        self.loader.load_cancelled.connect(self._on_load_cancelled)
+        self._set_loading(True)
+        self.loader.start()
+    
+    def _cancel_loading(self):
+        """Handler pentru anularea încărcării"""
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loading_label.setText("⏳ Se anulează...")
+    
+    def _set_loading(self, loading: bool):
+        """Afișează sau ascunde starea încărcării"""
+        self._loading = loading
+        for widget in (self.loading_label, self.loading_bar, self.cancel_loading_btn):
+            widget.setVisible(loading)
+        if loading:
+            self.loading_label.setText("⏳ Se încarcă datele...")
+        self._update_actions()
+    
+    def _update_actions(self):
+        """Activează acțiunile potrivite stării datelor (încărcate, în curs de încărcare)"""
+        loading = self.is_loading()
+        for action in self.data_actions:
+            action.setEnabled(self.data_manager.loaded and not loading)
+        for action in self.source_actions:
+            action.setEnabled(not loading)
+    
+    def _on_chunk_loaded(self, columns, errors: List[RowError]):
+        """
+        Adaugă în tabel o bucată citită de firul de încărcare
+        
+        Args:
+            columns: Coloanele tipizate ale rândurilor valide din bucată
+            errors: Rândurile invalide din bucată
+        """
+        store = self.table.table_model.store
+        start = len(store)
+        store.extend_columns(columns)
+        self._loading_errors.extend(errors)
+        self._rejected_count = len({error.row for error in self._loading_errors})
+        # Filtrele active sunt aplicate și rândurilor noi
+        self.filters.refresh()
+        self.table.append_certificates(start, self.filters.mask)
+        if len(store) and 'first_rows' not in self.load_timings:
+            self.load_timings['first_rows'] = self._elapsed_ms()
+        self.loading_label.setText(f"⏳ Se încarcă datele... {len(store)} înregistrări")
+        self._update_status_bar()
+    
+    def _on_load_finished(self, df):
+        """
+        Preia datele după încărcarea completă
+        
+        Firul de încărcare emite un singur semnal final, după ultima bucată
+        trimisă. Anularea este verificată doar între bucăți: load_cancelled
+        vine numai dacă au rămas bucăți necitite, iar o anulare cerută după
+        ultima bucată se încheie tot aici, cu toate rândurile (datele nu
+        rămân doar pentru citire).
+        
+        Args:
+            df: Tabelul complet citit (None dacă fișierul trebuie creat)
+        """
+        store = self.table.table_model.store
+        try:
+            kept = self.data_manager.finish_load(df, store, self._loading_errors)
+        except Exception as e:
+            self._on_load_failed(str(e))
+            return
+        self.loader.wait()
+        self._set_loading(False)
+        if kept:
+            self.table.update_column_widths()
+            self._update_status_bar()
+        else:
+            # Rândurile au primit acum ID-uri: stocarea este reconstruită
+            self._load_data()
+        
+        self.load_timings['total'] = self._elapsed_ms()
+        self.loading_finished.emit()
+    
+    def _on_load_failed(self, message: str):
+        """Handler pentru eșecul încărcării în fundal"""
+        if self.loader is not None:
+            self.loader.wait()
+        self._set_loading(False)
+        reply = QMessageBox.critical(
+            self,
+            "Eroare Încărcare Date",
+            f"{message}\n\nFișier: {self.data_manager.file_path}\n\n"
+            f"Doriți să selectați alt fișier?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._on_change_source()
+    
+    def _on_load_cancelled(self):
+        """Handler pentru anularea încărcării: rândurile citite rămân afișate, doar pentru citire"""
+        self.loader.wait()
+        self._set_loading(False)
+        self.loading_label.setText("⚠️ Încărcare anulată: date incomplete, doar pentru citire "
+                                   "(Reîmprospătare pentru reluare)")
+        self.loading_label.show()
+        self._update_status_bar()
+    
+    def _on_data_changed(self, op: str, certificate_id: int, position: int):
+        """
+        Aplică în tabel o modificare a datelor (vezi DataManager.add_change_listener)
+        
+        Args:
+            op: Tipul modificării (DataManager.CHANGE_*)
+            certificate_id: ID-ul certificatului modificat
+            position: Poziția certificatului în stocare
+        """
+        if op == DataManager.CHANGE_RESET:
+            self._load_data()
+            return
+        
+        # Măștile filtrelor sunt recalculate pe stocarea modificată
+        self.filters.refresh()
+        mask = self.filters.mask
+        if op == DataManager.CHANGE_ADD:
+            self.table.insert_certificate(position, mask)
+        elif op == DataManager.CHANGE_UPDATE:
+            self.table.update_certificate(position, mask)
+        elif op == DataManager.CHANGE_DELETE:
+            self.table.remove_certificate(position, mask)
+        self._update_status_bar()
     
     def _update_status_bar(self):
         """Actualizează bara de status"""
-        total = self.table.rowCount()
-        visible = sum(1 for row in range(total) if not self.table.isRowHidden(row))
+        total = self.table.total_count()
+        visible = self.filters.visible_count
         
         file_path = str(self.data_manager.file_path)
         
+        # Rândurile din fișier care nu au putut fi încărcate
+        rejected = self._rejected_count
+        rejected_text = f" | Rânduri invalide: {rejected}" if rejected else ""
+        
         self.status_bar.showMessage(
-            f"Total înregistrări: {total} | Afișate: {visible} | Fișier: {file_path}"
+            f"Total înregistrări: {total} | Afișate: {visible}{rejected_text} | Fișier: {file_path}"
         )
     
     def _on_filter_changed(self, text: str):
-        """Handler pentru schimbarea filtrului de căutare"""
-        self.table.apply_filter(text)
-        self._update_status_bar()
+        """Handler pentru schimbarea filtrului de căutare (aplicat după FILTER_DEBOUNCE_MS)"""
+        self.filter_timer.start()
     
     def _on_expiration_filter_changed(self, index: int):
         """Handler pentru schimbarea filtrului de expirare"""
-        # Mapare index la luni
-        months_map = {
-            0: 0,    # Toate
-            1: -1,   # Expirate
-            2: 1,    # 1 lună
-            3: 3,    # 3 luni
-            4: 6,    # 6 luni
-            5: 12    # 12 luni
-        }
+        self._show_filter_change(self.filters.set_expiry(self.EXPIRATION_MONTHS.get(index, 0)))
+    
+    def _on_grade_filter_changed(self, index: int):
+        """Handler pentru schimbarea filtrului de grad (0 = toate)"""
+        self._show_filter_change(self.filters.set_grades([index - 1] if index > 0 else None))
+    
+    def _on_level_filter_changed(self, index: int):
+        """Handler pentru schimbarea filtrului de nivel (0 = toate)"""
+        self._show_filter_change(self.filters.set_levels([index - 1] if index > 0 else None))
+    
+    def _apply_text_filter(self):
+        """Aplică textul de căutare (la expirarea temporizatorului de tastare)"""
+        self.filter_timer.stop()
+        self._show_filter_change(self.filters.set_text(self.filter_edit.text()))
+    
+    def _apply_filters(self):
+        """
+        Aplică toate filtrele, cu valorile din controale
+        
+        Filtrele sunt măști pe coloanele stocării, combinate în FilterEngine,
+        astfel încât niciunul nu îl anulează pe celălalt. O filtrare de
+        căutare încă în așteptare este anulată, fiind inclusă aici.
+        """
+        self.filter_timer.stop()
+        grade = self.grade_combo.currentIndex()
+        level = self.level_combo.currentIndex()
+        self.filters.set_text(self.filter_edit.text())
+        self.filters.set_expiry(self.EXPIRATION_MONTHS.get(self.expiration_combo.currentIndex(), 0))
+        self.filters.set_grades([grade - 1] if grade > 0 else None)
+        self.filters.set_levels([level - 1] if level > 0 else None)
+        self.table.apply_row_mask(self.filters.mask)
+        self._update_status_bar()
+    
+    def _show_filter_change(self, changed):
+        """
+        Aplică în tabel rezultatul unei schimbări de filtru
         
-        months = months_map.get(index, 0)
-        self.table.apply_expiration_filter(months)
+        Args:
+            changed: Pozițiile a căror vizibilitate s-a schimbat
+        """
+        self.table.apply_row_mask(self.filters.mask, changed)
         self._update_status_bar()
     
     def _clear_filter(self):
         """Șterge toate filtrele"""
+        self.filter_timer.stop()
+        # Controalele sunt resetate fără a declanșa câte o filtrare fiecare
+        for widget in (self.filter_edit, self.expiration_combo, self.grade_combo, self.level_combo):
+            widget.blockSignals(True)
         self.filter_edit.clear()
         self.expiration_combo.setCurrentIndex(0)
-        self.table.apply_filter("")
-        self.table.apply_expiration_filter(0)
-        self._update_status_bar()
+        self.grade_combo.setCurrentIndex(0)
+        self.level_combo.setCurrentIndex(0)
+        for widget in (self.filter_edit, self.expiration_combo, self.grade_combo, self.level_combo):
+            widget.blockSignals(False)
+        self._show_filter_change(self.filters.clear())
     
     def _on_add_certificate(self):
         """Handler pentru adăugarea unui certificat"""
-        dialog = CertificateDialog(self)
+        dialog = CertificateDialog(
+            self,
+            duplicate_check=lambda serie, numar:
+                self.data_manager.find_duplicate(serie, numar) is not None
+        )
         
         if dialog.exec():
             certificate = dialog.get_certificate()
             try:
                 self.data_manager.add_certificate(certificate)
-                self._load_data()
                 QMessageBox.information(self, "Succes", "Certificat adăugat cu succes!")
             except Exception as e:
                 QMessageBox.critical(self, "Eroare", f"Eroare la adăugare: {str(e)}")
     
     def _on_edit_selected(self):
         """Handler pentru editarea certificatului selectat"""
-        selected_row = self.table.get_selected_row()
+        certificate_id = self.table.get_selected_id()
         
-        if selected_row == -1:
+        if certificate_id is None:
             QMessageBox.warning(self, "Atenție", "Selectați un certificat pentru editare!")
             return
         
-        self._on_edit_certificate(selected_row)
+        self._on_edit_certificate(certificate_id)
     
     def _on_table_double_clicked(self, index):
         """
@@ -241,31 +614,34 @@ class MainWindow(QMainWindow):
         Args:
             index: QModelIndex al celulei clickate
         """
-        if index.isValid():
-            self._on_edit_certificate(index.row())
+        # Editarea este disponibilă doar după încărcarea completă
+        if index.isValid() and self.data_manager.loaded and not self._loading:
+            certificate_id = self.table.get_row_id(index.row())
+            if certificate_id is not None:
+                self._on_edit_certificate(certificate_id)
     
-    def _on_edit_certificate(self, row: int):
+    def _on_edit_certificate(self, certificate_id: int):
         """
         Handler pentru editarea unui certificat
         
         Args:
-            row: Indexul rândului de editat
+            certificate_id: ID-ul certificatului de editat
         """
         try:
             # Obține certificatul curent
-            certificates = self.data_manager.get_all_certificates()
-            if row >= len(certificates):
-                return
-            
-            current_cert = certificates[row]
+            current_cert = self.data_manager.get_certificate(certificate_id)
             
             # Afișează dialogul de editare
-            dialog = CertificateDialog(self, current_cert)
+            dialog = CertificateDialog(
+                self,
+                current_cert,
+                duplicate_check=lambda serie, numar: self.data_manager.find_duplicate(
+                    serie, numar, exclude_id=certificate_id) is not None
+            )
             
             if dialog.exec():
                 updated_cert = dialog.get_certificate()
-                self.data_manager.update_certificate(row, updated_cert)
-                self._load_data()
+                self.data_manager.update_certificate(certificate_id, updated_cert)
                 QMessageBox.information(self, "Succes", "Certificat actualizat cu succes!")
                 
         except Exception as e:
@@ -273,9 +649,9 @@ class MainWindow(QMainWindow):
     
     def _on_delete_certificate(self):
         """Handler pentru ștergerea unui certificat"""
-        selected_row = self.table.get_selected_row()
+        certificate_id = self.table.get_selected_id()
         
-        if selected_row == -1:
+        if certificate_id is None:
             QMessageBox.warning(self, "Atenție", "Selectați un certificat pentru ștergere!")
             return
         
@@ -289,8 +665,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                self.data_manager.delete_certificate(selected_row)
-                self._load_data()
+                self.data_manager.delete_certificate(certificate_id)
                 QMessageBox.information(self, "Succes", "Certificat șters cu succes!")
             except Exception as e:
                 QMessageBox.critical(self, "Eroare", f"Eroare la ștergere: {str(e)}")
@@ -305,10 +680,88 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            success, message = self.data_manager.import_from_excel(file_path)
+            # Dialog de progres actualizat după fiecare bucată citită
+            progress = QProgressDialog("Import în curs...", "Anulare", 0, 0, self)
+            progress.setWindowTitle("Import")
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(500)
+            
+            def on_progress(processed: int, total) -> bool:
+                if total:
+                    progress.setMaximum(total)
+                    progress.setValue(min(processed, total))
+                progress.setLabelText(f"Import în curs... {processed} rânduri procesate")
+                QApplication.processEvents()
+                return not progress.wasCanceled()
+            
+            def on_conflict(duplicates: int):
+                progress.hide()
+                return self._ask_conflict_mode(duplicates)
+            
+            success, message = self.data_manager.import_from_excel(file_path, on_progress, on_conflict)
+            progress.close()
             
             if success:
-                self._load_data()
+                # Tabelul a fost reîncărcat prin notificarea DataManager
+                QMessageBox.information(self, "Succes", message)
+            elif self.data_manager.import_errors:
+                reply = QMessageBox.critical(
+                    self,
+                    "Eroare",
+                    message + "\n\nDoriți să salvați raportul complet al erorilor?",
+                    QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Close
+                )
+                if reply == QMessageBox.StandardButton.Save:
+                    self._on_save_import_errors()
+            else:
+                QMessageBox.critical(self, "Eroare", message)
+    
+    def _ask_conflict_mode(self, duplicates: int):
+        """
+        Întreabă utilizatorul cum se tratează certificatele duplicate la import
+        
+        Args:
+            duplicates: Numărul de certificate cu serie și număr deja existente
+            
+        Returns:
+            Modul de rezolvare (DataManager.CONFLICT_*) sau None pentru anulare
+        """
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle("Certificate duplicate")
+        box.setText(f"{duplicates} certificate au seria și numărul unor certificate existente.")
+        box.setInformativeText(
+            "Ignorare: se păstrează certificatele existente\n"
+            "Suprascriere: se înlocuiesc cu cele importate\n"
+            "Combinare: datele importate, cu observațiile ambelor certificate"
+        )
+        skip_btn = box.addButton("Ignorare", QMessageBox.ButtonRole.AcceptRole)
+        overwrite_btn = box.addButton("Suprascriere", QMessageBox.ButtonRole.AcceptRole)
+        merge_btn = box.addButton("Combinare", QMessageBox.ButtonRole.AcceptRole)
+        box.addButton("Anulare", QMessageBox.ButtonRole.RejectRole)
+        box.setDefaultButton(skip_btn)
+        box.exec()
+        
+        modes = {
+            skip_btn: DataManager.CONFLICT_SKIP,
+            overwrite_btn: DataManager.CONFLICT_OVERWRITE,
+            merge_btn: DataManager.CONFLICT_MERGE,
+        }
+        return modes.get(box.clickedButton())
+    
+    def _on_save_import_errors(self):
+        """Salvează raportul complet al erorilor ultimului import"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Salvați raportul de erori",
+            "erori_import.csv",
+            "CSV (*.csv);;Excel Files (*.xlsx)"
+        )
+        
+        if file_path:
+            success, message = self.data_manager.export_import_errors(file_path)
+        
+            if success:
                 QMessageBox.information(self, "Succes", message)
             else:
                 QMessageBox.critical(self, "Eroare", message)
@@ -319,7 +772,7 @@ class MainWindow(QMainWindow):
         
         # Generează numele fișierului: AAAALLZZ_N_xx-CertificateSecuritate.xlsx
         today = datetime.now()
-        num_records = len(self.data_manager.get_all_certificates())
+        num_records = len(self.data_manager.get_store())
         default_filename = f"{today.strftime('%Y%m%d')}_N_{num_records:02d}-CertificateSecuritate.xlsx"
         
         file_path, _ = QFileDialog.getSaveFileName(
@@ -343,7 +796,7 @@ class MainWindow(QMainWindow):
             self,
             "Selectați noul fișier sursă",
             "",
-            "Excel Files (*.xlsx)"
+            "Excel Files (*.xlsx);;SQLite Database (*.db *.sqlite)"
         )
         
         if file_path:
@@ -351,10 +804,9 @@ class MainWindow(QMainWindow):
                 self.data_manager.change_data_source(file_path)
                 
                 # Salvează noua cale în configurație
-                config_manager = ConfigManager()
-                config_manager.set_data_file_path(file_path)
+                self.config_manager.set_data_file_path(file_path)
                 
-                self._load_data()
+                # Tabelul a fost reîncărcat prin notificarea DataManager
                 QMessageBox.information(
                     self,
                     "Succes",
@@ -0,0 +1,83 @@
+"""
+Paleta comună a tabelelor: pensule, fonturi și prototipuri de celule create o
+singură dată, indexate după statusul de expirare
+"""
+from functools import lru_cache
+from typing import Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor, QFont
+from PyQt6.QtWidgets import QTableWidgetItem
+
+from models.certificate import STATUS_COLORS
+
+
+# Culoarea celulei Data expirare din tabelul principal (indexată după STATUS_*):
+# expirat - roșu, sub 3 luni - galben, altfel alb
+EXPIRY_CELL_COLORS = ((255, 0, 0), (255, 255, 0), (255, 255, 0), (255, 255, 255))
+
+
+class CellPalette:
+    """
+    Pensulele și fonturile folosite la desenarea tabelelor
+    
+    Obiectele Qt sunt create o singură dată și partajate de toate celulele;
+    modelul și dialogurile întorc/copiază aceste instanțe în loc să creeze
+    câte un QColor/QBrush/QFont pe celulă. Nu trebuie modificate.
+    """
+    
+    def __init__(self):
+        """Creează pensulele, fonturile și prototipurile de celule"""
+        self.white = QBrush(QColor(255, 255, 255))
+        self.black = QBrush(QColor(0, 0, 0))
+        # Culoarea rândului pentru fiecare status (STATUS_COLORS)
+        self.status: Tuple[QBrush, ...] = tuple(QBrush(QColor(color)) for color in STATUS_COLORS)
+        # Culoarea celulei Data expirare pentru fiecare status (EXPIRY_CELL_COLORS)
+        self.expiry_cell: Tuple[QBrush, ...] = tuple(QBrush(QColor(*rgb))
+                                                     for rgb in EXPIRY_CELL_COLORS)
+        self.bold = QFont()
+        self.bold.setBold(True)
+        
+        # Prototipurile celulelor needitabile colorate după status (normal și îngroșat)
+        self._items = tuple(self._make_item(brush, None) for brush in self.status)
+        self._bold_items = tuple(self._make_item(brush, self.bold) for brush in self.status)
+    
+    @staticmethod
+    def _make_item(background: QBrush, font) -> QTableWidgetItem:
+        """Creează prototipul unei celule needitabile"""
+        item = QTableWidgetItem()
+        item.setBackground(background)
+        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        if font is not None:
+            item.setFont(font)
+        return item
+    
+    def status_item(self, status: int, text: str, bold: bool = False) -> QTableWidgetItem:
+        """
+        Creează o celulă QTableWidget colorată după status
+        
+        Celula este o copie a prototipului statusului (fundal, font și
+        flaguri deja setate), deci nu sunt create pensule sau fonturi noi.
+        
+        Args:
+            status: Statusul de expirare (STATUS_*)
+            text: Textul celulei
+            bold: True pentru text îngroșat
+            
+        Returns:
+            Celula nouă
+        """
+        item = (self._bold_items if bold else self._items)[status].clone()
+        item.setText(text)
+        return item
+
+
+@lru_cache(maxsize=None)
+def shared_palette() -> CellPalette:
+    """
+    Returnează paleta comună (creată la primul apel, după QApplication)
+    
+    Returns:
+        Paleta
+    """
+    return CellPalette()
@@ -0,0 +1,545 @@
+"""
+Modelul tabelului de certificate (model/view Qt peste stocarea pe coloane)
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from models.certificate import COLUMN_NAMES
+from models.certificate_store import CertificateStore, DISPLAY_FIELDS
+from views.palette import shared_palette
+
+
+# Rolul în care este furnizat ID-ul certificatului
+ID_ROLE = Qt.ItemDataRole.UserRole + 1
+
+NR_COLUMN = COLUMN_NAMES.index('Nr.')
+EXPIRY_COLUMN = COLUMN_NAMES.index('Data expirare')
+
+# O cheie a sortării: (coloană, ordine)
+SortColumn = Tuple[int, Qt.SortOrder]
+
+
+class _Descending:
+    """Inversează comparația unei valori (cheie descrescătoare într-un tuplu)"""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        """Învelește valoarea comparată"""
+        self.value = value
+    
+    def __eq__(self, other) -> bool:
+        """Egalitatea nu se schimbă"""
+        return self.value == other.value
+    
+    def __lt__(self, other) -> bool:
+        """Mai mic înseamnă valoare mai mare"""
+        return other.value < self.value
+    
+    def __gt__(self, other) -> bool:
+        """Mai mare înseamnă valoare mai mică"""
+        return other.value > self.value
+
+
+class CertificateTableModel(QAbstractTableModel):
+    """
+    Model Qt care citește certificatele direct din CertificateStore
+    
+    Nu sunt create obiecte pe celulă: data() este apelată de Qt doar pentru
+    celulele vizibile și întoarce textele precalculate ale stocării. Ordinea
+    rândurilor este o permutare a pozițiilor din stocare, calculată vectorizat
+    la sortare. Filtrarea se face tot aici, cu o mască pe pozițiile din
+    stocare, aplicată dintr-o dată (fără evaluarea Qt rând cu rând).
+    
+    Pentru ordinea sortată și pentru rândurile afișate se păstrează și
+    permutările inverse (poziție -> index), astfel încât rândul unei poziții
+    este găsit în O(1); o modificare a unui singur certificat actualizează
+    doar intrările rândurilor mutate.
+    """
+    
+    # Numărul maxim de rânduri afișate/ascunse unul câte unul la schimbarea
+    # filtrului; peste el, rândurile sunt recalculate într-o singură schimbare
+    INCREMENTAL_FILTER_LIMIT = 64
+    
+    def __init__(self, parent=None):
+        """Inițializează modelul (fără date)"""
+        super().__init__(parent)
+        self._store: Optional[CertificateStore] = None
+        # Toate pozițiile din stocare, în ordinea sortării, și inversa lor
+        # (poziția -> indexul în _sorted)
+        self._sorted = np.empty(0, dtype=np.int64)
+        self._ranks = np.empty(0, dtype=np.int64)
+        # Masca filtrului pe pozițiile din stocare (None = toate)
+        self._mask: Optional[np.ndarray] = None
+        # Rândul afișat -> poziția în stocare (pozițiile din _sorted acceptate
+        # de mască) și inversa (poziția -> rândul afișat, -1 = ascunsă)
+        self._order = np.empty(0, dtype=np.int64)
+        self._rows = np.empty(0, dtype=np.int64)
+        # Cheile sortării, în ordinea priorității (goală = ordinea din stocare)
+        self._sort_columns: List[SortColumn] = []
+        
+        # Pensule comune tuturor celulelor (views.palette)
+        self._palette = shared_palette()
+    
+    @property
+    def store(self) -> Optional[CertificateStore]:
+        """Stocarea afișată"""
+        return self._store
+    
+    def set_store(self, store: CertificateStore, mask: Optional[np.ndarray] = None):
+        """
+        Înlocuiește datele afișate
+        
+        Args:
+            store: Stocarea certificatelor
+            mask: Masca filtrului (None = toate rândurile)
+        """
+        self.beginResetModel()
+        self._store = store
+        self._mask = mask
+        self._set_sorted(self._sorted_order())
+        self._set_order(self._visible_order())
+        self.endResetModel()
+    
+    def set_mask(self, mask: Optional[np.ndarray], changed: Optional[np.ndarray] = None):
+        """
+        Afișează doar rândurile selectate de o mască
+        
+        Dacă se știe că doar câteva poziții și-au schimbat vizibilitatea, doar
+        rândurile lor sunt inserate sau eliminate. Altfel rândurile vizibile
+        sunt recalculate vectorizat și aplicate tabelului într-o singură
+        schimbare. Selecția este păstrată dacă rândul rămâne afișat.
+        
+        Args:
+            mask: Vector boolean pe pozițiile din stocare (None = toate)
+            changed: Pozițiile a căror vizibilitate s-a schimbat (None = necunoscut)
+        """
+        self._mask = mask
+        if changed is None or len(changed) > self.INCREMENTAL_FILTER_LIMIT:
+            self._change_layout()
+            return
+        for position in changed.tolist():
+            row = self._row_of(position)
+            if row >= 0 and not self._is_visible(position):
+                self._remove_row(row)
+            elif row < 0 and self._is_visible(position):
+                self._insert_row(position)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Numărul de rânduri"""
+        return 0 if parent.isValid() else len(self._order)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Numărul de coloane"""
+        return 0 if parent.isValid() else len(COLUMN_NAMES)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        """Antetul coloanelor"""
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(COLUMN_NAMES)):
+            return COLUMN_NAMES[section]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Celulele pot fi selectate, dar nu editate (doar prin dialog)"""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        Returnează valoarea unei celule pentru rolul cerut
+        
+        Args:
+            index: Celula
+            role: Rolul Qt (text, fundal, text color, ID)
+            
+        Returns:
+            Valoarea sau None
+        """
+        if not index.isValid():
+            return None
+        position = int(self._order[index.row()])
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Coloana Nr. este numerotarea în ordinea încărcării
+            if column == NR_COLUMN:
+                return str(position + 1)
+            return self._store.display_columns()[COLUMN_NAMES[column]][position]
+        
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # Culoare DOAR pe celula Data expirare, celelalte rămân albe
+            if column == EXPIRY_COLUMN:
+                return self._palette.expiry_cell[int(self._store.expiry().status[position])]
+            return self._palette.white
+        
+        if role == Qt.ItemDataRole.ForegroundRole and column == EXPIRY_COLUMN:
+            # Text negru pentru vizibilitate
+            return self._palette.black
+        
+        if role == ID_ROLE:
+            return int(self._store.ids[position])
+        
+        return None
+    
+    def total_count(self) -> int:
+        """Numărul total de certificate (inclusiv cele ascunse de filtru)"""
+        return len(self._sorted)
+    
+    def position_of_row(self, row: int) -> int:
+        """
+        Returnează poziția în stocare a unui rând al modelului
+        
+        Args:
+            row: Rândul modelului
+            
+        Returns:
+            Poziția în stocare
+        """
+        return int(self._order[row])
+    
+    def id_of_row(self, row: int) -> int:
+        """
+        Returnează ID-ul certificatului de pe un rând al modelului
+        
+        Args:
+            row: Rândul modelului
+            
+        Returns:
+            ID-ul certificatului
+        """
+        return int(self._store.ids[self._order[row]])
+    
+    def _is_visible(self, position: int) -> bool:
+        """Verifică dacă masca filtrului acceptă o poziție"""
+        return self._mask is None or bool(self._mask[position])
+    
+    def _row_of(self, position: int) -> int:
+        """Rândul afișat al unei poziții sau -1 dacă este ascunsă"""
+        return int(self._rows[position])
+    
+    @staticmethod
+    def _inverse(positions: np.ndarray, size: int) -> np.ndarray:
+        """Permutarea inversă: poziția -> indexul ei în positions (-1 = lipsește)"""
+        inverse = np.full(size, -1, dtype=np.int64)
+        inverse[positions] = np.arange(len(positions))
+        return inverse
+    
+    @staticmethod
+    def _insert(positions: np.ndarray, inverse: np.ndarray, index: int,
+                position: int) -> np.ndarray:
+        """
+        Inserează o poziție la un index și actualizează inversa doar pentru
+        pozițiile de după el
+        
+        Returns:
+            Noul vector de poziții
+        """
+        positions = np.insert(positions, index, position)
+        inverse[positions[index + 1:]] += 1
+        inverse[position] = index
+        return positions
+    
+    @staticmethod
+    def _delete(positions: np.ndarray, inverse: np.ndarray, index: int) -> np.ndarray:
+        """
+        Elimină poziția de la un index și actualizează inversa doar pentru
+        pozițiile de după el
+        
+        Returns:
+            Noul vector de poziții
+        """
+        inverse[positions[index]] = -1
+        positions = np.delete(positions, index)
+        inverse[positions[index:]] -= 1
+        return positions
+    
+    @staticmethod
+    def _move(others: np.ndarray, inverse: np.ndarray, old: int, new: int,
+              position: int) -> np.ndarray:
+        """
+        Mută o poziție de la indexul old la new
+        
+        Args:
+            others: Pozițiile fără cea mutată
+            inverse: Inversa, actualizată doar pe intervalul dintre old și new
+            old: Indexul vechi
+            new: Indexul nou, în others
+            position: Poziția mutată
+            
+        Returns:
+            Noul vector de poziții
+        """
+        positions = np.insert(others, new, position)
+        low, high = min(old, new), max(old, new) + 1
+        inverse[positions[low:high]] = np.arange(low, high)
+        return positions
+    
+    def _set_sorted(self, positions: np.ndarray):
+        """Înlocuiește ordinea sortată (inversa este recalculată)"""
+        self._sorted = positions
+        self._ranks = self._inverse(positions, len(positions))
+    
+    def _set_order(self, positions: np.ndarray):
+        """Înlocuiește rândurile afișate (inversa este recalculată)"""
+        self._order = positions
+        self._rows = self._inverse(positions, len(self._sorted))
+    
+    def _grow(self, size: int):
+        """Extinde inversele pentru pozițiile adăugate la sfârșitul stocării"""
+        missing = size - len(self._ranks)
+        if missing > 0:
+            self._ranks = np.concatenate([self._ranks, np.full(missing, -1, dtype=np.int64)])
+            self._rows = np.concatenate([self._rows, np.full(missing, -1, dtype=np.int64)])
+    
+    def insert_position(self, position: int, mask: Optional[np.ndarray] = None):
+        """
+        Afișează un certificat adăugat în stocare
+        
+        Rândul este inserat direct la locul său în sortarea curentă (căutare
+        binară), fără reîncărcarea modelului.
+        
+        Args:
+            position: Poziția noului certificat în stocare
+            mask: Masca filtrului, calculată după adăugare (None = toate)
+        """
+        self._mask = mask
+        self._grow(len(self._store))
+        self._sorted = self._insert(self._sorted, self._ranks,
+                                    self._insertion_index(self._sorted, position), position)
+        if self._is_visible(position):
+            self._insert_row(position)
+    
+    def append_positions(self, start: int, mask: Optional[np.ndarray] = None):
+        """
+        Afișează certificatele adăugate la sfârșitul stocării (de exemplu o
+        bucată nouă la încărcarea în fundal)
+        
+        Fără sortare, rândurile noi vizibile sunt adăugate la sfârșit într-o
+        singură inserare; cu sortare, ordinea este recalculată vectorizat și
+        aplicată într-o singură schimbare, cu selecția păstrată.
+        
+        Args:
+            start: Poziția primului certificat nou (cele de la start până la
+                sfârșitul stocării sunt noi)
+            mask: Masca filtrului, calculată după adăugare (None = toate)
+        """
+        self._mask = mask
+        if self._sort_columns:
+            self._set_sorted(self._sorted_order())
+            self._change_layout()
+            return
+        added = np.arange(start, len(self._store), dtype=np.int64)
+        self._grow(len(self._store))
+        self._ranks[added] = np.arange(len(self._sorted), len(self._sorted) + len(added))
+        self._sorted = np.concatenate([self._sorted, added])
+        if mask is not None:
+            added = added[mask[start:]]
+        if len(added):
+            row = len(self._order)
+            self.beginInsertRows(QModelIndex(), row, row + len(added) - 1)
+            self._rows[added] = np.arange(row, row + len(added))
+            self._order = np.concatenate([self._order, added])
+            self.endInsertRows()
+    
+    def update_position(self, position: int, mask: Optional[np.ndarray] = None):
+        """
+        Reîmprospătează un certificat modificat în stocare
+        
+        Dacă valoarea coloanei de sortare s-a schimbat, rândul este mutat la
+        noul loc; selecția îl urmează. Dacă filtrul nu îl mai acceptă, rândul
+        este ascuns (sau afișat, invers).
+        
+        Args:
+            position: Poziția certificatului în stocare
+            mask: Masca filtrului, calculată după modificare (None = toate)
+        """
+        self._mask = mask
+        if self._sort_columns:
+            rank = int(self._ranks[position])
+            others = np.delete(self._sorted, rank)
+            self._sorted = self._move(others, self._ranks, rank,
+                                      self._insertion_index(others, position), position)
+        
+        row = self._row_of(position)
+        if row < 0:
+            if self._is_visible(position):
+                self._insert_row(position)
+            return
+        if not self._is_visible(position):
+            self._remove_row(row)
+            return
+        
+        if self._sort_columns:
+            others = np.delete(self._order, row)
+            new_row = self._insertion_index(others, position)
+            # Destinația se numără în ordinea dinaintea mutării
+            destination = new_row if new_row < row else new_row + 1
+            if new_row != row and self.beginMoveRows(QModelIndex(), row, row,
+                                                     QModelIndex(), destination):
+                self._order = self._move(others, self._rows, row, new_row, position)
+                self.endMoveRows()
+                row = new_row
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMN_NAMES) - 1))
+    
+    def remove_position(self, position: int, mask: Optional[np.ndarray] = None):
+        """
+        Elimină rândul unui certificat șters din stocare
+        
+        Args:
+            position: Poziția pe care a avut-o certificatul în stocare
+            mask: Masca filtrului, calculată după ștergere (None = toate)
+        """
+        row = self._row_of(position)
+        if row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._order = self._delete(self._order, self._rows, row)
+        self._sorted = self._delete(self._sorted, self._ranks, int(self._ranks[position]))
+        # Pozițiile de după cea ștearsă au scăzut cu unu în stocare
+        self._sorted[self._sorted > position] -= 1
+        self._order[self._order > position] -= 1
+        self._ranks = np.delete(self._ranks, position)
+        self._rows = np.delete(self._rows, position)
+        self._mask = mask
+        if row >= 0:
+            self.endRemoveRows()
+    
+    def _insert_row(self, position: int):
+        """Inserează rândul unei poziții vizibile la locul său în sortare"""
+        row = self._insertion_index(self._order, position)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._order = self._insert(self._order, self._rows, row, position)
+        self.endInsertRows()
+    
+    def _remove_row(self, row: int):
+        """Elimină un rând afișat (poziția rămâne în stocare, ascunsă)"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._order = self._delete(self._order, self._rows, row)
+        self.endRemoveRows()
+    
+    def _column_sort_key(self, column: int, position: int):
+        """Cheia de sortare a unei poziții pe o coloană (vezi _column_sort_keys)"""
+        if column == NR_COLUMN:
+            return position
+        return self._store.sort_key(DISPLAY_FIELDS[COLUMN_NAMES[column]], position)
+    
+    def _sort_key(self, position: int) -> tuple:
+        """
+        Cheia de sortare completă a unei poziții
+        
+        Tuplul cheilor coloanelor de sortare (inversate pentru ordinea
+        descrescătoare), terminat cu poziția: la chei egale rândurile rămân
+        în ordinea din stocare, ca în sortarea stabilă din _sorted_order.
+        """
+        key = []
+        for column, order in self._sort_columns:
+            value = self._column_sort_key(column, position)
+            key.append(_Descending(value) if order == Qt.SortOrder.DescendingOrder else value)
+        key.append(position)
+        return tuple(key)
+    
+    def _insertion_index(self, positions: np.ndarray, position: int) -> int:
+        """Indexul la care trebuie inserată o poziție într-un vector sortat"""
+        if not self._sort_columns:
+            # Fără sortare: ordinea pozițiilor din stocare
+            return int(np.searchsorted(positions, position))
+        key = self._sort_key(position)
+        low, high = 0, len(positions)
+        while low < high:
+            middle = (low + high) // 2
+            if self._sort_key(int(positions[middle])) > key:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+    
+    def _column_sort_keys(self, column: int) -> np.ndarray:
+        """
+        Cheile de sortare tipizate ale unei coloane, pe pozițiile din stocare
+        
+        Nr. este numărul rândului, iar celelalte coloane folosesc cheile
+        întregi ale stocării (date ordinale, rangul gradului și nivelului în
+        nomenclator, rangul alfabetic al textelor).
+        """
+        if column == NR_COLUMN:
+            return np.arange(len(self._store))
+        return self._store.sort_keys(DISPLAY_FIELDS[COLUMN_NAMES[column]])
+    
+    def _sorted_order(self) -> np.ndarray:
+        """Calculează ordinea tuturor pozițiilor după sortarea curentă"""
+        if self._store is None:
+            return np.empty(0, dtype=np.int64)
+        if not self._sort_columns:
+            return np.arange(len(self._store), dtype=np.int64)
+        # lexsort sortează stabil după ultima cheie întâi
+        keys = []
+        for column, order in reversed(self._sort_columns):
+            column_keys = self._column_sort_keys(column).astype(np.int64)
+            keys.append(-column_keys if order == Qt.SortOrder.DescendingOrder else column_keys)
+        return np.lexsort(keys).astype(np.int64)
+    
+    def _visible_order(self) -> np.ndarray:
+        """Pozițiile sortate acceptate de mască (vectorizat, o copie)"""
+        if self._mask is None:
+            return self._sorted.copy()
+        return self._sorted[self._mask[self._sorted]]
+    
+    def _change_layout(self):
+        """
+        Recalculează rândurile afișate într-o singură schimbare de aranjare
+        
+        Indecșii persistenți (selecția, rândul curent) sunt mutați pe noile
+        rânduri; cei ai rândurilor ascunse devin invalizi.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_order = self._order
+        self._set_order(self._visible_order())
+        
+        old_indexes = self.persistentIndexList()
+        if old_indexes:
+            new_indexes = []
+            for index in old_indexes:
+                row = self._row_of(int(old_order[index.row()]))
+                new_indexes.append(QModelIndex() if row < 0
+                                   else self.index(row, index.column()))
+            self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def sort_columns(self) -> List[SortColumn]:
+        """Cheile sortării curente (coloană, ordine), în ordinea priorității"""
+        return list(self._sort_columns)
+    
+    def set_sort_columns(self, columns: List[SortColumn]):
+        """
+        Sortează rândurile după mai multe coloane (de exemplu expirare, apoi
+        grad, apoi nume)
+        
+        Sortarea este vectorizată (lexsort pe cheile tipizate) și stabilă, se
+        păstrează la reîncărcarea datelor, iar selecția rămâne pe aceleași
+        certificate.
+        
+        Args:
+            columns: Lista (coloană, ordine), prima fiind cheia principală;
+                goală pentru ordinea din stocare
+        """
+        self._sort_columns = [(column, order) for column, order in columns
+                              if 0 <= column < len(COLUMN_NAMES)]
+        self._set_sorted(self._sorted_order())
+        self._change_layout()
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """
+        Sortează rândurile după o coloană (vectorizat, fără comparații Qt)
+        
+        Selecția este păstrată: indecșii persistenți sunt mutați pe noile rânduri.
+        
+        Args:
+            column: Coloana de sortare (-1 = ordinea din stocare)
+            order: Ordinea crescătoare sau descrescătoare
+        """
+        self.set_sort_columns([(column, order)] if 0 <= column < len(COLUMN_NAMES) else [])
@@ -1,27 +1,47 @@
 """
 Tabel personalizat pentru afișarea certificatelor
 """
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QMenu
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QBrush
-from models.certificate import Certificate, COLUMN_NAMES
+from typing import Dict, List, Optional
+import numpy as np
+from PyQt6.QtWidgets import QApplication, QTableView, QHeaderView, QMenu, QStyle
+from PyQt6.QtCore import Qt, pyqtSignal
+from models.certificate import COLUMN_NAMES
+from models.certificate_store import CertificateStore
+from views.table_model import CertificateTableModel, NR_COLUMN
 
 
-class CertificateTableView(QTableWidget):
-    """Tabel personalizat pentru afișarea certificatelor"""
+# Numărul maxim de rânduri măsurate la estimarea lățimii coloanelor
+COLUMN_WIDTH_SAMPLE = 200
+
+
+class CertificateTableView(QTableView):
+    """
+    Tabel personalizat pentru afișarea certificatelor
+    
+    Tabel model/view: CertificateTableModel citește celulele la cerere din
+    stocarea pe coloane și aplică sortarea și filtrele. Rândurile din
+    metodele publice (get_selected_row, get_row_id) sunt cele afișate, după
+    sortare și filtrare.
+    """
+    
+    # Emis când utilizatorul redimensionează o coloană (nume coloană -> lățime)
+    column_widths_changed = pyqtSignal(dict)
     
     def __init__(self, parent=None):
         """Inițializează tabelul"""
         super().__init__(parent)
+        self.table_model = CertificateTableModel(self)
+        self.setModel(self.table_model)
+        # Lățimile setate manual de utilizator (nume coloană -> lățime)
+        self._user_widths: Dict[str, int] = {}
+        # Ultimele lățimi estimate, cu cheia datelor din care au fost calculate
+        self._estimated_widths: Optional[tuple] = None
+        self._auto_sizing = False
         self._init_ui()
         self.visible_columns = list(range(len(COLUMN_NAMES)))
     
     def _init_ui(self):
         """Inițializează interfața tabelului"""
-        # Setează numărul de coloane
-        self.setColumnCount(len(COLUMN_NAMES))
-        self.setHorizontalHeaderLabels(COLUMN_NAMES)
-        
         # Configurare header
         header = self.horizontalHeader()
         # Resize manual Interactive - utilizatorul poate trage marginile
@@ -30,20 +50,66 @@ class CertificateTableView(QTableWidget):
         header.setStretchLastSection(True)
         header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         header.customContextMenuRequested.connect(self._show_column_menu)
+        header.sectionResized.connect(self._on_section_resized)
         
-        # Permite sortare
-        self.setSortingEnabled(True)
+        # Sortare la click pe antet, Shift+click adaugă o cheie secundară
+        # (fără sortare inițială, ordinea încărcării)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        header.sectionClicked.connect(self._on_header_clicked)
         
         # Configurare selecție
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         
         # Configurare aspect
         self.setAlternatingRowColors(True)
         self.verticalHeader().setVisible(False)
         
         # Editare dezactivată (doar prin dialog)
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+    
+    def _on_header_clicked(self, column: int):
+        """
+        Sortează după coloana apăsată
+        
+        Click simplu: sortare doar după coloană (al doilea click inversează
+        ordinea). Shift+click: coloana este adăugată ca cheie secundară a
+        sortării curente (sau ordinea ei este inversată, dacă este deja cheie).
+        """
+        ascending, descending = Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder
+        columns = self.table_model.sort_columns()
+        orders = dict(columns)
+        if QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier and columns:
+            if column in orders:
+                toggled = descending if orders[column] == ascending else ascending
+                columns = [(key, toggled if key == column else order) for key, order in columns]
+            else:
+                columns.append((column, ascending))
+        elif len(columns) == 1 and column in orders:
+            columns = [(column, descending if orders[column] == ascending else ascending)]
+        else:
+            columns = [(column, ascending)]
+        self.set_sort_columns(columns)
+    
+    def set_sort_columns(self, columns: list):
+        """
+        Sortează tabelul după mai multe coloane
+        
+        Args:
+            columns: Lista (index coloană, Qt.SortOrder), prima fiind cheia principală
+        """
+        header = self.horizontalHeader()
+        if columns:
+            header.setSortIndicator(*columns[0])
+        else:
+            header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table_model.set_sort_columns(columns)
+    
+    def sort_columns(self) -> list:
+        """Returnează sortarea curentă: lista (index coloană, Qt.SortOrder)"""
+        return self.table_model.sort_columns()
     
     def _show_column_menu(self, position):
         """Afișează meniul pentru ascundere/afișare coloane"""
@@ -65,90 +131,128 @@ class CertificateTableView(QTableWidget):
             elif not action.isChecked() and col_idx in self.visible_columns:
                 self.visible_columns.remove(col_idx)
     
-    def load_certificates(self, certificates: list[Certificate]):
+    def load_store(self, store: CertificateStore):
         """
-        Încarcă lista de certificate în tabel
+        Încarcă în tabel certificatele din stocarea pe coloane
+        
+        Nu sunt create obiecte pe celulă; modelul citește doar celulele
+        vizibile, la cerere. Filtrul activ este resetat.
         
         Args:
-            certificates: Lista de certificate
+            store: Stocarea certificatelor
         """
-        self.setSortingEnabled(False)
-        self.setRowCount(0)
+        self.table_model.set_store(store)
+        # Lățime inițială estimată din conținut (apoi manual)
+        self.update_column_widths()
+    
+    def update_column_widths(self):
+        """Reestimează lățimile coloanelor pentru conținutul curent (nu și pe cele manuale)"""
+        store = self.table_model.store
+        if store is not None:
+            self._apply_column_widths(self._column_widths(store))
+    
+    def _column_widths(self, store: CertificateStore) -> List[int]:
+        """
+        Calculează lățimile coloanelor pentru conținutul stocării
         
-        for cert in certificates:
-            self._add_certificate_row(cert)
+        Rezultatul este refolosit la reîncărcări cât timp cele mai lungi texte
+        ale coloanelor (și fontul) nu se schimbă.
         
-        self.setSortingEnabled(True)
-        # Resize inițial la conținut (apoi manual)
-        self.resizeColumnsToContents()
+        Args:
+            store: Stocarea certificatelor
+            
+        Returns:
+            Lățimile, în ordinea coloanelor
+        """
+        key = (str(len(store)), tuple(store.longest_texts().values()), self.font().key())
+        if self._estimated_widths is None or self._estimated_widths[0] != key:
+            self._estimated_widths = (key, self._estimate_column_widths(store))
+        return self._estimated_widths[1]
     
-    def _add_certificate_row(self, certificate: Certificate):
+    def _estimate_column_widths(self, store: CertificateStore) -> List[int]:
         """
-        Adaugă un rând nou cu un certificat
+        Estimează lățimile coloanelor fără a măsura toate celulele
+        
+        Sunt măsurate textele unui eșantion de cel mult COLUMN_WIDTH_SAMPLE
+        rânduri, plus cel mai lung text al fiecărei coloane (păstrat de
+        stocare), cu aceleași margini ca resizeColumnsToContents.
         
         Args:
-            certificate: Certificatul de adăugat
+            store: Stocarea certificatelor
+            
+        Returns:
+            Lățimile, în ordinea coloanelor
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        cert_dict = certificate.to_dict()
+        display = store.display_columns()
+        longest = store.longest_texts()
+        count = len(store)
+        sample = range(0, count, max(1, count // COLUMN_WIDTH_SAMPLE))
         
-        # Determină culoarea pentru celula Data expirare
-        zile = certificate.zile_pana_la_expirare()
-        if zile < 0:
-            # Expirat - roșu
-            expirare_color = QColor(255, 0, 0)  # Roșu
-        elif zile <= 90:  # Mai puțin de 3 luni
-            # Sub 3 luni - galben
-            expirare_color = QColor(255, 255, 0)  # Galben
-        else:
-            # Normal - alb
-            expirare_color = QColor(255, 255, 255)  # Alb
+        metrics = self.fontMetrics()
+        text_margin = self.style().pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, self) + 1
+        margin = 2 * text_margin + (1 if self.showGrid() else 0)
+        header = self.horizontalHeader()
         
-        for col_idx, col_name in enumerate(COLUMN_NAMES):
-            # Coloana Nr. este numerotare automată
-            if col_name == 'Nr.':
-                value = str(row + 1)
-            else:
-                value = cert_dict.get(col_name, '')
-            
-            item = QTableWidgetItem(str(value))
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Pentru coloane cu date, setează sortData pentru sortare corectă
-            if col_name in ['Data nașterii', 'Data eliberare', 'Data expirare']:
-                # Convertim DD.MM.YYYY în YYYYMMDD pentru sortare corectă
-                try:
-                    parts = str(value).split('.')
-                    if len(parts) == 3:
-                        sort_key = f"{parts[2]}{parts[1]}{parts[0]}"  # YYYYMMDD
-                        item.setData(Qt.ItemDataRole.UserRole, sort_key)
-                except:
-                    pass
-            
-            # Aplică culoare DOAR pe celula Data expirare
-            if col_name == 'Data expirare':
-                item.setBackground(QBrush(expirare_color))
-                # Text negru pentru vizibilitate
-                item.setForeground(QBrush(QColor(0, 0, 0)))
+        widths = []
+        for column, name in enumerate(COLUMN_NAMES):
+            if column == NR_COLUMN:
+                texts = {str(count)}
             else:
-                # Toate celelalte celule rămân albe
-                item.setBackground(QBrush(QColor(255, 255, 255)))
-            
-            self.setItem(row, col_idx, item)
+                values = display[name]
+                texts = {values[position] for position in sample}
+                texts.add(longest[name])
+            text_width = max((metrics.horizontalAdvance(text) for text in texts), default=0)
+            widths.append(max(text_width + margin, header.sectionSizeHint(column)))
+        return widths
+    
+    def _apply_column_widths(self, widths: List[int]):
+        """Aplică lățimile calculate; coloanele setate manual își păstrează lățimea"""
+        header = self.horizontalHeader()
+        self._auto_sizing = True
+        try:
+            for column, name in enumerate(COLUMN_NAMES):
+                header.resizeSection(column, self._user_widths.get(name, widths[column]))
+        finally:
+            self._auto_sizing = False
     
-    def get_selected_certificate_index(self) -> int:
+    def _on_section_resized(self, column: int, old_size: int, new_size: int):
+        """Reține lățimile schimbate de utilizator (nu cele automate)"""
+        header = self.horizontalHeader()
+        if self._auto_sizing or new_size == 0 or old_size == 0 or (
+                header.stretchLastSection() and column == len(COLUMN_NAMES) - 1):
+            # Coloane ascunse/reafișate sau ultima coloană, care se întinde
+            # singură odată cu fereastra
+            return
+        self._user_widths[COLUMN_NAMES[column]] = new_size
+        self.column_widths_changed.emit(dict(self._user_widths))
+    
+    def user_column_widths(self) -> Dict[str, int]:
+        """Returnează lățimile setate manual de utilizator (nume coloană -> lățime)"""
+        return dict(self._user_widths)
+    
+    def set_user_column_widths(self, widths: Dict[str, int]):
         """
-        Returnează indexul certificatului selectat
+        Setează lățimile coloanelor alese de utilizator (de exemplu din configurație)
         
-        Returns:
-            Index-ul rândului selectat sau -1 dacă nu e nimic selectat
+        Args:
+            widths: Dicționar nume coloană -> lățime; coloanele necunoscute sunt ignorate
         """
-        selected = self.selectedItems()
-        if selected:
-            return selected[0].row()
-        return -1
+        self._user_widths = {name: width for name, width in widths.items()
+                             if name in COLUMN_NAMES and isinstance(width, int) and width > 0}
+        self._auto_sizing = True
+        try:
+            for name, width in self._user_widths.items():
+                self.horizontalHeader().resizeSection(COLUMN_NAMES.index(name), width)
+        finally:
+            self._auto_sizing = False
+    
+    def total_count(self) -> int:
+        """Numărul total de certificate încărcate"""
+        return self.table_model.total_count()
+    
+    def visible_count(self) -> int:
+        """Numărul de certificate afișate după filtrare"""
+        return self.table_model.rowCount()
     
     def get_selected_row(self) -> int:
         """
@@ -157,102 +261,94 @@ class CertificateTableView(QTableWidget):
         Returns:
             Index-ul rândului selectat sau -1 dacă nu e nimic selectat
         """
-        selected = self.selectedItems()
+        selected = self.selectionModel().selectedRows()
         if selected:
             return selected[0].row()
         return -1
     
-    def refresh_row(self, row: int, certificate: Certificate):
+    def get_row_id(self, row: int) -> Optional[int]:
         """
-        Reîmprospătează un rând cu date noi
+        Returnează ID-ul certificatului afișat pe un rând
         
         Args:
-            row: Indexul rândului
-            certificate: Noul certificat
-        """
-        if 0 <= row < self.rowCount():
-            cert_dict = certificate.to_dict()
-            
-            # Determină culoarea pentru celula Data expirare
-            zile = certificate.zile_pana_la_expirare()
-            if zile < 0:
-                expirare_color = QColor(255, 0, 0)  # Roșu
-            elif zile <= 90:  # Mai puțin de 3 luni
-                expirare_color = QColor(255, 255, 0)  # Galben
-            else:
-                expirare_color = QColor(255, 255, 255)  # Alb
+            row: Indexul rândului din tabel
             
-            for col_idx, col_name in enumerate(COLUMN_NAMES):
-                value = cert_dict.get(col_name, '')
-                item = self.item(row, col_idx)
-                if item:
-                    item.setText(str(value))
-                    
-                    # Aplică culoare DOAR pe celula Data expirare
-                    if col_name == 'Data expirare':
-                        item.setBackground(QBrush(expirare_color))
-                        item.setForeground(QBrush(QColor(0, 0, 0)))
-                    else:
-                        item.setBackground(QBrush(QColor(255, 255, 255)))
+        Returns:
+            ID-ul certificatului sau None
+        """
+        if not 0 <= row < self.table_model.rowCount():
+            return None
+        return self.table_model.id_of_row(row)
+    
+    def get_selected_id(self) -> Optional[int]:
+        """
+        Returnează ID-ul certificatului selectat
+        
+        Returns:
+            ID-ul certificatului selectat sau None dacă nu e nimic selectat
+        """
+        row = self.get_selected_row()
+        return self.get_row_id(row) if row != -1 else None
     
-    def apply_filter(self, filter_text: str):
+    def apply_row_mask(self, mask: Optional[np.ndarray], changed: Optional[np.ndarray] = None):
         """
-        Aplică un filtru pe toate coloanele
+        Afișează doar rândurile selectate de o mască din stocare
+        
+        Masca este pe pozițiile din stocare, deci rămâne corectă și după
+        sortarea tabelului. Dacă sunt date pozițiile schimbate (vezi
+        FilterEngine), doar rândurile lor sunt actualizate.
         
         Args:
-            filter_text: Textul de căutat
+            mask: Vector boolean pe pozițiile din stocare (None = toate)
+            changed: Pozițiile a căror vizibilitate s-a schimbat (None = necunoscut)
+        """
+        self.table_model.set_mask(mask, changed)
+    
+    def insert_certificate(self, position: int, mask: Optional[np.ndarray] = None):
         """
-        filter_text = filter_text.lower()
+        Afișează un certificat adăugat, fără reîncărcarea tabelului
         
-        for row in range(self.rowCount()):
-            match = False
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item and filter_text in item.text().lower():
-                    match = True
-                    break
-            
-            self.setRowHidden(row, not match)
+        Sortarea, filtrul, selecția și derularea sunt păstrate.
+        
+        Args:
+            position: Poziția noului certificat în stocare
+            mask: Masca filtrului activ, calculată după modificare (None = toate)
+        """
+        self.table_model.insert_position(position, mask)
     
-    def apply_expiration_filter(self, months: int):
+    def append_certificates(self, start: int, mask: Optional[np.ndarray] = None):
         """
-        Aplică filtru bazat pe numărul de luni până la expirare
+        Afișează certificatele adăugate la sfârșitul stocării (încărcare pe bucăți)
+        
+        Lățimile coloanelor sunt estimate la prima bucată cu rânduri.
         
         Args:
-            months: Numărul de luni (0 = toate, -1 = expirate, altfel = expiră în X luni)
+            start: Poziția primului certificat nou în stocare
+            mask: Masca filtrului activ, calculată după adăugare (None = toate)
         """
-        if months == 0:
-            # Afișează toate
-            for row in range(self.rowCount()):
-                self.setRowHidden(row, False)
-            return
+        self.table_model.append_positions(start, mask)
+        if start == 0 and self.table_model.total_count():
+            self.update_column_widths()
+    
+    def update_certificate(self, position: int, mask: Optional[np.ndarray] = None):
+        """
+        Reîmprospătează un certificat modificat, fără reîncărcarea tabelului
         
-        # Găsește indexul coloanei Data expirare
-        expirare_col = COLUMN_NAMES.index('Data expirare')
+        Args:
+            position: Poziția certificatului în stocare
+            mask: Masca filtrului activ, calculată după modificare (None = toate)
+        """
+        self.table_model.update_position(position, mask)
+    
+    def remove_certificate(self, position: int, mask: Optional[np.ndarray] = None):
+        """
+        Elimină rândul unui certificat șters, fără reîncărcarea tabelului
         
-        for row in range(self.rowCount()):
-            item = self.item(row, expirare_col)
-            if not item:
-                continue
-            
-            # Parsează data
-            from datetime import datetime
-            try:
-                data_expirare = datetime.strptime(item.text(), '%d.%m.%Y')
-                zile = (data_expirare - datetime.now()).days
-                
-                if months == -1:
-                    # Doar expirate
-                    show = zile < 0
-                else:
-                    # Expiră în X luni
-                    zile_max = months * 30
-                    show = 0 <= zile <= zile_max
-                
-                self.setRowHidden(row, not show)
-            except:
-                # Dacă nu putem parsa data, ascundem rândul
-                self.setRowHidden(row, True)
+        Args:
+            position: Poziția pe care a avut-o certificatul în stocare
+            mask: Masca filtrului activ, calculată după modificare (None = toate)
+        """
+        self.table_model.remove_position(position, mask)
     
     def get_visible_columns(self) -> list:
         """